@@ -9,6 +9,7 @@ from autoastro.galaxy.galaxy import Galaxy, HyperGalaxy, Redshift
 from autoastro.galaxy.galaxy_data import GalaxyData as galaxy_data
 from autoastro.galaxy import masked
 from autoastro.galaxy.fit_galaxy import GalaxyFit as fit_galaxy
+from autoastro.galaxy.fit_galaxy import GalaxyDatasetFit as fit_galaxy_dataset
 from autoastro.galaxy.galaxy_model import GalaxyModel
 from autoastro.hyper import hyper_data
 from autoastro import plot
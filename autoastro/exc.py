@@ -12,3 +12,7 @@ class PlottingException(Exception):
 
 class UnitsException(Exception):
     pass
+
+
+class ProfileException(Exception):
+    pass
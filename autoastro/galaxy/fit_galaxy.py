@@ -1,35 +1,167 @@
+import hashlib
+import numpy as np
+import os
+
 from autoarray.fit import fit
+from autoastro.profiles import geometry_profiles
+
+
+class GalaxyFitMemo:
+    def __init__(self, max_bytes=None, directory=None):
+        """A memo of the model data and likelihood of galaxy fits, keyed on the parameters of the model galaxies and \
+        the fingerprint of the galaxy data fitted, such that a fit which has been performed before (e.g. a proposal \
+        a sampler revisits or the maximum likelihood model fitted again after a search) is not recomputed.
+
+        Fits are held in a least recently used *GridCache* bounded by a number of bytes. If a directory is input, \
+        every fit is also saved to it as a .npz file and fits not held in memory are loaded from it, such that a \
+        search which is resumed in a new session reuses the fits of the previous session.
+
+        Parameters
+        ----------
+        max_bytes : int or None
+            The maximum number of bytes of model data held in memory, which defaults to *GridCache.max_bytes*.
+        directory : str or None
+            The directory fits are saved to and loaded from, or None if fits are only held in memory.
+        """
+        self.fits = geometry_profiles.GridCache(max_bytes=max_bytes)
+        self.directory = directory
+
+        if directory is not None:
+            os.makedirs(directory, exist_ok=True)
+
+    @staticmethod
+    def key_from_galaxy_data_and_galaxies(galaxy_data, galaxies):
+        """The key of the fit of galaxy data by a list of model galaxies, a hexadecimal digest of the fingerprint of \
+        the galaxy data and the *parameters_key* of every galaxy, or None if a galaxy has no *parameters_key*."""
+        galaxy_keys = tuple(galaxy.parameters_key for galaxy in galaxies)
+
+        if any(key is None for key in galaxy_keys):
+            return None
+
+        return hashlib.blake2b(
+            repr((galaxy_data.fingerprint, galaxy_keys)).encode(), digest_size=16
+        ).hexdigest()
+
+    def file_path_from_key(self, key):
+        return os.path.join(self.directory, "{}.npz".format(key))
+
+    def get(self, key, galaxy_data):
+        """Return the (model data, likelihood) of the fit stored at a key, or None if it is not stored in memory or \
+        in the directory."""
+        fit = self.fits.get(key=key)
+
+        if fit is not None or self.directory is None:
+            return fit
+
+        file_path = self.file_path_from_key(key=key)
+
+        if not os.path.isfile(file_path):
+            return None
+
+        with np.load(file_path) as arrays:
+            fit = (
+                galaxy_data.grid.mapping.array_stored_1d_from_array_1d(
+                    array_1d=arrays["model_data"]
+                ),
+                float(arrays["likelihood"]),
+            )
+
+        self.set(key=key, model_data=fit[0], likelihood=fit[1], save=False)
+
+        return fit
+
+    def set(self, key, model_data, likelihood, save=True):
+        """Store the model data and likelihood of a fit in memory and, if there is a directory, save it to a .npz \
+        file, which is written under a temporary name and then moved so a partly written file is never loaded."""
+        self.fits.set(
+            key=key,
+            result=(model_data, likelihood),
+            result_bytes=np.asarray(model_data).nbytes,
+        )
+
+        if save and self.directory is not None:
+
+            temporary_path = self.file_path_from_key(
+                key="{}.{}.tmp".format(key, os.getpid())
+            )
+
+            np.savez(
+                temporary_path,
+                model_data=np.asarray(model_data),
+                likelihood=likelihood,
+            )
+            os.replace(temporary_path, self.file_path_from_key(key=key))
 
 
 class GalaxyFit(fit.DatasetFit):
-    def __init__(self, galaxy_data, model_galaxies):
+
+    # The memo of the model data and likelihood of galaxy fits (see *GalaxyFitMemo*), which is shared by every fit and
+    # is None if fits are not memoized.
+
+    memo = None
+
+    def __init__(self, galaxy_data, model_galaxies, model_data=None):
         """Class which fits a set of galaxy-datas to a model galaxy, using either the galaxy's image, \
         surface-density or potential.
 
+        If *GalaxyFit.memo* is a *GalaxyFitMemo*, a fit of the same galaxy-datas by model galaxies with the same \
+        parameters as a previous fit takes its model data and likelihood from the memo.
+
         Parameters
         ----------
         galaxy_data : GalaxyData
             The galaxy-datas object being fitted.
         model_galaxies : aast.Galaxy
             The model galaxy used to fit the galaxy-datas.
+        model_data : ndarray or None
+            The model data of the fit if it has already been computed from the model galaxies (e.g. by a \
+            *GalaxyDatasetFit*), which is otherwise computed from them.
         """
 
         self.galaxy_data = galaxy_data
         self.model_galaxies = model_galaxies
 
-        model_data = galaxy_data.profile_quantity_from_galaxies(galaxies=model_galaxies)
+        key = None
+        memoized_fit = None
+
+        self.memoized_likelihood = None
+
+        if self.memo is not None and model_data is None:
+            key = self.memo.key_from_galaxy_data_and_galaxies(
+                galaxy_data=galaxy_data, galaxies=model_galaxies
+            )
+
+        if key is not None:
+            memoized_fit = self.memo.get(key=key, galaxy_data=galaxy_data)
+
+        if memoized_fit is not None:
+            model_data, self.memoized_likelihood = memoized_fit
+        elif model_data is None:
+            model_data = galaxy_data.profile_quantity_from_galaxies(
+                galaxies=model_galaxies
+            ).in_1d_binned
 
         super(GalaxyFit, self).__init__(
             data=galaxy_data.image,
             noise_map=galaxy_data.noise_map,
             mask=galaxy_data.mask,
-            model_data=model_data.in_1d_binned,
+            model_data=model_data,
         )
 
+        if key is not None and memoized_fit is None:
+            self.memo.set(key=key, model_data=model_data, likelihood=self.likelihood)
+
     @property
     def grid(self):
         return self.galaxy_data.grid
 
+    @property
+    def likelihood(self):
+        if self.memoized_likelihood is not None:
+            return self.memoized_likelihood
+
+        return super(GalaxyFit, self).likelihood
+
     def image(self):
         return self.data
 
@@ -39,3 +171,44 @@ class GalaxyFit(fit.DatasetFit):
     @property
     def figure_of_merit(self):
         return self.likelihood
+
+
+class GalaxyDatasetFit:
+    def __init__(self, galaxy_dataset, model_galaxies):
+        """Class which fits every galaxy-data of a masked galaxy dataset (e.g. the y and x deflection angles of a \
+        galaxy) to model galaxies, computing the model data of all of them from one evaluation of the galaxies.
+
+        The likelihood of the fit is the sum of the likelihoods of the fits of the galaxy-datas.
+
+        Parameters
+        ----------
+        galaxy_dataset : MaskedGalaxyDataset
+            The masked galaxy dataset being fitted.
+        model_galaxies : [aast.Galaxy]
+            The model galaxies used to fit the galaxy-datas.
+        """
+        self.galaxy_dataset = galaxy_dataset
+        self.model_galaxies = model_galaxies
+
+        model_datas = galaxy_dataset.profile_quantities_from_galaxies(
+            galaxies=model_galaxies
+        )
+
+        self.galaxy_fits = [
+            GalaxyFit(
+                galaxy_data=galaxy_data,
+                model_galaxies=model_galaxies,
+                model_data=model_data.in_1d_binned,
+            )
+            for galaxy_data, model_data in zip(
+                galaxy_dataset.masked_galaxy_datas, model_datas
+            )
+        ]
+
+    @property
+    def likelihood(self):
+        return sum(galaxy_fit.likelihood for galaxy_fit in self.galaxy_fits)
+
+    @property
+    def figure_of_merit(self):
+        return self.likelihood
@@ -11,6 +11,7 @@ from autoastro import lensing
 from autofit.tools import text_util
 from autoarray.structures import grids
 from autoarray.operators.inversion import pixelizations as pix
+from autoastro.profiles import geometry_profiles
 from autoastro.profiles import light_profiles as lp
 from autoastro.profiles import mass_profiles as mp
 from autoastro.profiles.mass_profiles import (
@@ -33,6 +34,16 @@ class Galaxy(ModelObject, lensing.LensingObject):
     @DynamicAttrs
     """
 
+    # Whether the image, convergence, potential and deflection angles of every profile are cached in
+    # *profile_results*, keyed on the parameters of the profile and the grid, such that a profile whose parameters are
+    # unchanged between galaxies (e.g. a fixed component of successive instances of a model) is not evaluated again.
+
+    cache_profile_results = False
+
+    # The cache of the results of the profiles of every galaxy, which is shared between galaxies.
+
+    profile_results = geometry_profiles.GridCache()
+
     def __init__(
         self,
         redshift,
@@ -147,6 +158,21 @@ class Galaxy(ModelObject, lensing.LensingObject):
     def mass_profile_phis(self):
         return [mass_profile.phi for mass_profile in self.mass_profiles]
 
+    @property
+    def parameters_key(self):
+        """A hashable key of the redshift of the galaxy and the name and *parameters_key* of every one of its \
+        profiles, or None if a profile has no *parameters_key*."""
+        profile_keys = tuple(
+            (name, value.parameters_key)
+            for name, value in sorted(self.__dict__.items(), key=lambda item: item[0])
+            if is_light_profile(value) or is_mass_profile(value)
+        )
+
+        if any(key is None for _, key in profile_keys):
+            return None
+
+        return (self.redshift, profile_keys)
+
     @property
     def uses_cluster_inversion(self):
         return type(self.pixelization) is pix.VoronoiBrightnessImage
@@ -331,7 +357,8 @@ class Galaxy(ModelObject, lensing.LensingObject):
         return self.__class__(**new_dict)
 
     @grids.convert_coordinates_to_grid
-    def profile_image_from_grid(self, grid):
+    @geometry_profiles.share_geometry
+    def profile_image_from_grid(self, grid, out=None):
         """Calculate the summed image of all of the galaxy's light profiles using a grid of Cartesian (y,x) \
         coordinates.
         
@@ -343,20 +370,76 @@ class Galaxy(ModelObject, lensing.LensingObject):
         ----------
         grid : ndarray
             The (y, x) coordinates in the original reference frame of the grid.
+        out : ndarray or None
+            A buffer of shape [total_sub_coordinates] the image is added into in place, such that the \
+            image of many galaxies is summed into one array. If None, a buffer of zeros is allocated.
 
         """
-        if self.has_light_profile:
-            profile_image = sum(
-                map(lambda p: p.profile_image_from_grid(grid=grid), self.light_profiles)
-            )
-            return grid.mapping.array_stored_1d_from_sub_array_1d(
-                sub_array_1d=profile_image
-            )
-        else:
-            return grid.mapping.array_stored_1d_from_sub_array_1d(
-                sub_array_1d=np.zeros((grid.sub_shape_1d,))
+        if out is None:
+            out = np.zeros((grid.sub_shape_1d,))
+
+        self.add_profile_values_into_out(
+            profiles=self.light_profiles,
+            func_name="profile_image_from_grid",
+            grid=grid,
+            out=out,
+        )
+
+        return grid.mapping.array_stored_1d_from_sub_array_1d(sub_array_1d=out)
+
+    def add_profile_values_into_out(self, profiles, func_name, grid, out):
+        """Add the values of a function of every profile on a grid (e.g. the convergence of every mass profile) \
+        into a buffer in place.
+
+        If *cache_profile_results* is True the values of every profile are taken from, or stored in, \
+        *profile_results*, keyed on the function, the parameters of the profile and a fingerprint of the grid, such \
+        that only profiles whose parameters have changed are evaluated.
+
+        Parameters
+        ----------
+        profiles : [GeometryProfile]
+            The profiles whose values are summed.
+        func_name : str
+            The name of the function of the profiles which computes their values (e.g. convergence_from_grid).
+        grid : ndarray
+            The (y, x) coordinates in the original reference frame of the grid.
+        out : ndarray
+            The buffer the values of the profiles are added into.
+        """
+        cache = self.cache_profile_results and geometry_profiles.GridCache.enabled
+
+        if cache and len(profiles) > 0:
+
+            # Values interpolated from a grid depend on the pixel scale of its interpolation grid.
+
+            interpolator = getattr(grid, "interpolator", None)
+
+            grid_key = (
+                type(grid).__name__,
+                self.profile_results.fingerprint_from_grid(grid=grid),
+                getattr(interpolator, "pixel_scale_interpolation_grid", None),
             )
 
+        for profile in profiles:
+
+            parameters_key = profile.parameters_key if cache else None
+
+            if parameters_key is None:
+                np.add(out, getattr(profile, func_name)(grid=grid), out=out)
+                continue
+
+            key = (func_name, parameters_key, grid_key)
+
+            values = self.profile_results.get(key=key)
+
+            if values is None:
+                values = getattr(profile, func_name)(grid=grid)
+                self.profile_results.set(key=key, result=values)
+
+            np.add(out, values, out=out)
+
+        return out
+
     def blurred_profile_image_from_grid_and_psf(self, grid, psf, blurring_grid=None):
 
         profile_image = self.profile_image_from_grid(grid=grid)
@@ -424,7 +507,8 @@ class Galaxy(ModelObject, lensing.LensingObject):
         return None
 
     @grids.convert_coordinates_to_grid
-    def convergence_from_grid(self, grid):
+    @geometry_profiles.share_geometry
+    def convergence_from_grid(self, grid, out=None):
         """Compute the summed convergence of the galaxy's mass profiles using a grid \
         of Cartesian (y,x) coordinates.
 
@@ -439,22 +523,26 @@ class Galaxy(ModelObject, lensing.LensingObject):
         ----------
         grid : ndarray
             The (y, x) coordinates in the original reference frame of the grid.
+        out : ndarray or None
+            A buffer of shape [total_sub_coordinates] the convergence is added into in place, such that the \
+            convergence of many galaxies is summed into one array. If None, a buffer of zeros is allocated.
 
         """
-        if self.has_mass_profile:
-            convergence = sum(
-                map(lambda p: p.convergence_from_grid(grid=grid), self.mass_profiles)
-            )
-            return grid.mapping.array_stored_1d_from_sub_array_1d(
-                sub_array_1d=convergence
-            )
-        else:
-            return grid.mapping.array_stored_1d_from_sub_array_1d(
-                sub_array_1d=np.zeros((grid.sub_shape_1d,))
-            )
+        if out is None:
+            out = np.zeros((grid.sub_shape_1d,))
+
+        self.add_profile_values_into_out(
+            profiles=self.mass_profiles,
+            func_name="convergence_from_grid",
+            grid=grid,
+            out=out,
+        )
+
+        return grid.mapping.array_stored_1d_from_sub_array_1d(sub_array_1d=out)
 
     @grids.convert_coordinates_to_grid
-    def potential_from_grid(self, grid):
+    @geometry_profiles.share_geometry
+    def potential_from_grid(self, grid, out=None):
         """Compute the summed gravitational potential of the galaxy's mass profiles \
         using a grid of Cartesian (y,x) coordinates.
 
@@ -469,22 +557,26 @@ class Galaxy(ModelObject, lensing.LensingObject):
         ----------
         grid : ndarray
             The (y, x) coordinates in the original reference frame of the grid.
+        out : ndarray or None
+            A buffer of shape [total_sub_coordinates] the potential is added into in place, such that the \
+            potential of many galaxies is summed into one array. If None, a buffer of zeros is allocated.
 
         """
-        if self.has_mass_profile:
-            potential = sum(
-                map(lambda p: p.potential_from_grid(grid=grid), self.mass_profiles)
-            )
-            return grid.mapping.array_stored_1d_from_sub_array_1d(
-                sub_array_1d=potential
-            )
-        else:
-            return grid.mapping.array_stored_1d_from_sub_array_1d(
-                sub_array_1d=np.zeros((grid.sub_shape_1d,))
-            )
+        if out is None:
+            out = np.zeros((grid.sub_shape_1d,))
+
+        self.add_profile_values_into_out(
+            profiles=self.mass_profiles,
+            func_name="potential_from_grid",
+            grid=grid,
+            out=out,
+        )
+
+        return grid.mapping.array_stored_1d_from_sub_array_1d(sub_array_1d=out)
 
     @grids.convert_coordinates_to_grid
-    def deflections_from_grid(self, grid):
+    @geometry_profiles.share_geometry
+    def deflections_from_grid(self, grid, out=None):
         """Compute the summed (y,x) deflection angles of the galaxy's mass profiles \
         using a grid of Cartesian (y,x) coordinates.
 
@@ -496,14 +588,73 @@ class Galaxy(ModelObject, lensing.LensingObject):
         ----------
         grid : ndarray
             The (y, x) coordinates in the original reference frame of the grid.
+        out : ndarray or None
+            A buffer of shape [total_sub_coordinates, 2] the deflection angles are added into in place, such that \
+            the deflection angles of many galaxies are summed into one array. If None, a buffer of zeros is allocated.
         """
-        if self.has_mass_profile:
-            deflections = sum(
-                map(lambda p: p.deflections_from_grid(grid=grid), self.mass_profiles)
+        if out is None:
+            out = np.zeros((grid.sub_shape_1d, 2))
+
+        self.add_profile_values_into_out(
+            profiles=self.mass_profiles,
+            func_name="deflections_from_grid",
+            grid=grid,
+            out=out,
+        )
+
+        return grid.mapping.grid_stored_1d_from_sub_grid_1d(sub_grid_1d=out)
+
+    @geometry_profiles.share_geometry
+    def hessian_from_grid(self, grid):
+        """Compute the summed Hessian [psi_yy, psi_xy, psi_xx] of the lensing potential of the galaxy's mass profiles \
+        using a grid of Cartesian (y,x) coordinates.
+
+        Every mass profile computes its own Hessian, analytically where it can, so the stencil of deflection angles is \
+        only evaluated for the mass profiles without an analytic Hessian. If the galaxy has no mass profiles, three \
+        grids of zeros are returned.
+
+        Parameters
+        ----------
+        grid : ndarray
+            The (y, x) coordinates in the original reference frame of the grid.
+        """
+        hessian = [np.zeros(shape=grid.sub_shape_1d) for _ in range(3)]
+
+        for mass_profile in self.mass_profiles:
+            for component, profile_component in zip(
+                hessian, mass_profile.hessian_from_grid(grid=grid)
+            ):
+                component += np.asarray(profile_component)
+
+        return [
+            grid.mapping.array_stored_1d_from_sub_array_1d(sub_array_1d=component)
+            for component in hessian
+        ]
+
+    @property
+    def einstein_radius_via_mean_convergence(self):
+        """The radius of the circle within which the mean convergence of the galaxy's mass profiles is 1.0.
+
+        A galaxy with one mass profile uses its closed-form Einstein radius where it has one. Otherwise the mass of \
+        every mass profile is summed within contours of equal area, which is exact for concentric mass profiles of \
+        equal ellipticity and an approximation otherwise (see *einstein_radius_via_critical_curve*). If a mass \
+        profile cannot compute its enclosed mass, the tangential critical curve is used instead.
+        """
+        if len(self.mass_profiles) == 1:
+            return self.mass_profiles[0].einstein_radius_via_mean_convergence
+
+        return super().einstein_radius_via_mean_convergence
+
+    def convergence_bounding_box(self, convergence_threshold=0.02):
+        """A galaxy with one mass profile uses the bounding box of that mass profile, which mass profiles without \
+        a centre (e.g. a convergence map) override."""
+        if len(self.mass_profiles) == 1:
+            return self.mass_profiles[0].convergence_bounding_box(
+                convergence_threshold=convergence_threshold
             )
-            return grid.mapping.grid_stored_1d_from_sub_grid_1d(sub_grid_1d=deflections)
-        return grid.mapping.grid_stored_1d_from_sub_grid_1d(
-            sub_grid_1d=np.full((grid.sub_shape_1d, 2), 0.0)
+
+        return super().convergence_bounding_box(
+            convergence_threshold=convergence_threshold
         )
 
     def mass_within_circle_in_units(
@@ -1 +1,2 @@
 from .galaxy_data import MaskedGalaxyData as galaxy_data
+from .galaxy_data import MaskedGalaxyDataset as galaxy_dataset
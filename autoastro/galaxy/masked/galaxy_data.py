@@ -1,6 +1,24 @@
+import numpy as np
+
 from autoarray.structures import grids
 from autoarray.masked import masked_structures
 from autoastro import exc
+from autoastro.profiles import geometry_profiles
+from autoastro.util import adaptive_grid_util
+
+
+def profile_values_from_galaxies_and_grid(galaxies, grid, func_name):
+    """Sum the values of a function (e.g. *convergence_from_grid*) of a list of galaxies at every coordinate of a \
+    grid, which every galaxy adds into one buffer in place."""
+    if func_name == "deflections_from_grid":
+        profile_values = np.zeros((grid.sub_shape_1d, 2))
+    else:
+        profile_values = np.zeros((grid.sub_shape_1d,))
+
+    for galaxy in galaxies:
+        getattr(galaxy, func_name)(grid=grid, out=profile_values)
+
+    return profile_values
 
 
 class MaskedGalaxyData:
@@ -14,6 +32,8 @@ class MaskedGalaxyData:
         use_potential=False,
         use_deflections_y=False,
         use_deflections_x=False,
+        interpolation_error_target=None,
+        interpolation_refinement_levels=3,
     ):
         """ A galaxy-fit data_type is a collection of fit data_type components which are used to fit a galaxy to another galaxy. \
         This is where a component of a galaxy's light profiles (e.g. image) or mass profiles (e.g. surface \
@@ -34,6 +54,15 @@ class MaskedGalaxyData:
             The 2D masks that is applied to image fit data_type.
         sub_size : int
             The size of the sub-grid used for computing the SubGrid (see imaging.masks.SubGrid).
+        pixel_scale_interpolation_grid : float or None
+            The arc-second pixel scale of the uniform grid the profile quantities are computed on and interpolated \
+            from, or of the coarse grid of the adaptive interpolation grid if an *interpolation_error_target* is input.
+        interpolation_error_target : float or None
+            If input, the profile quantities are interpolated from an adaptive grid (see *adaptive_grid_util*), which \
+            refines the cells of the coarse grid close to the centres of the galaxies' profiles and where the error \
+            of their interpolation exceeds this target, in the units of the quantity fitted.
+        interpolation_refinement_levels : int
+            The maximum number of times a cell of the coarse adaptive interpolation grid is split into four.
 
         Attributes
         ----------
@@ -62,8 +91,21 @@ class MaskedGalaxyData:
         self.grid = grids.Grid.from_mask(mask=mask)
 
         self.pixel_scale_interpolation_grid = pixel_scale_interpolation_grid
+        self.interpolation_error_target = interpolation_error_target
+        self.interpolation_refinement_levels = interpolation_refinement_levels
+
+        if interpolation_error_target is not None:
+
+            if pixel_scale_interpolation_grid is None:
+                raise exc.GalaxyException(
+                    "An adaptive interpolation grid requires the pixel_scale_interpolation_grid of its coarse grid."
+                )
+
+            # The interpolation weights of every adaptive grid computed for the mask, keyed on its nodes.
+
+            self.interpolation_weights = geometry_profiles.GridCache()
 
-        if pixel_scale_interpolation_grid is not None:
+        elif pixel_scale_interpolation_grid is not None:
 
             self.grid = self.grid.new_grid_with_interpolator(
                 pixel_scale_interpolation_grid=pixel_scale_interpolation_grid
@@ -106,40 +148,207 @@ class MaskedGalaxyData:
         self.use_deflections_y = use_deflections_y
         self.use_deflections_x = use_deflections_x
 
+        # A fingerprint of the data, noise-map and grid fitted and of how the profile quantity is computed, which keys
+        # the memo of the fits of this data (see *fit_galaxy.GalaxyFitMemo*).
+
+        self.fingerprint = (
+            tuple(
+                geometry_profiles.GridCache.fingerprint_from_grid(grid=array)
+                for array in (self.image, self.noise_map, self.grid)
+            ),
+            (
+                use_image,
+                use_convergence,
+                use_potential,
+                use_deflections_y,
+                use_deflections_x,
+            ),
+            (
+                pixel_scale_interpolation_grid,
+                interpolation_error_target,
+                interpolation_refinement_levels,
+            ),
+        )
+
     def profile_quantity_from_galaxies(self, galaxies):
 
-        if self.use_image:
-            profile_image = sum(
-                map(lambda g: g.profile_image_from_grid(grid=self.grid), galaxies)
+        if self.interpolation_error_target is not None:
+            profile_quantity = (
+                self.profile_quantity_via_adaptive_interpolation_from_galaxies(
+                    galaxies=galaxies
+                )
             )
-            return self.grid.mapping.array_stored_1d_from_sub_array_1d(
-                sub_array_1d=profile_image
+        else:
+            profile_quantity = self.profile_quantity_from_galaxies_and_grid(
+                galaxies=galaxies, grid=self.grid
             )
+
+        return self.grid.mapping.array_stored_1d_from_sub_array_1d(
+            sub_array_1d=profile_quantity
+        )
+
+    @property
+    def profile_func_name(self):
+        """The name of the function of a galaxy which computes the profile quantity fitted, where both deflection \
+        angle components are computed by *deflections_from_grid*."""
+        if self.use_image:
+            return "profile_image_from_grid"
         elif self.use_convergence:
-            convergence = sum(
-                map(lambda g: g.convergence_from_grid(grid=self.grid), galaxies)
+            return "convergence_from_grid"
+        elif self.use_potential:
+            return "potential_from_grid"
+        return "deflections_from_grid"
+
+    def profile_quantity_from_profile_values(self, profile_values):
+        """The profile quantity fitted from the values of *profile_func_name*, which selects the deflection angle \
+        component fitted."""
+        if self.use_deflections_y:
+            return profile_values[:, 0]
+        elif self.use_deflections_x:
+            return profile_values[:, 1]
+        return profile_values
+
+    def profile_quantity_from_galaxies_and_grid(self, galaxies, grid):
+        """The profile quantity fitted (e.g. the image or convergence) of a list of galaxies at every coordinate of \
+        a grid, which every galaxy adds into one buffer in place."""
+        return self.profile_quantity_from_profile_values(
+            profile_values=profile_values_from_galaxies_and_grid(
+                galaxies=galaxies, grid=grid, func_name=self.profile_func_name
             )
-            return self.grid.mapping.array_stored_1d_from_sub_array_1d(
-                sub_array_1d=convergence
+        )
+
+    def profile_quantity_via_adaptive_interpolation_from_galaxies(self, galaxies):
+        """Compute the profile quantity fitted of a list of galaxies on an adaptive grid which covers the grid of \
+        the mask and interpolate it onto the grid.
+
+        The interpolation weights depend only on the nodes of the adaptive grid, so they are stored for the mask \
+        and reused by every call whose adaptive grid has the same nodes.
+
+        The adaptive grid evaluates the galaxies at fewer nodes than the grid has coordinates, refining it less \
+        than the error target requires if necessary. If its coarse grid alone has as many nodes, the profile \
+        quantity is computed on the grid instead.
+        """
+        if self.use_image:
+            centres = [
+                centre for galaxy in galaxies for centre in galaxy.light_profile_centres
+            ]
+        else:
+            centres = [
+                centre for galaxy in galaxies for centre in galaxy.mass_profile_centres
+            ]
+
+        nodes, values = adaptive_grid_util.nodes_and_values_from_grid_and_values_func(
+            grid=self.grid,
+            values_func=lambda nodes: np.asarray(
+                self.profile_quantity_from_galaxies_and_grid(
+                    galaxies=galaxies, grid=grids.GridIrregular.manual_1d(nodes)
+                )
+            ),
+            pixel_scale=self.pixel_scale_interpolation_grid,
+            centres=centres,
+            error_target=self.interpolation_error_target,
+            refinement_levels=self.interpolation_refinement_levels,
+            maximum_evaluations=self.grid.shape[0] - 1,
+        )
+
+        if nodes is None:
+            return self.profile_quantity_from_galaxies_and_grid(
+                galaxies=galaxies, grid=self.grid
             )
-        elif self.use_potential:
-            potential = sum(
-                map(lambda g: g.potential_from_grid(grid=self.grid), galaxies)
+
+        key = self.interpolation_weights.fingerprint_from_grid(grid=nodes)
+
+        vertices_and_weights = self.interpolation_weights.get(key=key)
+
+        if vertices_and_weights is None:
+            vertices, weights = (
+                adaptive_grid_util.interpolation_weights_from_grid_and_nodes(
+                    grid=self.grid, nodes=nodes
+                )
             )
-            return self.grid.mapping.array_stored_1d_from_sub_array_1d(
-                sub_array_1d=potential
+            vertices_and_weights = np.hstack((vertices, weights))
+            self.interpolation_weights.set(key=key, result=vertices_and_weights)
+
+        return adaptive_grid_util.interpolated_values_from_values(
+            values=values,
+            vertices=vertices_and_weights[:, :3].astype("int"),
+            weights=vertices_and_weights[:, 3:],
+        )
+
+
+class MaskedGalaxyDataset:
+    def __init__(self, masked_galaxy_datas):
+        """A dataset of masked galaxy-datas which fit different profile quantities of the same galaxies on the same \
+        grid (e.g. their y and x deflection angles), each with its own data and noise-map.
+
+        The profile quantities of all masked galaxy-datas are computed from one evaluation of every function of the \
+        galaxies they use, which share the transformed grids of the profiles, such that fitting the y and x \
+        deflection angles computes the deflection angles of the galaxies once.
+
+        Parameters
+        ----------
+        masked_galaxy_datas : [MaskedGalaxyData]
+            The masked galaxy-datas, which must have the same mask and interpolation grid.
+        """
+        if len(masked_galaxy_datas) == 0:
+            raise exc.GalaxyException(
+                "A masked galaxy dataset requires at least one masked galaxy data."
             )
-        elif self.use_deflections_y:
-            deflections_y = sum(
-                map(lambda g: g.deflections_from_grid(grid=self.grid), galaxies)
-            )[:, 0]
-            return self.grid.mapping.array_stored_1d_from_sub_array_1d(
-                sub_array_1d=deflections_y
+
+        # The fingerprint of the grid and of the interpolation of every masked galaxy data.
+
+        grid_fingerprints = set(
+            (masked_galaxy_data.fingerprint[0][2], masked_galaxy_data.fingerprint[2])
+            for masked_galaxy_data in masked_galaxy_datas
+        )
+
+        if len(grid_fingerprints) > 1:
+            raise exc.GalaxyException(
+                "The masked galaxy datas of a masked galaxy dataset must have the same mask and interpolation grid."
             )
-        elif self.use_deflections_x:
-            deflections_x = sum(
-                map(lambda g: g.deflections_from_grid(grid=self.grid), galaxies)
-            )[:, 1]
-            return self.grid.mapping.array_stored_1d_from_sub_array_1d(
-                sub_array_1d=deflections_x
+
+        self.masked_galaxy_datas = masked_galaxy_datas
+        self.grid = masked_galaxy_datas[0].grid
+
+    def profile_quantities_from_galaxies(self, galaxies):
+        """The profile quantity fitted by every masked galaxy data of a list of galaxies, where every function of \
+        the galaxies used by more than one masked galaxy data is evaluated once.
+
+        Masked galaxy-datas which interpolate from an adaptive grid refine it for their own profile quantity, so \
+        they compute their profile quantity individually.
+        """
+        return self.profile_quantities_from_grid_and_galaxies(
+            grid=self.grid, galaxies=galaxies
+        )
+
+    @geometry_profiles.share_geometry
+    def profile_quantities_from_grid_and_galaxies(self, grid, galaxies):
+        """The profile quantities of *profile_quantities_from_galaxies* on a grid, where all galaxies share the grids \
+        transformed to the reference frames of their profiles (see *geometry_profiles.share_geometry*)."""
+        profile_values = {}
+        profile_quantities = []
+
+        for masked_galaxy_data in self.masked_galaxy_datas:
+
+            if masked_galaxy_data.interpolation_error_target is not None:
+                profile_quantities.append(
+                    masked_galaxy_data.profile_quantity_from_galaxies(galaxies=galaxies)
+                )
+                continue
+
+            func_name = masked_galaxy_data.profile_func_name
+
+            if func_name not in profile_values:
+                profile_values[func_name] = profile_values_from_galaxies_and_grid(
+                    galaxies=galaxies, grid=grid, func_name=func_name
+                )
+
+            profile_quantities.append(
+                grid.mapping.array_stored_1d_from_sub_array_1d(
+                    sub_array_1d=masked_galaxy_data.profile_quantity_from_profile_values(
+                        profile_values=profile_values[func_name]
+                    )
+                )
             )
+
+        return profile_quantities
@@ -1,21 +1,51 @@
 import numpy as np
+import weakref
 import autofit as af
+from scipy.integrate import quad
 from scipy.optimize import root_scalar
 from astropy import cosmology as cosmo
-from skimage import measure
 
 from autoarray.util import array_util
 from autoarray.structures import grids
 from autoastro import dimensions as dim
-from autoastro.util import cosmology_util
+from autoastro.util import cosmology_util, critical_curve_util
 
+# The critical curves of every lensing object which has traced them, keyed by the id of the object, as a tuple of the
+# parameters and settings they were traced with and the curves (see *critical_curves_via_quadtree*). An entry is
+# removed when its object is garbage collected.
+
+critical_curves_memo = {}
 
 class LensingObject:
+
+    # The step, in arc-seconds, of the finite-difference stencil used to compute the Hessian of the lensing potential
+    # of objects which do not have an analytic Hessian.
+    hessian_stencil_size = 1.0e-4
+
+    # The number of times the cells of the coarse grid which bracket a critical curve are split into four when the
+    # critical curves are traced.
+    critical_curve_refinement_levels = 2
+
+    # Whether the Einstein radius is computed from the area within the tangential critical curve, which traces the
+    # critical curves on a grid, instead of from the mean convergence of the mass profiles.
+    einstein_radius_via_critical_curve = False
+
     @property
     def mass_profiles(self):
         raise NotImplementedError("mass profiles list should be overriden")
 
     def convergence_func(self, grid_radius):
+        """The convergence of the profile as a function of its radial coordinate (which is the elliptical radius of \
+        an elliptical profile, in the profile's reference frame).
+
+        Every implementation must be vectorized, such that *grid_radius* can be a float or a NumPy array of radii \
+        and the convergence is returned with the same shape as *grid_radius*, without modifying it in place.
+
+        Parameters
+        ----------
+        grid_radius : float or ndarray
+            The radial coordinates the convergence is computed at.
+        """
         raise NotImplementedError("convergence_func should be overridden")
 
     def convergence_from_grid(self, grid):
@@ -49,6 +79,28 @@ class LensingObject:
         circle"""
         return 2 * np.pi * x * self.convergence_func(grid_radius=x)
 
+    @property
+    def circularized_radius_rescale(self):
+        """The ratio of the radius of the circle with the same area as a contour of constant convergence to the \
+        radial coordinate *convergence_func* takes on that contour."""
+        return 1.0
+
+    def mass_within_circularized_radius(self, radius):
+        """Integrate the mass profile's convergence within the contour of constant convergence whose area is that \
+        of a circle of the input radius, in the profile's angular units.
+
+        Parameters
+        ----------
+        radius : float
+            The radius of the circle whose area the contour encloses.
+        """
+        radius_rescale = self.circularized_radius_rescale
+
+        return (
+            radius_rescale ** 2.0
+            * quad(self.mass_integral, a=0.0, b=radius / radius_rescale)[0]
+        )
+
     def deflection_magnitudes_from_grid(self, grid):
         deflections = self.deflections_from_grid(grid=grid)
         return deflections.distances_from_coordinate(coordinate=(0.0, 0.0))
@@ -64,78 +116,152 @@ class LensingObject:
             sub_grid_2d=np.stack((deflections_y_2d, deflections_x_2d), axis=-1)
         )
 
-    def jacobian_a11_from_grid(self, grid):
+    def hessian_from_grid(self, grid):
+        """Compute the Hessian of the lensing potential, psi, using a grid of Cartesian (y,x) coordinates.
+
+        The Hessian is returned as its three independent components [psi_yy, psi_xy, psi_xx], which are the \
+        derivatives of the deflection angles (alpha_y, alpha_x) with respect to y and x. Objects with an analytic \
+        Hessian override this method, otherwise it is computed from the deflection angles using \
+        *hessian_via_stencil_from_grid*.
+
+        Parameters
+        ----------
+        grid : aa.Grid or aa.GridIrregular
+            The grid of (y,x) arc-second coordinates the Hessian is computed on.
+        """
+        return self.hessian_via_stencil_from_grid(grid=grid)
+
+    def hessian_via_stencil_from_grid(self, grid):
+        """Compute the Hessian of the lensing potential using central finite differences of the deflection angles.
+
+        The four offset coordinates of the stencil of every (y,x) coordinate, displaced by *hessian_stencil_size* \
+        along y and x, are evaluated together in a single call to *deflections_from_grid*. The stencil does not \
+        depend on the spacing of the grid, so the Hessian can be computed on irregular grids of coordinates.
+
+        Parameters
+        ----------
+        grid : aa.Grid or aa.GridIrregular
+            The grid of (y,x) arc-second coordinates the Hessian is computed on.
+        """
+        stencil_size = self.hessian_stencil_size
+
+        offsets = np.array(
+            [
+                [stencil_size, 0.0],
+                [-stencil_size, 0.0],
+                [0.0, stencil_size],
+                [0.0, -stencil_size],
+            ]
+        )
 
-        deflections = self.deflections_from_grid(grid=grid)
+        grid_stencil = grids.GridIrregular(
+            grid=(np.asarray(grid)[None, :, :] + offsets[:, None, :]).reshape(-1, 2)
+        )
 
-        return grid.mapping.array_stored_1d_from_sub_array_2d(
-            sub_array_2d=1.0
-            - np.gradient(deflections.in_2d[:, :, 1], grid.in_2d[0, :, 1], axis=1)
+        deflections = np.asarray(self.deflections_from_grid(grid=grid_stencil)).reshape(
+            4, -1, 2
         )
 
-    def jacobian_a12_from_grid(self, grid):
+        hessian_yy = (deflections[0, :, 0] - deflections[1, :, 0]) / (
+            2.0 * stencil_size
+        )
+        hessian_xy = (
+            deflections[0, :, 1]
+            - deflections[1, :, 1]
+            + deflections[2, :, 0]
+            - deflections[3, :, 0]
+        ) / (4.0 * stencil_size)
+        hessian_xx = (deflections[2, :, 1] - deflections[3, :, 1]) / (
+            2.0 * stencil_size
+        )
 
-        deflections = self.deflections_from_grid(grid=grid)
+        return [
+            grid.mapping.array_stored_1d_from_sub_array_1d(sub_array_1d=hessian)
+            for hessian in [hessian_yy, hessian_xy, hessian_xx]
+        ]
 
-        return grid.mapping.array_stored_1d_from_sub_array_2d(
-            sub_array_2d=-1.0
-            * np.gradient(deflections.in_2d[:, :, 1], grid.in_2d[:, 0, 0], axis=0)
-        )
+    def hessian_from_convergence_and_shear(self, grid, convergence, shear):
+        """Compute the Hessian of the lensing potential from the convergence and complex shear \
+        gamma = gamma_1 + i * gamma_2, where psi_xx = kappa + gamma_1, psi_yy = kappa - gamma_1 and psi_xy = gamma_2.
+
+        Parameters
+        ----------
+        grid : aa.Grid or aa.GridIrregular
+            The grid of (y,x) arc-second coordinates the convergence and shear are computed on.
+        convergence : ndarray
+            The convergence at every (y,x) coordinate.
+        shear : ndarray
+            The complex shear at every (y,x) coordinate.
+        """
+        convergence = np.asarray(convergence)
 
-    def jacobian_a21_from_grid(self, grid):
+        return [
+            grid.mapping.array_stored_1d_from_sub_array_1d(sub_array_1d=hessian)
+            for hessian in [
+                convergence - np.real(shear),
+                np.imag(shear),
+                convergence + np.real(shear),
+            ]
+        ]
 
-        deflections = self.deflections_from_grid(grid=grid)
+    def jacobian_a11_from_grid(self, grid):
+        return self.jacobian_from_grid(grid=grid)[0][0]
 
-        return grid.mapping.array_stored_1d_from_sub_array_2d(
-            sub_array_2d=-1.0
-            * np.gradient(deflections.in_2d[:, :, 0], grid.in_2d[0, :, 1], axis=1)
-        )
+    def jacobian_a12_from_grid(self, grid):
+        return self.jacobian_from_grid(grid=grid)[0][1]
+
+    def jacobian_a21_from_grid(self, grid):
+        return self.jacobian_from_grid(grid=grid)[1][0]
 
     def jacobian_a22_from_grid(self, grid):
+        return self.jacobian_from_grid(grid=grid)[1][1]
 
-        deflections = self.deflections_from_grid(grid=grid)
+    def jacobian_from_grid(self, grid):
+
+        hessian_yy, hessian_xy, hessian_xx = self.hessian_from_grid(grid=grid)
 
-        return grid.mapping.array_stored_1d_from_sub_array_2d(
-            sub_array_2d=1
-            - np.gradient(deflections.in_2d[:, :, 0], grid.in_2d[:, 0, 0], axis=0)
+        a11 = grid.mapping.array_stored_1d_from_sub_array_1d(
+            sub_array_1d=1.0 - np.asarray(hessian_xx)
         )
 
-    def jacobian_from_grid(self, grid):
+        a12 = grid.mapping.array_stored_1d_from_sub_array_1d(
+            sub_array_1d=-1.0 * np.asarray(hessian_xy)
+        )
 
-        a11 = self.jacobian_a11_from_grid(grid=grid)
+        a22 = grid.mapping.array_stored_1d_from_sub_array_1d(
+            sub_array_1d=1.0 - np.asarray(hessian_yy)
+        )
 
-        a12 = self.jacobian_a12_from_grid(grid=grid)
+        return [[a11, a12], [a12, a22]]
 
-        a21 = self.jacobian_a21_from_grid(grid=grid)
+    def convergence_and_shear_via_hessian_from_grid(self, grid):
+        """Compute the convergence and shear magnitude from a single evaluation of *hessian_from_grid*."""
 
-        a22 = self.jacobian_a22_from_grid(grid=grid)
+        hessian_yy, hessian_xy, hessian_xx = map(
+            np.asarray, self.hessian_from_grid(grid=grid)
+        )
 
-        return [[a11, a12], [a21, a22]]
+        convergence = 0.5 * (hessian_xx + hessian_yy)
 
-    def convergence_via_jacobian_from_grid(self, grid):
+        shear = np.sqrt((0.5 * (hessian_xx - hessian_yy)) ** 2 + hessian_xy ** 2)
 
-        jacobian = self.jacobian_from_grid(grid=grid)
+        return convergence, shear
 
-        convergence = 1 - 0.5 * (jacobian[0][0] + jacobian[1][1])
+    def convergence_via_jacobian_from_grid(self, grid):
+
+        convergence, shear = self.convergence_and_shear_via_hessian_from_grid(grid=grid)
 
         return grid.mapping.array_stored_1d_from_sub_array_1d(sub_array_1d=convergence)
 
     def shear_via_jacobian_from_grid(self, grid):
 
-        jacobian = self.jacobian_from_grid(grid=grid)
+        convergence, shear = self.convergence_and_shear_via_hessian_from_grid(grid=grid)
 
-        gamma_1 = 0.5 * (jacobian[1][1] - jacobian[0][0])
-        gamma_2 = -0.5 * (jacobian[0][1] + jacobian[1][0])
-
-        return grid.mapping.array_stored_1d_from_sub_array_1d(
-            sub_array_1d=(gamma_1 ** 2 + gamma_2 ** 2) ** 0.5
-        )
+        return grid.mapping.array_stored_1d_from_sub_array_1d(sub_array_1d=shear)
 
     def tangential_eigen_value_from_grid(self, grid):
 
-        convergence = self.convergence_via_jacobian_from_grid(grid=grid)
-
-        shear = self.shear_via_jacobian_from_grid(grid=grid)
+        convergence, shear = self.convergence_and_shear_via_hessian_from_grid(grid=grid)
 
         return grid.mapping.array_stored_1d_from_sub_array_1d(
             sub_array_1d=1 - convergence - shear
@@ -143,9 +269,7 @@ class LensingObject:
 
     def radial_eigen_value_from_grid(self, grid):
 
-        convergence = self.convergence_via_jacobian_from_grid(grid=grid)
-
-        shear = self.shear_via_jacobian_from_grid(grid=grid)
+        convergence, shear = self.convergence_and_shear_via_hessian_from_grid(grid=grid)
 
         return grid.mapping.array_stored_1d_from_sub_array_1d(
             sub_array_1d=1 - convergence + shear
@@ -153,12 +277,10 @@ class LensingObject:
 
     def magnification_from_grid(self, grid):
 
-        jacobian = self.jacobian_from_grid(grid=grid)
-
-        det_jacobian = jacobian[0][0] * jacobian[1][1] - jacobian[0][1] * jacobian[1][0]
+        convergence, shear = self.convergence_and_shear_via_hessian_from_grid(grid=grid)
 
         return grid.mapping.array_stored_1d_from_sub_array_1d(
-            sub_array_1d=1 / det_jacobian
+            sub_array_1d=1 / ((1 - convergence) ** 2 - shear ** 2)
         )
 
     @property
@@ -241,85 +363,159 @@ class LensingObject:
             buffer_around_corners=True,
         )
 
-    @property
-    def tangential_critical_curve(self):
+    def critical_curves_via_quadtree(self):
+        """Trace every tangential and radial critical curve of the lensing object, which are the contours where its \
+        tangential and radial eigen values are zero.
+
+        Both eigen values are computed together from a single Hessian evaluation on a coarse grid spanning the \
+        *convergence_bounding_box*, with the number of pixels set in the *calculation_grid* section of the general \
+        config. Only the cells of the coarse grid which bracket a sign change of an eigen value are refined, \
+        *critical_curve_refinement_levels* times, using the quadtree in *critical_curve_util*. Critical curves which \
+        lie entirely within a cell of the coarse grid are not found.
+
+        The curves are memoized per lensing object, such that every critical curve and caustic property reads them \
+        from one calculation. They are traced again if the *parameters_key* of the object, the calculation_grid \
+        config or *critical_curve_refinement_levels* change. Objects without a *parameters_key* (or whose parameters \
+        cannot be hashed) are traced every time, as a change to their parameters could not be detected.
+
+        Returns
+        -------
+        [[aa.GridIrregular], [aa.GridIrregular]]
+            Every tangential critical curve and every radial critical curve.
+        """
+        convergence_threshold = af.conf.instance.general.get(
+            "calculation_grid", "convergence_threshold", float
+        )
 
-        grid = self.calculation_grid
+        pixels = af.conf.instance.general.get("calculation_grid", "pixels", int)
 
-        tangential_eigen_values = self.tangential_eigen_value_from_grid(grid=grid)
+        parameters_key = getattr(self, "parameters_key", None)
 
-        tangential_critical_curve_indices = measure.find_contours(
-            tangential_eigen_values.in_2d, 0
+        key = (
+            parameters_key,
+            convergence_threshold,
+            pixels,
+            self.critical_curve_refinement_levels,
         )
 
-        if len(tangential_critical_curve_indices) == 0:
-            return []
+        memo = critical_curves_memo.get(id(self))
 
-        tangential_critical_curve = grid.geometry.grid_scaled_from_grid_pixels_1d_for_marching_squares(
-            grid_pixels_1d=tangential_critical_curve_indices[0],
-            shape_2d=tangential_eigen_values.sub_shape_2d,
-        )
+        if parameters_key is not None and memo is not None and memo[0] == key:
+            return memo[1]
 
-        return grids.GridIrregular(grid=tangential_critical_curve)
+        bounding_box = self.convergence_bounding_box(
+            convergence_threshold=convergence_threshold
+        )
 
-    @property
-    def radial_critical_curve(self):
+        def eigen_values_func(grid):
 
-        grid = self.calculation_grid
+            convergence, shear = self.convergence_and_shear_via_hessian_from_grid(
+                grid=grids.GridIrregular(grid=grid)
+            )
 
-        radial_eigen_values = self.radial_eigen_value_from_grid(grid=grid)
+            return [1 - convergence - shear, 1 - convergence + shear]
 
-        radial_critical_curve_indices = measure.find_contours(
-            radial_eigen_values.in_2d, 0
+        tangential_critical_curves, radial_critical_curves = (
+            critical_curve_util.contours_from_values_func(
+                values_func=eigen_values_func,
+                bounding_box=bounding_box,
+                shape_2d=(pixels, pixels),
+                refinement_levels=self.critical_curve_refinement_levels,
+            )
         )
 
-        if len(radial_critical_curve_indices) == 0:
-            return []
+        critical_curves = [
+            [grids.GridIrregular(grid=curve) for curve in tangential_critical_curves],
+            [grids.GridIrregular(grid=curve) for curve in radial_critical_curves],
+        ]
 
-        radial_critical_curve = grid.geometry.grid_scaled_from_grid_pixels_1d_for_marching_squares(
-            grid_pixels_1d=radial_critical_curve_indices[0],
-            shape_2d=radial_eigen_values.sub_shape_2d,
-        )
+        if parameters_key is None:
+            return critical_curves
 
-        return grids.GridIrregular(grid=radial_critical_curve)
+        if memo is None:
+            weakref.finalize(self, critical_curves_memo.pop, id(self), None)
 
-    @property
-    @array_util.Memoizer()
-    def critical_curves(self):
-        return [self.tangential_critical_curve, self.radial_critical_curve]
+        critical_curves_memo[id(self)] = (key, critical_curves)
+
+        return critical_curves
 
     @property
-    def tangential_caustic(self):
+    def tangential_critical_curves(self):
+        return self.critical_curves_via_quadtree()[0]
 
-        tangential_critical_curve = self.tangential_critical_curve
+    @property
+    def radial_critical_curves(self):
+        return self.critical_curves_via_quadtree()[1]
 
-        if len(tangential_critical_curve) == 0:
+    @staticmethod
+    def longest_curve_from_curves(curves):
+        """The curve with the most points of a list of curves, or an empty list if there are no curves."""
+        if len(curves) == 0:
             return []
 
-        deflections_critical_curve = self.deflections_from_grid(
-            grid=tangential_critical_curve
+        return max(curves, key=len)
+
+    @property
+    def tangential_critical_curve(self):
+        return self.longest_curve_from_curves(curves=self.tangential_critical_curves)
+
+    @property
+    def radial_critical_curve(self):
+        return self.longest_curve_from_curves(curves=self.radial_critical_curves)
+
+    @property
+    def critical_curves(self):
+        return list(
+            map(self.longest_curve_from_curves, self.critical_curves_via_quadtree())
         )
 
-        return tangential_critical_curve - deflections_critical_curve
+    def caustics_from_critical_curves(self, critical_curves):
+        """Ray-trace a list of critical curves to the source-plane, with a single deflection angle calculation."""
+        if len(critical_curves) == 0:
+            return []
+
+        grid = grids.GridIrregular(grid=np.concatenate(critical_curves))
+
+        caustic = np.asarray(grid - self.deflections_from_grid(grid=grid))
+
+        splits = np.cumsum(list(map(len, critical_curves)))[:-1]
+
+        return [grids.GridIrregular(grid=curve) for curve in np.split(caustic, splits)]
 
     @property
-    def radial_caustic(self):
+    def tangential_caustics(self):
+        return self.caustics_from_critical_curves(
+            critical_curves=self.tangential_critical_curves
+        )
 
-        radial_critical_curve = self.radial_critical_curve
+    @property
+    def radial_caustics(self):
+        return self.caustics_from_critical_curves(
+            critical_curves=self.radial_critical_curves
+        )
 
-        if len(radial_critical_curve) == 0:
+    def caustic_from_critical_curve(self, critical_curve):
+        """Ray-trace a critical curve to the source-plane."""
+        if len(critical_curve) == 0:
             return []
 
-        deflections_critical_curve = self.deflections_from_grid(
-            grid=radial_critical_curve
+        return critical_curve - self.deflections_from_grid(grid=critical_curve)
+
+    @property
+    def tangential_caustic(self):
+        return self.caustic_from_critical_curve(
+            critical_curve=self.tangential_critical_curve
         )
 
-        return radial_critical_curve - deflections_critical_curve
+    @property
+    def radial_caustic(self):
+        return self.caustic_from_critical_curve(
+            critical_curve=self.radial_critical_curve
+        )
 
     @property
-    @array_util.Memoizer()
     def caustics(self):
-        return [self.tangential_caustic, self.radial_caustic]
+        return list(map(self.caustic_from_critical_curve, self.critical_curves))
 
     @property
     @array_util.Memoizer()
@@ -330,13 +526,62 @@ class LensingObject:
 
         return np.abs(0.5 * np.sum(y[:-1] * np.diff(x) - x[:-1] * np.diff(y)))
 
+    @property
+    def einstein_radius_via_tangential_critical_curve(self):
+        """The radius of the circle whose area is the area within the tangential critical curve."""
+        return np.sqrt(self.area_within_tangential_critical_curve / np.pi)
+
+    @property
+    def einstein_radius_via_mean_convergence(self):
+        """The radius of the circle within which the mean convergence of the mass profiles is 1.0.
+
+        The mass of every mass profile within a circle of a given radius is computed from its *mass_integral* over \
+        the iso-convergence ellipse of the same area, so the radius is found with a 1D root-find. Profiles with a \
+        closed-form Einstein radius override this property.
+
+        If the mean convergence is below 1.0 at every radius the object has no Einstein radius and 0.0 is returned. \
+        If it is still above 1.0 at the largest radius searched (e.g. a mass sheet with kappa > 1.0) the Einstein \
+        radius is unbounded and inf is returned.
+
+        If a mass profile cannot compute its enclosed mass (it has no *convergence_func*), the Einstein radius is \
+        computed from the area within the tangential critical curve instead.
+        """
+
+        def func(radius):
+            return (
+                sum(
+                    mass_profile.mass_within_circularized_radius(radius=radius)
+                    for mass_profile in self.mass_profiles
+                )
+                - np.pi * radius ** 2.0
+            )
+
+        minimum_radius, maximum_radius = 1e-4, 1000.0
+
+        try:
+            mass_at_minimum_radius = func(minimum_radius)
+        except NotImplementedError:
+            return self.einstein_radius_via_tangential_critical_curve
+
+        if mass_at_minimum_radius <= 0.0:
+            return 0.0
+
+        if func(maximum_radius) > 0.0:
+            return np.inf
+
+        return root_scalar(func, bracket=[minimum_radius, maximum_radius]).root
+
     def einstein_radius_in_units(
         self, unit_length="arcsec", redshift_object=None, cosmology=cosmo.Planck15
     ):
 
+        if self.einstein_radius_via_critical_curve:
+            einstein_radius = self.einstein_radius_via_tangential_critical_curve
+        else:
+            einstein_radius = self.einstein_radius_via_mean_convergence
+
         einstein_radius = dim.Length(
-            value=np.sqrt(self.area_within_tangential_critical_curve / np.pi),
-            unit_length=self.unit_length,
+            value=einstein_radius, unit_length=self.unit_length
         )
 
         if unit_length is "kpc":
@@ -1,11 +1,15 @@
+import hashlib
+import inspect
 import numpy as np
+from collections import OrderedDict
 from functools import wraps
+from scipy import interpolate
 
 import autoconf.named
 import autofit as af
 from autoarray.structures import grids
 from autoastro import dimensions as dim
-
+from autoastro import exc
 
 def transform_grid(func):
     """Wrap the function in a function that checks whether the coordinates have been transformed. If they have not \ 
@@ -42,7 +46,11 @@ def transform_grid(func):
         if not isinstance(grid, TransformedGrid):
             result = func(
                 profile,
-                profile.transform_grid_to_reference_frame(grid),
+                shared_value_from_grid(
+                    grid=grid,
+                    key=profile.reference_frame_key,
+                    func=lambda: profile.transform_grid_to_reference_frame(grid),
+                ),
                 *args,
                 **kwargs,
             )
@@ -60,10 +68,195 @@ def transform_grid(func):
     return wrapper
 
 
+class GeometryCache:
+
+    # The cache of the evaluation in progress, which is None outside of functions decorated with *share_geometry*.
+    active = None
+
+    def __init__(self):
+        """The values computed from grids during one evaluation of the profiles of an object, such as the grids \
+        transformed to the reference frame of each profile geometry and their elliptical and eccentric radii, which \
+        are shared between profiles with the same geometry.
+
+        Values are keyed on the grid they are computed from and a key describing the calculation. A reference to \
+        every grid is held, so its id is not reused by another grid during the evaluation.
+        """
+        self.values = {}
+
+    def value_from_grid(self, grid, key, func):
+        """Return the value computed from a grid under a key, computing it with *func* if it is not yet stored.
+
+        Parameters
+        ----------
+        grid : ndarray
+            The grid the value is computed from.
+        key : tuple
+            A hashable description of the calculation, for example the geometry of a transformation.
+        func : () -> Object
+            The function which computes the value.
+        """
+        cache_key = (id(grid), key)
+
+        try:
+            cached_grid, value = self.values[cache_key]
+            if cached_grid is grid:
+                return value
+        except KeyError:
+            pass
+
+        value = func()
+        self.values[cache_key] = (grid, value)
+
+        return value
+
+
+def shared_value_from_grid(grid, key, func):
+    """Return the value computed from a grid by *func*, which is shared between profiles via the active \
+    *GeometryCache* if one is active and otherwise computed."""
+    if GeometryCache.active is None:
+        return func()
+
+    return GeometryCache.active.value_from_grid(grid=grid, key=key, func=func)
+
+
+def share_geometry(func):
+    """Activate a *GeometryCache* for the duration of a call that evaluates several profiles on the same grid, such \
+    as the sum over the profiles of a galaxy, so that profiles with the same geometry transform the grid and compute \
+    its radii once. Nested calls use the cache of the outermost call.
+
+    Parameters
+    ----------
+    func : (obj, grid, *args, **kwargs) -> Object
+        A function which evaluates profiles on a grid.
+    """
+
+    @wraps(func)
+    def wrapper(obj, grid, *args, **kwargs):
+
+        if GeometryCache.active is not None:
+            return func(obj, grid, *args, **kwargs)
+
+        GeometryCache.active = GeometryCache()
+
+        try:
+            return func(obj, grid, *args, **kwargs)
+        finally:
+            GeometryCache.active = None
+
+    return wrapper
+
+
+class GridCache:
+
+    # Whether results are cached (a global switch for every cache) and the default maximum number of bytes of results
+    # each cache holds, beyond which the least recently used results are evicted.
+    enabled = True
+    max_bytes = 2 ** 28
+
+    def __init__(self, max_bytes=None):
+        """A least recently used (LRU) cache of the results of the grid functions of one instance, bounded by the \
+        total number of bytes of the results it holds.
+
+        Results are keyed on the name of the function, a fingerprint of the grid, the other arguments of the call \
+        and a key of the instance (see *instance_key_from_instance*). The number of hits, misses and evictions of the cache are recorded.
+
+        Parameters
+        ----------
+        max_bytes : int or None
+            The maximum number of bytes of results held, which defaults to *GridCache.max_bytes*.
+        """
+        if max_bytes is not None:
+            self.max_bytes = max_bytes
+
+        self.results = OrderedDict()
+        self.total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self):
+        return len(self.results)
+
+    def __contains__(self, key):
+        return key in self.results
+
+    @staticmethod
+    def fingerprint_from_grid(grid):
+        """A fingerprint of a grid, which hashes its memory in place rather than copying it to bytes."""
+        grid = np.asarray(grid)
+
+        if not grid.flags.c_contiguous:
+            grid = np.ascontiguousarray(grid)
+
+        return (
+            grid.shape,
+            grid.dtype.str,
+            hashlib.blake2b(memoryview(grid).cast("B"), digest_size=16).digest(),
+        )
+
+    @staticmethod
+    def instance_key_from_instance(instance):
+        """The key of the parameters and settings of the instance whose results are cached, which is its \
+        *parameters_key*, or its *result_settings_key* if it has no *parameters_key*, so that results computed \
+        before a parameter or setting of the instance is changed are not returned after it."""
+        key = getattr(instance, "parameters_key", None)
+
+        if key is None:
+            key = getattr(instance, "result_settings_key", None)
+
+        return key
+
+    def key_from_call(self, func, grid, args, kwargs, instance=None):
+        return (
+            func.__name__,
+            self.instance_key_from_instance(instance=instance),
+            type(grid).__name__,
+            self.fingerprint_from_grid(grid=grid),
+            args,
+            tuple(sorted(kwargs.items())),
+        )
+
+    def get(self, key):
+        """Return the result stored at a key, marking it as the most recently used, or None if it is not stored."""
+        try:
+            result, _ = self.results[key]
+        except KeyError:
+            self.misses += 1
+            return None
+
+        self.results.move_to_end(key)
+        self.hits += 1
+
+        return result
+
+    def set(self, key, result, result_bytes=None):
+        """Store a result, evicting the least recently used results until the cache is within its byte budget. A \
+        result larger than the whole budget is not stored. The number of bytes of the result defaults to that of the \
+        result as an ndarray."""
+        if result_bytes is None:
+            result_bytes = np.asarray(result).nbytes
+
+        if result_bytes > self.max_bytes:
+            return
+
+        self.results[key] = (result, result_bytes)
+        self.total_bytes += result_bytes
+
+        while self.total_bytes > self.max_bytes:
+            _, (_, evicted_bytes) = self.results.popitem(last=False)
+            self.total_bytes -= evicted_bytes
+            self.evictions += 1
+
+    def clear(self):
+        self.results.clear()
+        self.total_bytes = 0
+
+
 def cache(func):
     """
-    Caches results of a call to a grid function. If a grid that evaluates to the same byte value is passed into the same
-    function of the same instance as previously then the cached result is returned.
+    Caches results of a call to a grid function in a *GridCache* of the instance. If a grid with the same fingerprint \
+    is passed into the same function of the same instance with the same arguments as previously then the cached \
+    result is returned.
 
     Parameters
     ----------
@@ -76,17 +269,228 @@ def cache(func):
         Some result, either newly calculated or recovered from the cache
     """
 
-    def wrapper(instance: GeometryProfile, grid: np.ndarray, *args, **kwargs):
+    @wraps(func)
+    def wrapper(
+        instance: GeometryProfile,
+        grid: np.ndarray,
+        grid_radial_minimum=None,
+        *args,
+        **kwargs,
+    ):
+        # The grid_radial_minimum passed by *grids.grid_interpolate* is not used by the functions below this decorator,
+        # so it is consumed here and is not part of the key.
+
+        if not GridCache.enabled:
+            return func(instance, grid, *args, **kwargs)
+
         if not hasattr(instance, "cache"):
-            instance.cache = {}
-        key = (func.__name__, grid.tobytes())
-        if key not in instance.cache:
-            instance.cache[key] = func(instance, grid)
-        return instance.cache[key]
+            instance.cache = GridCache()
+
+        key = instance.cache.key_from_call(
+            func=func, grid=grid, args=args, kwargs=kwargs, instance=instance
+        )
+
+        try:
+            result = instance.cache.get(key=key)
+        except TypeError:  # Arguments which are not hashable are not cached
+            return func(instance, grid, *args, **kwargs)
+
+        if result is None:
+            result = func(instance, grid, *args, **kwargs)
+            instance.cache.set(key=key, result=result)
+
+        return result
 
     return wrapper
 
 
+class RadialTable:
+    def __init__(self, indexes, values, radii_per_decade):
+        """A table of the values of a function of a radially symmetric profile at log-spaced radii, which are \
+        interpolated with a cubic spline in log10(radius).
+
+        The radii of the table are 10^(index / radii_per_decade) for a range of integer indexes, so a table which is \
+        recomputed to span a larger grid keeps the same radii, and its accuracy is set by *radii_per_decade*.
+
+        Parameters
+        ----------
+        indexes : ndarray
+            The integer indexes of the radii of the table.
+        values : ndarray
+            The values of the function at every radius, of shape [total_radii] or [total_radii, 2].
+        radii_per_decade : int
+            The number of radii of the table per decade of radius.
+        """
+        self.indexes = indexes
+        self.values = values
+        self.radii_per_decade = radii_per_decade
+        self.spline = interpolate.CubicSpline(
+            indexes / radii_per_decade, values, axis=0
+        )
+
+    @staticmethod
+    def indexes_from_radii(radii, radii_per_decade):
+        """The indexes of the radii of a table spanning the non-zero radii of a grid, with at least 4 radii."""
+        log_radii = np.log10(radii[radii > 0.0])
+
+        minimum_index = int(np.floor(np.min(log_radii) * radii_per_decade))
+        maximum_index = int(np.ceil(np.max(log_radii) * radii_per_decade))
+
+        return np.arange(minimum_index, max(maximum_index, minimum_index + 3) + 1)
+
+    @property
+    def minimum_radius(self):
+        return 10.0 ** (self.indexes[0] / self.radii_per_decade)
+
+    @property
+    def maximum_radius(self):
+        return 10.0 ** (self.indexes[-1] / self.radii_per_decade)
+
+    def spans(self, radii):
+        """Whether the table spans the non-zero radii of a grid."""
+        radii = radii[radii > 0.0]
+        return (
+            np.min(radii) >= self.minimum_radius
+            and np.max(radii) <= self.maximum_radius
+        )
+
+    def values_from_radii(self, radii):
+        """Interpolate the values of the table at a set of radii, where radii below the smallest radius of the \
+        table (e.g. a coordinate at the centre of the profile) take the value at the smallest radius."""
+        return self.spline(np.log10(np.maximum(radii, self.minimum_radius)))
+
+
+def tabulate_radially(func):
+    """
+    Computes the values of a function of a radially symmetric profile at every coordinate of a grid by interpolating \
+    a *RadialTable* of its values, if the profile's *radial_table* is True, which is stored in the *radial_tables* of \
+    the instance and recomputed over a larger range of radii when a grid extends beyond it.
+
+    The table of a function which returns a value per coordinate is interpolated directly. A function which returns \
+    a (y,x) vector per coordinate is tabulated at coordinates on the positive x-axis of the profile and its values \
+    are rotated to the angle of every coordinate.
+
+    Parameters
+    ----------
+    func : (profile, grid, *args, **kwargs) -> ndarray
+        A function of a grid in the reference frame of the profile.
+
+    Returns
+    -------
+        The values of the function at every coordinate of the grid.
+    """
+
+    @wraps(func)
+    def wrapper(profile, grid, *args, **kwargs):
+
+        if not profile.radial_table or not profile.is_radially_symmetric:
+            return func(profile, grid, *args, **kwargs)
+
+        radii = np.sqrt(np.square(grid[:, 0]) + np.square(grid[:, 1]))
+
+        if not np.any(radii > 0.0):
+            return func(profile, grid, *args, **kwargs)
+
+        if not hasattr(profile, "radial_tables"):
+            profile.radial_tables = {}
+
+        key = (func.__name__, args, tuple(sorted(kwargs.items())))
+
+        try:
+            table = profile.radial_tables.get(key)
+        except TypeError:  # Arguments which are not hashable are not tabulated
+            return func(profile, grid, *args, **kwargs)
+
+        if (
+            table is not None
+            and table.radii_per_decade != profile.radial_table_radii_per_decade
+        ):
+            table = None
+
+        if table is None or not table.spans(radii=radii):
+
+            indexes = RadialTable.indexes_from_radii(
+                radii=radii, radii_per_decade=profile.radial_table_radii_per_decade
+            )
+
+            if table is not None:
+                indexes = np.arange(
+                    min(indexes[0], table.indexes[0]),
+                    max(indexes[-1], table.indexes[-1]) + 1,
+                )
+
+            table_radii = 10.0 ** (indexes / profile.radial_table_radii_per_decade)
+            table_grid = np.stack((np.zeros(table_radii.shape), table_radii), axis=1)
+
+            table = RadialTable(
+                indexes=indexes,
+                values=np.asarray(
+                    func(
+                        profile,
+                        TransformedGrid(
+                            grid=table_grid,
+                            mask=grids.GridIrregular.manual_1d(table_grid).mask,
+                        ),
+                        *args,
+                        **kwargs,
+                    )
+                ),
+                radii_per_decade=profile.radial_table_radii_per_decade,
+            )
+
+            profile.radial_tables[key] = table
+
+        values = table.values_from_radii(radii=radii)
+
+        if values.ndim == 1:
+            return values
+
+        with np.errstate(all="ignore"):
+            cos_theta = np.where(radii > 0.0, grid[:, 1] / radii, 1.0)
+            sin_theta = np.where(radii > 0.0, grid[:, 0] / radii, 0.0)
+
+        return np.vstack(
+            (
+                values[:, 0] * cos_theta + values[:, 1] * sin_theta,
+                values[:, 1] * cos_theta - values[:, 0] * sin_theta,
+            )
+        ).T
+
+    return wrapper
+
+
+radial_minimum_registry = {}
+
+
+def radial_minimum_from_class(cls):
+    """The radial minimum of a profile class in the radial_minimum.ini config, which is read once per class and \
+    config path and then held in *radial_minimum_registry*.
+
+    Parameters
+    ----------
+    cls : type
+        The profile class whose radial minimum is returned.
+    """
+    key = (af.conf.instance.config_path, cls.__name__)
+
+    try:
+        return radial_minimum_registry[key]
+    except KeyError:
+        radial_minimum_config = autoconf.named.NamedConfig(
+            f"{af.conf.instance.config_path}/radial_minimum.ini"
+        )
+        radial_minimum_registry[key] = radial_minimum_config.get(
+            "radial_minimum", cls.__name__, float
+        )
+
+    return radial_minimum_registry[key]
+
+
+def reload_radial_minimum_config():
+    """Clear the radial minima read from the radial_minimum.ini config, such that edits to the config are used."""
+    radial_minimum_registry.clear()
+
+
 def move_grid_to_radial_minimum(func):
     """ Checks whether any coordinates in the grid are radially near (0.0, 0.0), which can lead to numerical faults in \
     the evaluation of a light or mass profiles. If any coordinates are radially within the the radial minimum \
@@ -122,19 +526,28 @@ def move_grid_to_radial_minimum(func):
         -------
             A value or coordinate in the same coordinate system as those passed in.
         """
-        radial_minimum_config = autoconf.named.NamedConfig(
-            f"{af.conf.instance.config_path}/radial_minimum.ini"
-        )
-        grid_radial_minimum = radial_minimum_config.get(
-            "radial_minimum", profile.__class__.__name__, float
-        )
-        with np.errstate(all="ignore"):  # Division by zero fixed via isnan
-            grid_radii = profile.grid_to_grid_radii(grid=grid)
-            grid_radial_scale = np.where(
-                grid_radii < grid_radial_minimum, grid_radial_minimum / grid_radii, 1.0
-            )
-            grid = np.multiply(grid, grid_radial_scale[:, None])
-        grid[np.isnan(grid)] = grid_radial_minimum
+        grid_radial_minimum = radial_minimum_from_class(cls=profile.__class__)
+
+        if grid_radial_minimum > 0.0:
+
+            grid_radii_squared = np.square(grid[:, 0]) + np.square(grid[:, 1])
+            grid_to_move = grid_radii_squared < grid_radial_minimum ** 2
+
+            # Only a grid with coordinates to move is copied, and only those coordinates are rescaled.
+
+            if np.any(grid_to_move):
+
+                grid = grid.copy()
+
+                # Coordinates at (0.0, 0.0) divide by zero and are set to the radial minimum below.
+
+                with np.errstate(all="ignore"):
+                    grid[grid_to_move] *= (
+                        grid_radial_minimum / np.sqrt(grid_radii_squared[grid_to_move])
+                    )[:, None]
+
+                grid[grid_to_move & (grid_radii_squared == 0.0)] = grid_radial_minimum
+
         return func(profile, grid, *args, **kwargs)
 
     return wrapper
@@ -145,6 +558,12 @@ class TransformedGrid(grids.AbstractGrid):
 
 
 class GeometryProfile(dim.DimensionsProfile):
+
+    # The names of the class attributes of the profile which change the values it computes (e.g. the engine or
+    # accuracy of a calculation), which are included in its *parameters_key*. Every class adds these to the
+    # result_settings of the classes it inherits from.
+    result_settings = ()
+
     @af.map_types
     def __init__(self, centre: dim.Position = (0.0, 0.0)):
         """An abstract geometry profile, which describes profiles with y and x centre Cartesian coordinates
@@ -157,6 +576,184 @@ class GeometryProfile(dim.DimensionsProfile):
 
         self.centre = centre
 
+    @classmethod
+    def batch_constructor_arguments(cls):
+        """The (name, size) of every argument of the constructor of this class, where the size is the number of \
+        entries of tuple arguments (e.g. 2 for the centre) and None for scalar arguments."""
+        arguments = list(inspect.signature(cls.__init__).parameters.values())[1:]
+
+        return [
+            (
+                argument.name,
+                len(argument.default) if isinstance(argument.default, tuple) else None,
+            )
+            for argument in arguments
+        ]
+
+    @classmethod
+    def batch_parameter_names(cls):
+        """The names of the columns of the *params_array* of a batch of profiles of this class, which are the \
+        arguments of its constructor in order, with every tuple argument (e.g. the centre) split into one column per \
+        entry (e.g. centre_0 and centre_1)."""
+        names = []
+
+        for name, size in cls.batch_constructor_arguments():
+            if size is None:
+                names.append(name)
+            else:
+                names += ["{}_{}".format(name, index) for index in range(size)]
+
+        return names
+
+    @classmethod
+    def batch_parameters_from_params_array(cls, params_array):
+        """Split the *params_array* of a batch of profiles of this class into a dictionary of the arguments of its \
+        constructor, where every argument is a column of shape [total_profiles, 1] (or a tuple of columns for tuple \
+        arguments) that broadcasts against the coordinates of a grid.
+
+        Parameters
+        ----------
+        params_array : ndarray
+            The parameters of every profile, of shape [total_profiles, total_parameters], with the columns ordered \
+            as *batch_parameter_names*.
+        """
+        names = cls.batch_parameter_names()
+
+        if params_array.ndim != 2 or params_array.shape[1] != len(names):
+            raise exc.ProfileException(
+                "The params_array of a batch of {} profiles must have shape [total_profiles, {}] with "
+                "columns {}".format(cls.__name__, len(names), names)
+            )
+
+        parameters = {}
+        column = 0
+
+        for name, size in cls.batch_constructor_arguments():
+            if size is None:
+                parameters[name] = params_array[:, column, None]
+                column += 1
+            else:
+                parameters[name] = tuple(
+                    params_array[:, column + index, None] for index in range(size)
+                )
+                column += size
+
+        return parameters
+
+    @classmethod
+    def batch_grid_to_reference_frame(cls, grid, centre, phi=None):
+        """Transform a grid of (y,x) coordinates to the reference frames of a batch of profiles of this class, \
+        including the move of coordinates to the radial minimum of the class.
+
+        Parameters
+        ----------
+        grid : ndarray
+            The (y, x) coordinates in the original reference frame of the grid, of shape [total_coordinates, 2].
+        centre : (ndarray, ndarray)
+            The (y,x) centre of every profile, as columns of shape [total_profiles, 1].
+        phi : ndarray or None
+            The rotation angle of every profile counter-clockwise from the positive x-axis, as a column of shape \
+            [total_profiles, 1], or None for profiles which are not rotated.
+
+        Returns
+        -------
+        (ndarray, ndarray)
+            The y and x coordinates in the reference frame of every profile, of shape [total_profiles, \
+            total_coordinates].
+        """
+        y = grid[None, :, 0] - centre[0]
+        x = grid[None, :, 1] - centre[1]
+
+        if phi is not None:
+            cos_phi = np.cos(np.radians(phi))
+            sin_phi = np.sin(np.radians(phi))
+            y, x = y * cos_phi - x * sin_phi, x * cos_phi + y * sin_phi
+
+        grid_radial_minimum = radial_minimum_from_class(cls=cls)
+
+        if grid_radial_minimum > 0.0:
+
+            grid_radii_squared = np.square(y) + np.square(x)
+            grid_to_move = grid_radii_squared < grid_radial_minimum ** 2
+
+            if np.any(grid_to_move):
+
+                # Coordinates at (0.0, 0.0) divide by zero and are set to the radial minimum below.
+
+                with np.errstate(all="ignore"):
+                    rescale = np.where(
+                        grid_to_move,
+                        grid_radial_minimum / np.sqrt(grid_radii_squared),
+                        1.0,
+                    )
+
+                at_centre = grid_to_move & (grid_radii_squared == 0.0)
+
+                y = np.where(at_centre, grid_radial_minimum, y * rescale)
+                x = np.where(at_centre, grid_radial_minimum, x * rescale)
+
+        return y, x
+
+    @staticmethod
+    def batch_grid_from_reference_frame(grid_y, grid_x, phi=None):
+        """Rotate the y and x components of vectors (e.g. deflection angles) computed in the reference frames of a \
+        batch of profiles back to the original reference frame of the grid, returning them as an ndarray of shape \
+        [total_profiles, total_coordinates, 2].
+
+        Parameters
+        ----------
+        grid_y, grid_x : ndarray
+            The y and x components in the reference frame of every profile, of shape [total_profiles, \
+            total_coordinates].
+        phi : ndarray or None
+            The rotation angle of every profile counter-clockwise from the positive x-axis, as a column of shape \
+            [total_profiles, 1], or None for profiles which are not rotated.
+        """
+        if phi is None:
+            return np.stack((grid_y, grid_x), axis=-1)
+
+        cos_phi = np.cos(np.radians(phi))
+        sin_phi = np.sin(np.radians(phi))
+
+        return np.stack(
+            (grid_x * sin_phi + grid_y * cos_phi, grid_x * cos_phi - grid_y * sin_phi),
+            axis=-1,
+        )
+
+    @property
+    def result_settings_key(self):
+        """The name and value of every setting in the *result_settings* of the profile's class and the classes it \
+        inherits from, which may be changed per instance."""
+        names = sorted(
+            {
+                name
+                for cls in self.__class__.__mro__
+                for name in cls.__dict__.get("result_settings", ())
+            }
+        )
+
+        return tuple((name, getattr(self, name)) for name in names)
+
+    @property
+    def parameters_key(self):
+        """A hashable key of the class of the profile, the values of the arguments of its constructor and its \
+        *result_settings_key*, such that two profiles with the same key compute the same values, or None if an \
+        argument is not stored under its name or is not hashable (e.g. an ndarray)."""
+        try:
+            key = (
+                self.__class__,
+                tuple(
+                    getattr(self, name)
+                    for name, _ in self.batch_constructor_arguments()
+                ),
+                self.result_settings_key,
+            )
+            hash(key)
+        except (AttributeError, TypeError):
+            return None
+
+        return key
+
     def transform_grid_to_reference_frame(self, grid):
         raise NotImplemented()
 
@@ -174,6 +771,15 @@ class GeometryProfile(dim.DimensionsProfile):
 
 
 class SphericalProfile(GeometryProfile):
+
+    # Whether functions decorated with *tabulate_radially* are interpolated from a table of their values at log-spaced
+    # radii when the profile is radially symmetric, and the number of radii per decade of the table, which sets the
+    # accuracy of the interpolation.
+    radial_table = False
+    radial_table_radii_per_decade = 50
+
+    result_settings = ("radial_table", "radial_table_radii_per_decade")
+
     @af.map_types
     def __init__(self, centre: dim.Position = (0.0, 0.0)):
         """ A spherical profile, which describes profiles with y and x centre Cartesian coordinates.
@@ -199,6 +805,16 @@ class SphericalProfile(GeometryProfile):
         """
         return np.sqrt(np.add(np.square(grid[:, 0]), np.square(grid[:, 1])))
 
+    @property
+    def is_radially_symmetric(self):
+        return True
+
+    @property
+    def reference_frame_key(self):
+        """A key describing the transformation of a grid to the reference frame of the profile, which is shared by \
+        every profile with the same key."""
+        return ("spherical", tuple(self.centre))
+
     def grid_angle_to_profile(self, grid_thetas):
         """The angle between each (y,x) coordinate on the grid and the profile, in radians.
         
@@ -274,6 +890,22 @@ class EllipticalProfile(SphericalProfile):
         self.axis_ratio = axis_ratio
         self.phi = phi
 
+    @property
+    def has_spherical_reference_frame(self):
+        """Whether the reference frame of the profile is only translated to its centre, which is the case for a \
+        circular profile that is not rotated, such that its grids are transformed as those of a spherical profile."""
+        return self.axis_ratio == 1.0 and self.phi == 0.0
+
+    @property
+    def reference_frame_key(self):
+        if self.has_spherical_reference_frame:
+            return super().reference_frame_key
+        return ("elliptical", tuple(self.centre), self.axis_ratio, self.phi)
+
+    @property
+    def is_radially_symmetric(self):
+        return self.axis_ratio == 1.0
+
     @property
     def phi_radians(self):
         return np.radians(self.phi)
@@ -338,10 +970,15 @@ class EllipticalProfile(SphericalProfile):
         grid : TransformedGrid(ndarray)
             The (y, x) coordinates in the reference frame of the elliptical profile.
         """
-        return np.sqrt(
-            np.add(
-                np.square(grid[:, 1]), np.square(np.divide(grid[:, 0], self.axis_ratio))
-            )
+        return shared_value_from_grid(
+            grid=grid,
+            key=("elliptical_radii", self.axis_ratio),
+            func=lambda: np.sqrt(
+                np.add(
+                    np.square(grid[:, 1]),
+                    np.square(np.divide(grid[:, 0], self.axis_ratio)),
+                )
+            ),
         )
 
     @grids.convert_coordinates_to_grid
@@ -358,9 +995,13 @@ class EllipticalProfile(SphericalProfile):
         grid : TransformedGrid(ndarray)
             The (y, x) coordinates in the reference frame of the elliptical profile.
         """
-        return np.multiply(
-            np.sqrt(self.axis_ratio), self.grid_to_elliptical_radii(grid)
-        ).view(np.ndarray)
+        return shared_value_from_grid(
+            grid=grid,
+            key=("eccentric_radii", self.axis_ratio),
+            func=lambda: np.multiply(
+                np.sqrt(self.axis_ratio), self.grid_to_elliptical_radii(grid)
+            ).view(np.ndarray),
+        )
 
     def transform_grid_to_reference_frame(self, grid):
         """Transform a grid of (y,x) coordinates to the reference frame of the profile, including a translation to \
@@ -371,7 +1012,7 @@ class EllipticalProfile(SphericalProfile):
         grid : ndarray
             The (y, x) coordinates in the original reference frame of the grid.
         """
-        if self.__class__.__name__.startswith("Spherical"):
+        if self.has_spherical_reference_frame:
             return super().transform_grid_to_reference_frame(grid)
         shifted_coordinates = np.subtract(grid, self.centre)
         radius = np.sqrt(np.sum(shifted_coordinates ** 2.0, 1))
@@ -396,7 +1037,7 @@ class EllipticalProfile(SphericalProfile):
         grid : TransformedGrid(ndarray)
             The (y, x) coordinates in the reference frame of the profile.
         """
-        if self.__class__.__name__.startswith("Spherical"):
+        if self.has_spherical_reference_frame:
             return super().transform_grid_from_reference_frame(grid)
 
         y = np.add(
@@ -4,8 +4,9 @@ from astropy import cosmology as cosmo
 from scipy.integrate import quad
 
 from autoarray.structures import grids
-from autoastro.util import cosmology_util
+from autoastro.util import cosmology_util, light_profile_util
 from autoastro import dimensions as dim
+from autoastro import exc
 from autofit.tools import text_util
 from autoastro.profiles import geometry_profiles
 
@@ -70,6 +71,12 @@ class LightProfile:
 class EllipticalLightProfile(geometry_profiles.EllipticalProfile, LightProfile):
     """Generic class for an elliptical light profiles"""
 
+    # How profiles with a fused kernel compute their image: "jit" transforms every (y,x) coordinate and computes its \
+    # radius and intensity in one compiled pass over the grid, "numpy" uses the transform_grid decorators.
+    profile_image_engine = "jit"
+
+    result_settings = ("profile_image_engine",)
+
     @af.map_types
     def __init__(
         self,
@@ -98,6 +105,44 @@ class EllipticalLightProfile(geometry_profiles.EllipticalProfile, LightProfile):
     def light_profile_centres(self):
         return [self.centre]
 
+    def profile_image_from_grid_and_kernel(self, grid, kernel, *args):
+        """Calculate the intensity of the light profile on a grid of (y,x) coordinates using one of the fused \
+        kernels in *light_profile_util*, which performs the transform of every coordinate to the profile's \
+        reference frame, the move to the radial minimum and the computation of its radius and intensity in one pass.
+
+        Parameters
+        ----------
+        grid : ndarray
+            The (y, x) coordinates in the original reference frame of the grid, or of the profile if they have \
+            already been transformed.
+        kernel : func
+            The fused kernel of the profile.
+        args
+            The parameters of the profile passed to the kernel after its geometry.
+        """
+        if isinstance(grid, geometry_profiles.TransformedGrid):
+            centre, cos_phi, sin_phi = (0.0, 0.0), 1.0, 0.0
+        else:
+            centre, cos_phi, sin_phi = self.centre, self.cos_phi, self.sin_phi
+
+        profile_image = kernel(
+            np.asarray(grid, dtype="float64"),
+            float(centre[0]),
+            float(centre[1]),
+            float(cos_phi),
+            float(sin_phi),
+            float(self.axis_ratio),
+            float(geometry_profiles.radial_minimum_from_class(cls=self.__class__)),
+            *[float(arg) for arg in args],
+        )
+
+        if isinstance(grid, geometry_profiles.TransformedGrid):
+            return profile_image
+
+        return grid.mapping.array_stored_1d_from_sub_array_1d(
+            sub_array_1d=profile_image
+        )
+
     def blurred_profile_image_from_grid_and_psf(self, grid, psf, blurring_grid):
 
         profile_image = self.profile_image_from_grid(grid=grid)
@@ -271,14 +316,39 @@ class EllipticalGaussian(EllipticalLightProfile):
         )
 
     @grids.convert_coordinates_to_grid
-    @geometry_profiles.transform_grid
-    @geometry_profiles.move_grid_to_radial_minimum
     def profile_image_from_grid(self, grid, grid_radial_minimum=None):
         """
         Calculate the intensity of the light profile on a grid of Cartesian (y,x) coordinates.
 
         If the coordinates have not been transformed to the profile's geometry, this is performed automatically.
 
+        Parameters
+        ----------
+        grid : ndarray
+            The (y, x) coordinates in the original reference frame of the grid.
+        """
+        if self.profile_image_engine == "jit":
+            return self.profile_image_from_grid_and_kernel(
+                grid,
+                light_profile_util.gaussian_profile_image_from_grid,
+                self.intensity,
+                self.sigma,
+            )
+        elif self.profile_image_engine == "numpy":
+            return self.profile_image_from_grid_via_transform(grid=grid)
+
+        raise exc.ProfileException(
+            "The profile_image_engine {} is not supported by the {} profile".format(
+                self.profile_image_engine, self.__class__.__name__
+            )
+        )
+
+    @geometry_profiles.transform_grid
+    @geometry_profiles.move_grid_to_radial_minimum
+    def profile_image_from_grid_via_transform(self, grid):
+        """Calculate the intensity of the light profile on a grid of Cartesian (y,x) coordinates, by transforming \
+        them to the profile's reference frame and computing their elliptical radii with NumPy.
+
         Parameters
         ----------
         grid : ndarray
@@ -462,13 +532,40 @@ class EllipticalSersic(AbstractEllipticalSersic, EllipticalLightProfile):
         )
 
     @grids.convert_coordinates_to_grid
-    @geometry_profiles.transform_grid
-    @geometry_profiles.move_grid_to_radial_minimum
     def profile_image_from_grid(self, grid, grid_radial_minimum=None):
-        """ Calculate the intensity of the light profile on a grid of Cartesian (y,x) coordinates.
+        """Calculate the intensity of the light profile on a grid of Cartesian (y,x) coordinates.
 
         If the coordinates have not been transformed to the profile's geometry, this is performed automatically.
 
+        Parameters
+        ----------
+        grid : ndarray
+            The (y, x) coordinates in the original reference frame of the grid.
+        """
+        if self.profile_image_engine == "jit":
+            return self.profile_image_from_grid_and_kernel(
+                grid,
+                light_profile_util.sersic_profile_image_from_grid,
+                self.intensity,
+                self.effective_radius,
+                self.sersic_index,
+                self.sersic_constant,
+            )
+        elif self.profile_image_engine == "numpy":
+            return self.profile_image_from_grid_via_transform(grid=grid)
+
+        raise exc.ProfileException(
+            "The profile_image_engine {} is not supported by the {} profile".format(
+                self.profile_image_engine, self.__class__.__name__
+            )
+        )
+
+    @geometry_profiles.transform_grid
+    @geometry_profiles.move_grid_to_radial_minimum
+    def profile_image_from_grid_via_transform(self, grid):
+        """ Calculate the intensity of the light profile on a grid of Cartesian (y,x) coordinates, by transforming \
+        them to the profile's reference frame and computing their eccentric radii with NumPy.
+
         Parameters
         ----------
         grid : ndarray
@@ -644,6 +741,10 @@ class SphericalDevVaucouleurs(EllipticalDevVaucouleurs):
 
 
 class EllipticalCoreSersic(EllipticalSersic):
+
+    # The fused kernel of the Sersic profile does not compute the intensity of the cored-Sersic profile.
+    profile_image_engine = "numpy"
+
     @af.map_types
     def __init__(
         self,
@@ -33,3 +33,8 @@ from .stellar_mass_profiles import (
     SphericalSersicRadialGradient,
 )
 from .mass_sheets import ExternalShear, MassSheet
+from .population_mass_profiles import (
+    PointMassPopulation,
+    SphericalTruncatedNFWPopulation,
+)
+from .convergence_maps import ConvergenceMap
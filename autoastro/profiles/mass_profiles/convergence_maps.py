@@ -0,0 +1,282 @@
+import numpy as np
+
+from autoarray.structures import grids
+from autoastro import exc
+from autoastro.util import convergence_map_util
+from autoastro.profiles import mass_profiles as mp
+
+"""
+Mass profiles whose convergence is a pixelized map rather than an analytic function, such as the projected mass of \
+a halo taken from a simulation.
+
+The lensing potential and deflection angles of the map are computed once at the centre of every pixel with fast \
+Fourier transforms (see *convergence_map_util*) and interpolated onto the (y,x) coordinates of any grid, so lensing a \
+map costs O(N log N) for N pixels instead of approximating it with thousands of analytic profiles.
+"""
+
+
+class ConvergenceMap(mp.MassProfile):
+    def __init__(self, convergence, pixel_scales, origin=(0.0, 0.0)):
+        """ A mass profile whose convergence is a uniform 2D map of pixels, where the convergence of every pixel is \
+        constant within it and the convergence outside the map is zero.
+
+        Coordinates inside the map use the potential and deflection angles tabulated at the pixel centres, which \
+        are bilinearly interpolated. Coordinates outside the map sum the contributions of its pixels directly.
+
+        Parameters
+        ----------
+        convergence : ndarray
+            The 2D convergence map, where the first row is the top (highest y) row of the map.
+        pixel_scales : (float, float) or float
+            The arc-second (y,x) size of every pixel of the map.
+        origin : (float, float)
+            The arc-second (y,x) coordinates of the centre of the map.
+        """
+        self.convergence = np.ascontiguousarray(convergence, dtype="float64")
+
+        if self.convergence.ndim != 2:
+            raise exc.ProfileException(
+                "The convergence of a ConvergenceMap must be a 2D array"
+            )
+
+        if isinstance(pixel_scales, (int, float)):
+            pixel_scales = (pixel_scales, pixel_scales)
+
+        self.pixel_scales = tuple(float(pixel_scale) for pixel_scale in pixel_scales)
+        self.origin = tuple(float(coordinate) for coordinate in origin)
+        self._unit_length = "arcsec"
+        self._maps_2d = None
+
+    @classmethod
+    def from_array(cls, array):
+        """Create a convergence map from an *aa.array*, using its 2D values, pixel scales and origin."""
+        return cls(
+            convergence=array.in_2d,
+            pixel_scales=array.pixel_scales,
+            origin=array.origin,
+        )
+
+    @property
+    def shape_2d(self):
+        return self.convergence.shape
+
+    @property
+    def centre(self):
+        """A map has no single centre, so it is not included in the centres of the galaxy's mass profiles."""
+        return None
+
+    @property
+    def mass_profile_centres(self):
+        return []
+
+    @property
+    def unit_length(self):
+        return self._unit_length
+
+    @property
+    def unit_mass(self):
+        return "angular"
+
+    @property
+    def pixel_centres(self):
+        """The y coordinates of the centres of the rows and x coordinates of the centres of the columns of the map."""
+        return convergence_map_util.pixel_centres_from_shape(
+            shape_2d=self.shape_2d, pixel_scales=self.pixel_scales, origin=self.origin
+        )
+
+    @property
+    def maps_2d(self):
+        """The potential and (y,x) deflection angles at the centre of every pixel of the map, of shape \
+        [3, total_y_pixels, total_x_pixels], which are computed with FFTs the first time they are used."""
+        if self._maps_2d is None:
+            self._maps_2d = np.stack(
+                convergence_map_util.potential_and_deflections_via_fft_from_convergence(
+                    convergence_2d=self.convergence, pixel_scales=self.pixel_scales
+                )
+            )
+        return self._maps_2d
+
+    def new_object_with_units_converted(
+        self,
+        unit_length=None,
+        unit_luminosity=None,
+        unit_mass=None,
+        kpc_per_arcsec=None,
+        exposure_time=None,
+        critical_surface_density=None,
+    ):
+        """Convert the pixel scales and origin of the map to a new unit of length. The convergence is dimensionless."""
+        if unit_length is None or unit_length == self.unit_length:
+            factor = 1.0
+        elif kpc_per_arcsec is None:
+            raise exc.ProfileException(
+                "The kpc_per_arcsec must be input to convert a ConvergenceMap to {}".format(
+                    unit_length
+                )
+            )
+        elif unit_length == "kpc":
+            factor = kpc_per_arcsec
+        elif unit_length == "arcsec":
+            factor = 1.0 / kpc_per_arcsec
+        else:
+            raise exc.ProfileException(
+                "The unit_length {} is not supported".format(unit_length)
+            )
+
+        new_map = self.__class__(
+            convergence=self.convergence,
+            pixel_scales=tuple(factor * value for value in self.pixel_scales),
+            origin=tuple(factor * value for value in self.origin),
+        )
+        new_map._unit_length = self.unit_length if factor == 1.0 else unit_length
+
+        return new_map
+
+    def mass_within_circularized_radius(self, radius):
+        """The mass of the map within a circle of the input radius centred on its origin, in angular units, which \
+        sums the convergence of every pixel times its area within the circle.
+
+        Parameters
+        ----------
+        radius : float
+            The radius of the circle.
+        """
+        areas = convergence_map_util.pixel_areas_within_circle_from_shape(
+            shape_2d=self.shape_2d,
+            pixel_scales=self.pixel_scales,
+            origin=self.origin,
+            centre=self.origin,
+            radius=float(radius),
+        )
+
+        return np.sum(self.convergence * areas)
+
+    def mass_within_circle(self, radius):
+        return self.mass_within_circularized_radius(radius=radius)
+
+    def convergence_bounding_box(self, convergence_threshold=0.02):
+        """The convergence outside the map is zero, so the bounding box of its convergence is the extent of the \
+        map."""
+        y_centres, x_centres = self.pixel_centres
+
+        return [
+            y_centres[-1] - 0.5 * self.pixel_scales[0],
+            y_centres[0] + 0.5 * self.pixel_scales[0],
+            x_centres[0] - 0.5 * self.pixel_scales[1],
+            x_centres[-1] + 0.5 * self.pixel_scales[1],
+        ]
+
+    def pixel_indexes_from_grid(self, grid):
+        """The row and column of the pixel of the map every (y,x) coordinate is in, and whether it is in the map."""
+        y_centres, x_centres = self.pixel_centres
+
+        rows = np.floor((y_centres[0] - grid[:, 0]) / self.pixel_scales[0] + 0.5)
+        columns = np.floor((grid[:, 1] - x_centres[0]) / self.pixel_scales[1] + 0.5)
+
+        inside = (
+            (rows >= 0)
+            & (rows < self.shape_2d[0])
+            & (columns >= 0)
+            & (columns < self.shape_2d[1])
+        )
+
+        return rows.astype("int"), columns.astype("int"), inside
+
+    @grids.convert_coordinates_to_grid
+    def convergence_from_grid(self, grid):
+        """
+        Calculate the convergence at a given set of arc-second gridded coordinates, which is the convergence of the \
+        pixel of the map every coordinate is in and zero outside the map.
+
+        Parameters
+        ----------
+        grid : aa.Grid
+            The grid of (y,x) arc-second coordinates the convergence is computed on.
+        """
+        rows, columns, inside = self.pixel_indexes_from_grid(grid=np.asarray(grid))
+
+        convergence = np.zeros(grid.shape[0])
+        convergence[inside] = self.convergence[rows[inside], columns[inside]]
+
+        return grid.mapping.array_stored_1d_from_sub_array_1d(sub_array_1d=convergence)
+
+    def potential_and_deflections_from_grid(self, grid):
+        """The potential and (y,x) deflection angles at every (y,x) coordinate of a grid, of shape \
+        [total_coordinates, 3]."""
+        grid = np.asarray(grid, dtype="float64")
+
+        y_centres, x_centres = self.pixel_centres
+
+        values = np.zeros((grid.shape[0], 3))
+
+        _, _, inside = self.pixel_indexes_from_grid(grid=grid)
+
+        if np.any(inside):
+            values[inside] = (
+                convergence_map_util.values_via_bilinear_interpolation_from_grid(
+                    np.ascontiguousarray(grid[inside]),
+                    self.maps_2d,
+                    y_centres[0],
+                    x_centres[0],
+                    self.pixel_scales[0],
+                    self.pixel_scales[1],
+                )
+            )
+
+        if not np.all(inside):
+            mass_pixels = self.convergence != 0.0
+            pixel_centres = np.stack(
+                np.broadcast_arrays(y_centres[:, None], x_centres[None, :]), axis=-1
+            )
+            values[~inside] = (
+                convergence_map_util.potential_and_deflections_via_direct_sum_from_grid(
+                    np.ascontiguousarray(grid[~inside]),
+                    np.ascontiguousarray(pixel_centres[mass_pixels]),
+                    self.convergence[mass_pixels]
+                    * self.pixel_scales[0]
+                    * self.pixel_scales[1]
+                    / np.pi,
+                )
+            )
+
+        return values
+
+    @grids.convert_coordinates_to_grid
+    def potential_from_grid(self, grid):
+        """
+        Calculate the lensing potential at a given set of arc-second gridded coordinates.
+
+        Parameters
+        ----------
+        grid : aa.Grid
+            The grid of (y,x) arc-second coordinates the potential is computed on.
+        """
+        potential = self.potential_and_deflections_from_grid(grid=grid)[:, 0]
+        return grid.mapping.array_stored_1d_from_sub_array_1d(sub_array_1d=potential)
+
+    @grids.convert_coordinates_to_grid
+    def deflections_from_grid(self, grid):
+        """
+        Calculate the deflection angles at a given set of arc-second gridded coordinates.
+
+        Parameters
+        ----------
+        grid : aa.Grid
+            The grid of (y,x) arc-second coordinates the deflection angles are computed on.
+        """
+        deflections = self.potential_and_deflections_from_grid(grid=grid)[:, 1:]
+        return grid.mapping.grid_stored_1d_from_sub_grid_1d(sub_grid_1d=deflections)
+
+    def __eq__(self, other):
+        return (
+            self.__class__ is other.__class__
+            and np.array_equal(self.convergence, other.convergence)
+            and self.pixel_scales == other.pixel_scales
+            and self.origin == other.origin
+            and self.unit_length == other.unit_length
+        )
+
+    def __repr__(self):
+        return "{}\nshape_2d: {}\npixel_scales: {}\norigin: {}".format(
+            self.__class__.__name__, self.shape_2d, self.pixel_scales, self.origin
+        )
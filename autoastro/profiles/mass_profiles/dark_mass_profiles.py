@@ -6,14 +6,17 @@ from scipy.optimize import fsolve
 from astropy import cosmology as cosmo
 
 import inspect
+import os
+from functools import lru_cache
 from numba import cfunc
 from numba.types import intc, CPointer, float64
 from scipy import LowLevelCallable
 from scipy import special
+from scipy.interpolate import RectBivariateSpline
 
 import autofit as af
 
-from autoastro.util import cosmology_util
+from autoastro.util import cosmology_util, cse_util
 from autoarray import decorator_util
 from autoarray.structures import arrays, grids
 from autofit.tools import text_util
@@ -93,6 +96,235 @@ def jit_integrand(integrand_function):
     return LowLevelCallable(cf(wrapped).ctypes)
 
 
+# The inner integrands of the generalized NFW profiles, with 1 - sqrt(1 - x^2) written as x^2 / (1 + sqrt(1 - x^2)) so
+# they remain accurate for the small values of x that dominate the integrals when eta / scale_radius is small.
+
+
+@jit_integrand
+def gnfw_surface_density_integrand(x, kappa_radius, scale_radius, inner_slope):
+    return (
+        (3 - inner_slope)
+        * (x + kappa_radius / scale_radius) ** (inner_slope - 4)
+        * (x * x / (1 + np.sqrt(1 - x * x)))
+    )
+
+
+@jit_integrand
+def gnfw_deflection_integrand(x, kappa_radius, scale_radius, inner_slope):
+    return (x + kappa_radius / scale_radius) ** (inner_slope - 3) * (
+        x / (1 + np.sqrt(1 - x * x))
+    )
+
+
+class GeneralizedNFWIntegralTable:
+    def __init__(
+        self, log_eta, inner_slopes, surface_density_integrals, deflection_integrals
+    ):
+        """
+        A 2D lookup table of the inner integrals of the generalized NFW profiles, which depend only on the \
+        dimensionless radius eta / scale_radius and the inner slope of the profile (and not on the grid or kappa_s). \
+        The table is built once and interpolated by every generalized NFW profile, replacing the integrals every \
+        call to *potential_from_grid* and *deflections_from_grid* would otherwise compute with *quad*.
+
+        The logarithm of each integral is interpolated with a bicubic spline, which for the default table of \
+        *from_quadrature* has a fractional error below 1e-5 (and typically ~1e-6). Values of eta / scale_radius or \
+        inner slope outside the table are computed with *quad*.
+
+        Parameters
+        ----------
+        log_eta : ndarray
+            The log10 values of eta / scale_radius the integrals are tabulated at.
+        inner_slopes : ndarray
+            The inner slopes the integrals are tabulated at.
+        surface_density_integrals : ndarray
+            The integrals of *gnfw_surface_density_integrand* over [0, 1], of shape (log_eta, inner_slopes).
+        deflection_integrals : ndarray
+            The integrals of *gnfw_deflection_integrand* over [0, 1], of shape (log_eta, inner_slopes).
+        """
+        self.log_eta = log_eta
+        self.inner_slopes = inner_slopes
+        self.surface_density_integrals = surface_density_integrals
+        self.deflection_integrals = deflection_integrals
+
+        self.surface_density_spline = RectBivariateSpline(
+            log_eta, inner_slopes, np.log(surface_density_integrals)
+        )
+        self.deflection_spline = RectBivariateSpline(
+            log_eta, inner_slopes, np.log(deflection_integrals)
+        )
+
+    @classmethod
+    def from_quadrature(
+        cls,
+        minimum_log_eta=-6.0,
+        maximum_log_eta=5.0,
+        total_eta=221,
+        inner_slopes=np.linspace(0.0, 2.5, 51),
+        epsrel=1.49e-8,
+    ):
+        """Build the table by computing every integral with *quad*."""
+        log_eta = np.linspace(minimum_log_eta, maximum_log_eta, total_eta)
+
+        surface_density_integrals = np.zeros((total_eta, inner_slopes.shape[0]))
+        deflection_integrals = np.zeros((total_eta, inner_slopes.shape[0]))
+
+        for i, eta in enumerate(10.0 ** log_eta):
+            for j, inner_slope in enumerate(inner_slopes):
+                surface_density_integrals[i, j] = quad(
+                    gnfw_surface_density_integrand,
+                    a=0.0,
+                    b=1.0,
+                    args=(eta, 1.0, inner_slope),
+                    points=(min(eta, 0.5),),
+                    epsabs=0.0,
+                    epsrel=epsrel,
+                )[0]
+                deflection_integrals[i, j] = quad(
+                    gnfw_deflection_integrand,
+                    a=0.0,
+                    b=1.0,
+                    args=(eta, 1.0, inner_slope),
+                    points=(min(eta, 0.5),),
+                    epsabs=0.0,
+                    epsrel=epsrel,
+                )[0]
+
+        return GeneralizedNFWIntegralTable(
+            log_eta=log_eta,
+            inner_slopes=inner_slopes,
+            surface_density_integrals=surface_density_integrals,
+            deflection_integrals=deflection_integrals,
+        )
+
+    @classmethod
+    def from_file(cls, file_path):
+        """Load a table previously saved with *save*."""
+        table = np.load(file_path)
+
+        return GeneralizedNFWIntegralTable(
+            log_eta=table["log_eta"],
+            inner_slopes=table["inner_slopes"],
+            surface_density_integrals=table["surface_density_integrals"],
+            deflection_integrals=table["deflection_integrals"],
+        )
+
+    def save(self, file_path):
+        """Save the table to a .npz file, so it can be reloaded with *from_file* instead of being rebuilt. The .npz \
+        extension is appended to *file_path* if it does not end with it, as *np.savez* does."""
+        np.savez(
+            npz_file_path_from_file_path(file_path=file_path),
+            log_eta=self.log_eta,
+            inner_slopes=self.inner_slopes,
+            surface_density_integrals=self.surface_density_integrals,
+            deflection_integrals=self.deflection_integrals,
+        )
+
+    def surface_density_integral_from_eta(self, eta, inner_slope):
+        """The integral of *gnfw_surface_density_integrand* over [0, 1] for an array of eta / scale_radius."""
+        return self.integral_from_eta(
+            eta=eta,
+            inner_slope=inner_slope,
+            spline=self.surface_density_spline,
+            integrand=gnfw_surface_density_integrand,
+        )
+
+    def deflection_integral_from_eta(self, eta, inner_slope):
+        """The integral of *gnfw_deflection_integrand* over [0, 1] for an array of eta / scale_radius."""
+        return self.integral_from_eta(
+            eta=eta,
+            inner_slope=inner_slope,
+            spline=self.deflection_spline,
+            integrand=gnfw_deflection_integrand,
+        )
+
+    def integral_from_eta(self, eta, inner_slope, spline, integrand):
+
+        log_eta = np.log10(eta)
+
+        integral = np.exp(spline.ev(log_eta, np.full(log_eta.shape, inner_slope)))
+
+        outside_table = (log_eta < self.log_eta[0]) | (log_eta > self.log_eta[-1])
+
+        if (inner_slope < self.inner_slopes[0]) or (
+            inner_slope > self.inner_slopes[-1]
+        ):
+            outside_table[:] = True
+
+        for index in np.where(outside_table)[0]:
+            integral[index] = quad(
+                integrand,
+                a=0.0,
+                b=1.0,
+                args=(eta[index], 1.0, inner_slope),
+                points=(min(eta[index], 0.5),),
+                epsabs=0.0,
+                epsrel=AbstractEllipticalGeneralizedNFW.epsrel,
+            )[0]
+
+        return integral
+
+
+def gnfw_integral_table():
+    """The lookup table of the generalized NFW inner integrals shared by every profile.
+
+    The table is built the first time it is needed and held in memory. If *integral_table_path* of \
+    *AbstractEllipticalGeneralizedNFW* is set, the table is loaded from that file if it exists, and otherwise saved \
+    to it once built, so it is only built once across sessions.
+    """
+    file_path = AbstractEllipticalGeneralizedNFW.integral_table_path
+
+    if file_path is not None:
+        file_path = npz_file_path_from_file_path(file_path=file_path)
+
+    if file_path not in gnfw_integral_tables:
+
+        if file_path is not None and os.path.isfile(file_path):
+            table = GeneralizedNFWIntegralTable.from_file(file_path=file_path)
+        else:
+            table = GeneralizedNFWIntegralTable.from_quadrature()
+
+            if file_path is not None:
+                table.save(file_path=file_path)
+
+        gnfw_integral_tables[file_path] = table
+
+    return gnfw_integral_tables[file_path]
+
+
+gnfw_integral_tables = {}
+
+
+def npz_file_path_from_file_path(file_path):
+    """The path *np.savez* writes *file_path* to, which has the .npz extension appended if it is missing."""
+    if file_path.endswith(".npz"):
+        return file_path
+    return file_path + ".npz"
+
+
+@lru_cache(maxsize=128)
+def cse_decomposition_from_inner_slope(inner_slope):
+    """The cored steep ellipsoid (CSE) expansion of the convergence of a generalized NFW profile with kappa_s = 1 \
+    and scale_radius = 1, which is computed once for every inner slope and shared by all profiles with that slope.
+
+    Parameters
+    ----------
+    inner_slope : float
+        The inner slope of the dark matter halo.
+    """
+    if inner_slope == 1.0:
+        profile = EllipticalNFW(kappa_s=1.0, scale_radius=1.0)
+    else:
+        profile = EllipticalGeneralizedNFW(
+            kappa_s=1.0, inner_slope=inner_slope, scale_radius=1.0
+        )
+
+    return cse_util.decomposition_from_convergence(
+        convergence=profile.convergence_func(
+            grid_radius=cse_util.radii_for_decomposition()
+        )
+    )
+
+
 class DarkProfile:
 
     pass
@@ -104,6 +336,13 @@ class AbstractEllipticalGeneralizedNFW(
 ):
     epsrel = 1.49e-5
 
+    # The .npz file the lookup table of the generalized NFW inner integrals is loaded from (or saved to once built),
+    # which is otherwise built in memory the first time it is needed (see *gnfw_integral_table*).
+
+    integral_table_path = None
+
+    result_settings = ("epsrel", "integral_table_path")
+
     @af.map_types
     def __init__(
         self,
@@ -165,6 +404,7 @@ class AbstractEllipticalGeneralizedNFW(
 
     @grids.convert_coordinates_to_grid
     @geometry_profiles.transform_grid
+    @geometry_profiles.tabulate_radially
     @geometry_profiles.move_grid_to_radial_minimum
     def convergence_from_grid(self, grid):
         """ Calculate the projected convergence at a given set of arc-second gridded coordinates.
@@ -577,10 +817,45 @@ class AbstractEllipticalGeneralizedNFW(
     def unit_mass(self):
         return "angular"
 
+    @property
+    def cse_cores_and_amplitudes(self):
+        """The core radii and amplitudes of the CSEs of the profile's cored steep ellipsoid expansion, which is \
+        cached for every profile with the same inner slope."""
+        cores, amplitudes = cse_decomposition_from_inner_slope(
+            inner_slope=float(self.inner_slope)
+        )
+        return (
+            self.scale_radius * cores,
+            self.kappa_s * self.scale_radius ** 2 * amplitudes,
+        )
+
+    def deflections_via_cse_from_grid(self, grid):
+        """
+        Calculate the deflection angles at a given set of arc-second gridded coordinates, by summing the analytic \
+        deflection angles of the profile's cored steep ellipsoid (CSE) expansion.
+
+        This is used by *deflections_from_grid* when the profile's *deflections_engine* is "cse".
+
+        Parameters
+        ----------
+        grid : aa.Grid
+            The grid of (y,x) arc-second coordinates in the profile's reference frame the deflection angles are \
+            computed on.
+        """
+        cores, amplitudes = self.cse_cores_and_amplitudes
+
+        return self.rotate_grid_from_profile(
+            cse_util.deflections_from_grid_and_cses(
+                grid=grid, axis_ratio=self.axis_ratio, cores=cores, amplitudes=amplitudes
+            )
+        )
+
 
 class EllipticalGeneralizedNFW(AbstractEllipticalGeneralizedNFW):
+
     @grids.convert_coordinates_to_grid
     @geometry_profiles.transform_grid
+    @geometry_profiles.tabulate_radially
     @geometry_profiles.move_grid_to_radial_minimum
     def potential_from_grid(self, grid, tabulate_bins=1000):
         """
@@ -595,43 +870,15 @@ class EllipticalGeneralizedNFW(AbstractEllipticalGeneralizedNFW):
 
         """
 
-        @jit_integrand
-        def deflection_integrand(x, kappa_radius, scale_radius, inner_slope):
-            return (x + kappa_radius / scale_radius) ** (inner_slope - 3) * (
-                (1 - np.sqrt(1 - x ** 2)) / x
-            )
-
         eta_min, eta_max, minimum_log_eta, maximum_log_eta, bin_size = self.tabulate_integral(
             grid, tabulate_bins
         )
 
         potential_grid = np.zeros(grid.sub_shape_1d)
 
-        deflection_integral = np.zeros((tabulate_bins,))
+        eta = 10.0 ** (minimum_log_eta + (np.arange(tabulate_bins) - 1) * bin_size)
 
-        for i in range(tabulate_bins):
-            eta = 10.0 ** (minimum_log_eta + (i - 1) * bin_size)
-
-            integral = quad(
-                deflection_integrand,
-                a=0.0,
-                b=1.0,
-                args=(eta, self.scale_radius, self.inner_slope),
-                epsrel=EllipticalGeneralizedNFW.epsrel,
-            )[0]
-
-            deflection_integral[i] = (
-                (eta / self.scale_radius) ** (2 - self.inner_slope)
-            ) * (
-                (1.0 / (3 - self.inner_slope))
-                * special.hyp2f1(
-                    3 - self.inner_slope,
-                    3 - self.inner_slope,
-                    4 - self.inner_slope,
-                    -(eta / self.scale_radius),
-                )
-                + integral
-            )
+        deflection_integral = self.deflection_func_sph(eta=eta / self.scale_radius)
 
         for i in range(grid.sub_shape_1d):
             potential_grid[i] = (2.0 * self.kappa_s * self.axis_ratio) * quad(
@@ -670,13 +917,8 @@ class EllipticalGeneralizedNFW(AbstractEllipticalGeneralizedNFW):
 
         """
 
-        @jit_integrand
-        def surface_density_integrand(x, kappa_radius, scale_radius, inner_slope):
-            return (
-                (3 - inner_slope)
-                * (x + kappa_radius / scale_radius) ** (inner_slope - 4)
-                * (1 - np.sqrt(1 - x * x))
-            )
+        if self.deflections_engine == "cse":
+            return self.deflections_via_cse_from_grid(grid=grid)
 
         def calculate_deflection_component(npow, index):
             deflection_grid = 2.0 * self.kappa_s * self.axis_ratio * grid[:, index]
@@ -702,57 +944,53 @@ class EllipticalGeneralizedNFW(AbstractEllipticalGeneralizedNFW):
             grid, tabulate_bins
         )
 
-        surface_density_integral = np.zeros((tabulate_bins,))
+        eta = (
+            10.0 ** (minimum_log_eta + (np.arange(tabulate_bins) - 1) * bin_size)
+        ) / self.scale_radius
 
-        for i in range(tabulate_bins):
-            eta = 10.0 ** (minimum_log_eta + (i - 1) * bin_size)
-
-            integral = quad(
-                surface_density_integrand,
-                a=0.0,
-                b=1.0,
-                args=(eta, self.scale_radius, self.inner_slope),
-                epsrel=EllipticalGeneralizedNFW.epsrel,
-            )[0]
-
-            surface_density_integral[i] = (
-                (eta / self.scale_radius) ** (1 - self.inner_slope)
-            ) * (((1 + eta / self.scale_radius) ** (self.inner_slope - 3)) + integral)
+        surface_density_integral = (eta ** (1 - self.inner_slope)) * (
+            ((1 + eta) ** (self.inner_slope - 3))
+            + gnfw_integral_table().surface_density_integral_from_eta(
+                eta=eta, inner_slope=self.inner_slope
+            )
+        )
 
         deflection_y = calculate_deflection_component(1.0, 0)
         deflection_x = calculate_deflection_component(0.0, 1)
 
-        return self.rotate_grid_from_profile(
-            np.multiply(1.0, np.vstack((deflection_y, deflection_x)).T)
+        return self.rotate_grid_from_profile(np.vstack((deflection_y, deflection_x)).T)
+
+    def deflection_func_sph(self, eta):
+        """The dimensionless integral over the convergence that gives the deflection angles of the spherical \
+        profile (and the potential of the elliptical profile), for an array of eta / scale_radius, using the \
+        tabulated inner integral *gnfw_integral_table*."""
+        return eta ** (2 - self.inner_slope) * (
+            (1.0 / (3 - self.inner_slope))
+            * special.hyp2f1(
+                3 - self.inner_slope, 3 - self.inner_slope, 4 - self.inner_slope, -eta
+            )
+            + gnfw_integral_table().deflection_integral_from_eta(
+                eta=eta, inner_slope=self.inner_slope
+            )
         )
 
     def convergence_func(self, grid_radius):
-        def integral_y(y, eta):
-            return (y + eta) ** (self.inner_slope - 4) * (1 - np.sqrt(1 - y ** 2))
 
-        grid_radius = (1.0 / self.scale_radius) * grid_radius
+        eta = np.atleast_1d((1.0 / self.scale_radius) * np.asarray(grid_radius))
 
-        for index in range(grid_radius.shape[0]):
-
-            integral_y_value = quad(
-                integral_y,
-                a=0.0,
-                b=1.0,
-                args=grid_radius[index],
-                epsrel=EllipticalGeneralizedNFW.epsrel,
-            )[0]
-
-            grid_radius[index] = (
-                2.0
-                * self.kappa_s
-                * (grid_radius[index] ** (1 - self.inner_slope))
-                * (
-                    (1 + grid_radius[index]) ** (self.inner_slope - 3)
-                    + ((3 - self.inner_slope) * integral_y_value)
+        convergence = (
+            2.0
+            * self.kappa_s
+            * (eta ** (1 - self.inner_slope))
+            * (
+                (1 + eta) ** (self.inner_slope - 3)
+                + gnfw_integral_table().surface_density_integral_from_eta(
+                    eta=eta, inner_slope=self.inner_slope
                 )
             )
+        )
 
-        return grid_radius
+        return convergence.reshape(np.shape(grid_radius))[()]
 
     @staticmethod
     # TODO : Decorator needs to know that potential_integral is 1D arrays
@@ -842,6 +1080,7 @@ class SphericalGeneralizedNFW(EllipticalGeneralizedNFW):
     @grids.grid_interpolate
     @geometry_profiles.cache
     @geometry_profiles.transform_grid
+    @geometry_profiles.tabulate_radially
     @geometry_profiles.move_grid_to_radial_minimum
     def deflections_from_grid(self, grid, **kwargs):
         """
@@ -853,37 +1092,17 @@ class SphericalGeneralizedNFW(EllipticalGeneralizedNFW):
             The grid of (y,x) arc-second coordinates the deflection angles are computed on.
         """
 
-        eta = np.multiply(1.0 / self.scale_radius, self.grid_to_grid_radii(grid))
+        if self.deflections_engine == "cse":
+            return self.deflections_via_cse_from_grid(grid=grid)
 
-        deflection_grid = np.zeros(grid.sub_shape_1d)
+        eta = np.multiply(1.0 / self.scale_radius, self.grid_to_grid_radii(grid))
 
-        for i in range(grid.sub_shape_1d):
-            deflection_grid[i] = np.multiply(
-                4.0 * self.kappa_s * self.scale_radius, self.deflection_func_sph(eta[i])
-            )
+        deflection_grid = np.multiply(
+            4.0 * self.kappa_s * self.scale_radius, self.deflection_func_sph(eta=eta)
+        )
 
         return self.grid_to_grid_cartesian(grid, deflection_grid)
 
-    @staticmethod
-    def deflection_integrand(y, eta, inner_slope):
-        return (y + eta) ** (inner_slope - 3) * ((1 - np.sqrt(1 - y ** 2)) / y)
-
-    def deflection_func_sph(self, eta):
-        integral_y_2 = quad(
-            self.deflection_integrand,
-            a=0.0,
-            b=1.0,
-            args=(eta, self.inner_slope),
-            epsrel=1.49e-6,
-        )[0]
-        return eta ** (2 - self.inner_slope) * (
-            (1.0 / (3 - self.inner_slope))
-            * special.hyp2f1(
-                3 - self.inner_slope, 3 - self.inner_slope, 4 - self.inner_slope, -eta
-            )
-            + integral_y_2
-        )
-
 
 class SphericalTruncatedNFW(AbstractEllipticalGeneralizedNFW):
     @af.map_types
@@ -1203,12 +1422,17 @@ class EllipticalNFW(AbstractEllipticalGeneralizedNFW):
 
     @staticmethod
     def coord_func(r):
-        if r > 1:
-            return (1.0 / np.sqrt(r ** 2 - 1)) * np.arctan(np.sqrt(r ** 2 - 1))
-        elif r < 1:
-            return (1.0 / np.sqrt(1 - r ** 2)) * np.arctanh(np.sqrt(1 - r ** 2))
-        elif r == 1:
-            return 1
+        r = np.asarray(r, dtype="float64")
+        with np.errstate(all="ignore"):
+            return np.where(
+                r > 1,
+                (1.0 / np.sqrt(r ** 2 - 1)) * np.arctan(np.sqrt(r ** 2 - 1)),
+                np.where(
+                    r < 1,
+                    (1.0 / np.sqrt(1 - r ** 2)) * np.arctanh(np.sqrt(1 - r ** 2)),
+                    1.0,
+                ),
+            )[()]
 
     @grids.convert_coordinates_to_grid
     @geometry_profiles.transform_grid
@@ -1250,17 +1474,19 @@ class EllipticalNFW(AbstractEllipticalGeneralizedNFW):
 
         """
 
+        if self.deflections_engine == "cse":
+            return self.deflections_via_cse_from_grid(grid=grid)
+
         def calculate_deflection_component(npow, index):
             deflection_grid = self.axis_ratio * grid[:, index]
             deflection_grid *= (
                 self.kappa_s
-                * quad_grid(
-                    self.deflection_func,
-                    0.0,
-                    1.0,
-                    grid,
+                * self.deflection_integral_from_grid(
+                    grid=grid,
+                    func=self.deflection_func,
                     args=(npow, self.axis_ratio, self.scale_radius),
-                )[0]
+                    func_vectorized=self.deflection_func_vectorized,
+                )
             )
 
             return deflection_grid
@@ -1268,13 +1494,26 @@ class EllipticalNFW(AbstractEllipticalGeneralizedNFW):
         deflection_y = calculate_deflection_component(1.0, 0)
         deflection_x = calculate_deflection_component(0.0, 1)
 
-        return self.rotate_grid_from_profile(
-            np.multiply(1.0, np.vstack((deflection_y, deflection_x)).T)
-        )
+        return self.rotate_grid_from_profile(np.vstack((deflection_y, deflection_x)).T)
+
+    @staticmethod
+    def coord_func_g_float64(r):
+        """The function g(r) = (1 - F(r)) / (r^2 - 1) of the NFW convergence, evaluated in float64 on an array of \
+        radii in units of the scale radius, where F is *coord_func* and g(1) = 1/3."""
+        r = np.asarray(r, dtype="float64")
+        with np.errstate(all="ignore"):
+            return np.where(
+                r == 1, 1.0 / 3.0, (1 - EllipticalNFW.coord_func(r)) / (r ** 2 - 1)
+            )[()]
 
     def convergence_func(self, grid_radius):
-        grid_radius = (1.0 / self.scale_radius) * grid_radius + 0j
-        return np.real(2.0 * self.kappa_s * self.coord_func_g(grid_radius=grid_radius))
+        return (
+            2.0
+            * self.kappa_s
+            * self.coord_func_g_float64(
+                (1.0 / self.scale_radius) * np.asarray(grid_radius)
+            )
+        )
 
     @staticmethod
     def potential_func(u, y, x, axis_ratio, kappa_s, scale_radius):
@@ -1327,6 +1566,20 @@ class EllipticalNFW(AbstractEllipticalGeneralizedNFW):
             / ((1 - (1 - axis_ratio ** 2) * u) ** (npow + 0.5))
         )
 
+    @staticmethod
+    def deflection_func_vectorized(u, y, x, npow, axis_ratio, scale_radius):
+        """The integrand of *deflection_func* evaluated on NumPy arrays of u, y and x, which is used by the \
+        gauss_legendre deflections engine."""
+        eta_u = (1.0 / scale_radius) * np.sqrt(
+            (u * ((x ** 2) + (y ** 2 / (1 - (1 - axis_ratio ** 2) * u))))
+        )
+
+        return (
+            2.0
+            * EllipticalNFW.coord_func_g_float64(eta_u)
+            / ((1 - (1 - axis_ratio ** 2) * u) ** (npow + 0.5))
+        )
+
 
 class SphericalNFW(EllipticalNFW):
     @af.map_types
@@ -1402,6 +1655,37 @@ class SphericalNFW(EllipticalNFW):
 
         return self.grid_to_grid_cartesian(grid, deflection_r)
 
+    def hessian_from_grid(self, grid):
+        """
+        Calculate the Hessian of the lensing potential at a given set of arc-second gridded coordinates.
+
+        For a spherical profile the shear is the difference between the convergence and the mean convergence within \
+        the radius of each coordinate, |alpha| / r, which gives the complex shear gamma = (kappa * z - alpha) / z* \
+        from the analytic convergence and deflection angles, where z = x + iy relative to the profile centre.
+
+        Parameters
+        ----------
+        grid : aa.Grid
+            The grid of (y,x) arc-second coordinates the Hessian is computed on.
+        """
+        convergence = np.asarray(self.convergence_from_grid(grid=grid))
+        deflections = np.asarray(self.deflections_from_grid(grid=grid))
+
+        z = (np.asarray(grid)[:, 1] - self.centre[1]) + 1j * (
+            np.asarray(grid)[:, 0] - self.centre[0]
+        )
+
+        with np.errstate(all="ignore"):
+            shear = (
+                convergence * z - (deflections[:, 1] + 1j * deflections[:, 0])
+            ) / np.conj(z)
+
+        shear[z == 0.0] = 0.0
+
+        return self.hessian_from_convergence_and_shear(
+            grid=grid, convergence=convergence, shear=shear
+        )
+
     @staticmethod
     def potential_func_sph(eta):
         return ((np.log(eta / 2.0)) ** 2) - (np.arctanh(np.sqrt(1 - eta ** 2))) ** 2
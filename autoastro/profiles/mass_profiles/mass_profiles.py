@@ -1,10 +1,14 @@
+import warnings
+
 import numpy as np
+from pyquad import quad_grid
 from scipy.integrate import quad
 from scipy.optimize import root_scalar
 from astropy import cosmology as cosmo
 
 import autofit as af
-from autoastro.util import cosmology_util
+from autoastro.util import cosmology_util, quadrature_util
+from autoastro import exc
 from autoastro import lensing
 from autoastro import dimensions as dim
 from autofit.tools import text_util
@@ -12,10 +16,92 @@ from autoastro.profiles import geometry_profiles
 
 
 class MassProfile(lensing.LensingObject):
+
+    # The maximum number of (profile, coordinate) pairs whose deflection angles are computed at once by
+    # *deflections_from_grid_batch*, which bounds the memory used by the intermediate arrays of a batch.
+    batch_max_elements = 2 ** 22
+
     @property
     def mass_profiles(self):
         return [self]
 
+    @classmethod
+    def deflections_from_grid_batch(cls, grid, params_array):
+        """Calculate the deflection angles of a batch of profiles of this class, one for every row of \
+        *params_array*, on the same grid of (y,x) arc-second coordinates.
+
+        Profiles with a vectorized implementation of *deflections_from_grid_and_batch_parameters* compute every \
+        profile of the batch in one NumPy broadcast (in chunks of at most *batch_max_elements* deflection angles), \
+        without constructing the profiles. Other profiles fall back to constructing and evaluating every profile.
+
+        Parameters
+        ----------
+        grid : aa.Grid
+            The grid of (y,x) arc-second coordinates the deflection angles are computed on.
+        params_array : ndarray
+            The parameters of every profile, of shape [total_profiles, total_parameters], with the columns ordered \
+            as the profile's *batch_parameter_names* (e.g. centre_0, centre_1, axis_ratio, phi, einstein_radius).
+
+        Returns
+        -------
+        ndarray
+            The (y,x) deflection angles of every profile at every (sub-)pixel of the grid, of shape \
+            [total_profiles, total_coordinates, 2].
+        """
+        params_array = np.asarray(params_array, dtype="float64")
+
+        cls.batch_parameters_from_params_array(params_array=params_array)
+
+        total_coordinates = np.asarray(grid).shape[0]
+
+        deflections = np.zeros((params_array.shape[0], total_coordinates, 2))
+
+        profiles_per_chunk = max(cls.batch_max_elements // max(total_coordinates, 1), 1)
+
+        for start in range(0, params_array.shape[0], profiles_per_chunk):
+
+            parameters = cls.batch_parameters_from_params_array(
+                params_array=params_array[start : start + profiles_per_chunk]
+            )
+
+            deflections[start : start + profiles_per_chunk] = (
+                cls.deflections_from_grid_and_batch_parameters(
+                    grid=grid, parameters=parameters
+                )
+            )
+
+        return deflections
+
+    @classmethod
+    def deflections_from_grid_and_batch_parameters(cls, grid, parameters):
+        """Calculate the deflection angles of a batch of profiles of this class, whose constructor arguments are \
+        given as the columns of *parameters* (see *batch_parameters_from_params_array*).
+
+        This default constructs and evaluates every profile of the batch, and is overridden by profiles with a \
+        vectorized implementation.
+        """
+        column = next(iter(parameters.values()))
+        total_profiles = (column[0] if isinstance(column, tuple) else column).shape[0]
+
+        def argument(value, index):
+            if isinstance(value, tuple):
+                return tuple(float(column[index, 0]) for column in value)
+            return float(value[index, 0])
+
+        return np.stack(
+            [
+                np.asarray(
+                    cls(
+                        **{
+                            name: argument(value=value, index=index)
+                            for name, value in parameters.items()
+                        }
+                    ).deflections_from_grid(grid=grid)
+                )
+                for index in range(total_profiles)
+            ]
+        )
+
     @property
     def has_mass_profile(self):
         return True
@@ -28,57 +114,16 @@ class MassProfile(lensing.LensingObject):
     def ellipticity_rescale(self):
         return NotImplementedError()
 
-    def summarize_in_units(
-        self,
-        radii,
-        prefix="",
-        unit_length="arcsec",
-        unit_mass="solMass",
-        redshift_profile=None,
-        redshift_source=None,
-        cosmology=cosmo.Planck15,
-        whitespace=80,
-    ):
-        return ["Mass Profile = {}\n".format(self.__class__.__name__)]
-
-    @property
-    def is_mass_sheet(self):
-        return False
-
-
-# noinspection PyAbstractClass
-class EllipticalMassProfile(geometry_profiles.EllipticalProfile, MassProfile):
-    @af.map_types
-    def __init__(
-        self,
-        centre: dim.Position = (0.0, 0.0),
-        axis_ratio: float = 1.0,
-        phi: float = 0.0,
-    ):
-        """
-        Abstract class for elliptical mass profiles.
+    def mass_within_circle(self, radius):
+        """Integrate the mass profile's convergence within a circle of the input radius centred on the mass profile, \
+        in the profile's angular units.
 
         Parameters
         ----------
-        centre: (float, float)
-            The (y,x) arc-second coordinates of the profile centre.
-        axis_ratio : float
-            Ellipse's minor-to-major axis ratio (b/a)
-        phi : float
-            Rotation angle of profile's ellipse counter-clockwise from positive x-axis
+        radius : float
+            The radius of the circle.
         """
-        super(EllipticalMassProfile, self).__init__(
-            centre=centre, axis_ratio=axis_ratio, phi=phi
-        )
-        self.axis_ratio = axis_ratio
-        self.phi = phi
-
-    @property
-    def mass_profile_centres(self):
-        if not self.is_mass_sheet:
-            return [self.centre]
-        else:
-            return []
+        return quad(self.mass_integral, a=0.0, b=radius)[0]
 
     def mass_within_circle_in_units(
         self,
@@ -121,7 +166,7 @@ class EllipticalMassProfile(geometry_profiles.EllipticalProfile, MassProfile):
             )
 
         mass = dim.Mass(
-            value=quad(self.mass_integral, a=0.0, b=radius)[0], unit_mass=self.unit_mass
+            value=self.mass_within_circle(radius=radius), unit_mass=self.unit_mass
         )
 
         if unit_mass is "solMass":
@@ -142,6 +187,129 @@ class EllipticalMassProfile(geometry_profiles.EllipticalProfile, MassProfile):
             unit_mass=unit_mass, critical_surface_density=critical_surface_density
         )
 
+    def summarize_in_units(
+        self,
+        radii,
+        prefix="",
+        unit_length="arcsec",
+        unit_mass="solMass",
+        redshift_profile=None,
+        redshift_source=None,
+        cosmology=cosmo.Planck15,
+        whitespace=80,
+    ):
+        return ["Mass Profile = {}\n".format(self.__class__.__name__)]
+
+    @property
+    def is_mass_sheet(self):
+        return False
+
+
+# noinspection PyAbstractClass
+class EllipticalMassProfile(geometry_profiles.EllipticalProfile, MassProfile):
+
+    # The engine used to compute the 1D integrals of profiles whose deflection angles are computed via integration
+    # (quad_grid | gauss_legendre), and the fractional accuracy the gauss_legendre engine chooses its order for. Sersic
+    # profiles also support a multi-Gaussian expansion (mge) of their convergence and (generalized) NFW profiles a cored
+    # steep ellipsoid expansion (cse).
+
+    deflections_engine = "quad_grid"
+    deflections_tolerance = 1.0e-6
+
+    result_settings = ("deflections_engine", "deflections_tolerance")
+
+    @af.map_types
+    def __init__(
+        self,
+        centre: dim.Position = (0.0, 0.0),
+        axis_ratio: float = 1.0,
+        phi: float = 0.0,
+    ):
+        """
+        Abstract class for elliptical mass profiles.
+
+        Parameters
+        ----------
+        centre: (float, float)
+            The (y,x) arc-second coordinates of the profile centre.
+        axis_ratio : float
+            Ellipse's minor-to-major axis ratio (b/a)
+        phi : float
+            Rotation angle of profile's ellipse counter-clockwise from positive x-axis
+        """
+        super(EllipticalMassProfile, self).__init__(
+            centre=centre, axis_ratio=axis_ratio, phi=phi
+        )
+        self.axis_ratio = axis_ratio
+        self.phi = phi
+
+    @property
+    def circularized_radius_rescale(self):
+        """The convergence of an elliptical mass profile is a function of its elliptical radius, the semi-major axis \
+        of an ellipse with the same area as a circle of radius sqrt(axis_ratio) times its semi-major axis."""
+        return np.sqrt(self.axis_ratio)
+
+    def deflection_integral_from_grid(self, grid, func, args, func_vectorized=None):
+        """ Integrate the deflection angle integrand of an elliptical mass profile over u in [0, 1] for every \
+        (y,x) coordinate on a grid, using the profile's *deflections_engine*:
+
+        - quad_grid: adaptive quadrature of every coordinate using *pyquad.quad_grid*, which is the reference \
+          calculation.
+        - gauss_legendre: a fixed-order Gauss-Legendre rule evaluated for all coordinates in one vectorized call, \
+          whose order is chosen such that the integral is accurate to *deflections_tolerance*. If no order up to \
+          *quadrature_util.maximum_order* meets the tolerance a warning is raised and quad_grid is used instead.
+        - mge: profiles whose multi-Gaussian expansion is not accurate integrate with quad_grid instead.
+
+        Parameters
+        ----------
+        grid : aa.Grid
+            The grid of (y,x) arc-second coordinates in the reference frame of the profile.
+        func : (u, y, x, *args) -> float
+            The integrand, which is compiled by *pyquad* for each (y,x) coordinate.
+        args : tuple
+            The additional arguments passed to the integrand.
+        func_vectorized : (u, y, x, *args) -> ndarray or None
+            A version of the integrand that accepts NumPy arrays, if *func* cannot.
+        """
+        if self.deflections_engine in ("quad_grid", "mge"):
+            return quad_grid(func, 0.0, 1.0, grid, args=args)[0]
+        elif self.deflections_engine == "gauss_legendre":
+
+            func_grid = func_vectorized if func_vectorized is not None else func
+
+            order, converged = quadrature_util.order_from_tolerance(
+                func=func_grid,
+                grid=grid,
+                args=args,
+                tolerance=self.deflections_tolerance,
+            )
+
+            if not converged:
+                warnings.warn(
+                    "The Gauss-Legendre deflection angles of {} do not meet the tolerance {:.1e} at the maximum "
+                    "order {}, so they are integrated with quad_grid instead".format(
+                        self.__class__.__name__,
+                        self.deflections_tolerance,
+                        quadrature_util.maximum_order,
+                    )
+                )
+                return quad_grid(func, 0.0, 1.0, grid, args=args)[0]
+
+            return quadrature_util.integral_from_grid(
+                func=func_grid, grid=grid, args=args, order=order
+            )
+
+        raise exc.ProfileException(
+            f"The deflections engine {self.deflections_engine} is not supported by {self.__class__.__name__}"
+        )
+
+    @property
+    def mass_profile_centres(self):
+        if not self.is_mass_sheet:
+            return [self.centre]
+        else:
+            return []
+
     def density_between_circular_annuli_in_angular_units(
         self,
         inner_annuli_radius: dim.Length,
@@ -25,7 +25,7 @@ class MassSheet(geometry_profiles.SphericalProfile, mp.MassProfile):
         self.kappa = kappa
 
     def convergence_func(self, grid_radius):
-        return 0.0
+        return np.zeros(shape=np.shape(grid_radius))
 
     @grids.convert_coordinates_to_grid
     def convergence_from_grid(self, grid):
@@ -33,6 +33,9 @@ class MassSheet(geometry_profiles.SphericalProfile, mp.MassProfile):
             sub_array_1d=np.full(shape=grid.sub_shape_1d, fill_value=self.kappa)
         )
 
+    def mass_within_circularized_radius(self, radius):
+        return np.pi * self.kappa * radius ** 2.0
+
     @grids.convert_coordinates_to_grid
     def potential_from_grid(self, grid):
         return grid.mapping.array_stored_1d_from_sub_array_1d(
@@ -46,6 +49,13 @@ class MassSheet(geometry_profiles.SphericalProfile, mp.MassProfile):
         grid_radii = self.grid_to_grid_radii(grid=grid)
         return self.grid_to_grid_cartesian(grid=grid, radius=self.kappa * grid_radii)
 
+    def hessian_from_grid(self, grid):
+        return self.hessian_from_convergence_and_shear(
+            grid=grid,
+            convergence=np.full(shape=grid.sub_shape_1d, fill_value=self.kappa),
+            shear=np.zeros(shape=grid.sub_shape_1d, dtype="complex128"),
+        )
+
     @property
     def is_mass_sheet(self):
         return True
@@ -73,7 +83,7 @@ class ExternalShear(geometry_profiles.EllipticalProfile, mp.MassProfile):
         self.magnitude = magnitude
 
     def convergence_func(self, grid_radius):
-        return 0.0
+        return np.zeros(shape=np.shape(grid_radius))
 
     def average_convergence_of_1_radius_in_units(
         self,
@@ -112,3 +122,13 @@ class ExternalShear(geometry_profiles.EllipticalProfile, mp.MassProfile):
         deflection_y = -np.multiply(self.magnitude, grid[:, 0])
         deflection_x = np.multiply(self.magnitude, grid[:, 1])
         return self.rotate_grid_from_profile(np.vstack((deflection_y, deflection_x)).T)
+
+    def hessian_from_grid(self, grid):
+        return self.hessian_from_convergence_and_shear(
+            grid=grid,
+            convergence=np.zeros(shape=grid.sub_shape_1d),
+            shear=np.full(
+                shape=grid.sub_shape_1d,
+                fill_value=self.magnitude * np.exp(2j * np.radians(self.phi)),
+            ),
+        )
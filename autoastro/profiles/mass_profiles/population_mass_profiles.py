@@ -0,0 +1,490 @@
+import numpy as np
+
+from autoarray import decorator_util
+from autoarray.structures import grids
+from autoastro import exc
+from autoastro.util import multipole_util
+from autoastro.profiles import geometry_profiles
+from autoastro.profiles import mass_profiles as mp
+from autoastro.profiles.mass_profiles import dark_mass_profiles as dmp
+from autoastro.profiles.mass_profiles import total_mass_profiles as tmp
+
+"""
+Populations of many spherical mass profiles of the same type, such as the subhalos of a lens galaxy, whose parameters \
+are stored as contiguous arrays (one entry per member) rather than as one profile object per member.
+
+The convergence and deflection angles of every member are computed by a single compiled kernel, which loops over the \
+members and (y,x) coordinates and sums their contributions into one output array, without the decorators and \
+temporary arrays of evaluating every member as its own profile. Every member can be restricted to the coordinates \
+within a cutoff radius of its centre, beyond which its contribution is neglected.
+
+For populations of thousands of members, the deflection angles can instead be computed with a Barnes-Hut tree (see \
+*multipole_util*), which approximates groups of distant members by the multipole expansion of their mass.
+"""
+
+
+class AbstractMassPopulation(mp.MassProfile):
+
+    # The profile class of every member of the population, whose radial minimum is used for the members.
+    member_class = None
+
+    # The member type of the population in *multipole_util*.
+    member_type = None
+
+    # The attributes of the population which are lengths, and are converted when its unit of length is converted.
+    length_attributes = ("centres", "cutoff_radius")
+
+    # How the deflection angles of the members are summed (direct | tree). The direct engine computes every member at
+    # every coordinate. The tree engine approximates nodes of a Barnes-Hut tree of the members by multipole expansions
+    # of order tree_multipole_order when their radius is less than tree_opening_angle times their distance, which is
+    # its accuracy parameter, and splits the members into leaves of at most tree_leaf_size members. The mass outside the
+    # truncation radius of truncated NFW members is added by a tail expansion of order tree_tail_order, and members
+    # closer than the distance where this is accurate to a fractional tree_member_tolerance are computed exactly.
+    # For 5000 point-masses the maximum fractional error of the deflection angles is ~1e-4 for an opening angle of 0.5,
+    # ~1e-3 for 0.7 and tens of percent for 1.0, so the opening angle must be below 1.0.
+    deflections_engine = "direct"
+    tree_opening_angle = 0.5
+    tree_member_tolerance = 1.0e-3
+    tree_multipole_order = 8
+    tree_tail_order = 4
+    tree_leaf_size = 8
+
+    def __init__(self, centres, cutoff_radius=None):
+        """ An abstract population of spherical mass profiles.
+
+        Parameters
+        ----------
+        centres : ndarray
+            The (y,x) arc-second coordinates of the centre of every member, of shape [total_members, 2].
+        cutoff_radius : float or None
+            Every member only contributes to the (y,x) coordinates within this radius of its centre. If None, every \
+            member contributes to every coordinate.
+        """
+        self.centres = np.ascontiguousarray(centres, dtype="float64").reshape(-1, 2)
+        self.cutoff_radius = cutoff_radius
+        self._unit_length = "arcsec"
+
+    def member_arrays_from_values(self, **values):
+        """Convert the parameter of every member to a contiguous array, checking there is one value per member."""
+        arrays = {
+            name: np.ascontiguousarray(value, dtype="float64").reshape(-1)
+            for name, value in values.items()
+        }
+
+        for name, array in arrays.items():
+            if array.shape[0] != self.total_members:
+                raise exc.ProfileException(
+                    "The {} of a {} must have one entry for each of its {} members".format(
+                        name, self.__class__.__name__, self.total_members
+                    )
+                )
+
+        return arrays
+
+    @property
+    def total_members(self):
+        return self.centres.shape[0]
+
+    @property
+    def centre(self):
+        """A population has no single centre, so it is not included in the centres of the galaxy's mass profiles \
+        (the centres of its members are given by *mass_profile_centres*)."""
+        return None
+
+    @property
+    def mass_profile_centres(self):
+        return [tuple(centre) for centre in self.centres]
+
+    @property
+    def unit_length(self):
+        return self._unit_length
+
+    @property
+    def unit_mass(self):
+        return "angular"
+
+    @property
+    def cutoff_radius_squared(self):
+        return np.inf if self.cutoff_radius is None else float(self.cutoff_radius) ** 2
+
+    @property
+    def radial_minimum(self):
+        return geometry_profiles.radial_minimum_from_class(cls=self.member_class)
+
+    def new_object_with_units_converted(
+        self,
+        unit_length=None,
+        unit_luminosity=None,
+        unit_mass=None,
+        kpc_per_arcsec=None,
+        exposure_time=None,
+        critical_surface_density=None,
+    ):
+        """Convert the lengths of the population to a new unit of length, which multiplies (or divides) every length \
+        of every member by the number of kpc per arc-second. Its other parameters are dimensionless."""
+        new_population = self.__class__.__new__(self.__class__)
+        new_population.__dict__.update(self.__dict__)
+
+        if unit_length is None or unit_length == self.unit_length:
+            return new_population
+
+        if kpc_per_arcsec is None:
+            raise exc.ProfileException(
+                "The kpc_per_arcsec must be input to convert a {} to {}".format(
+                    self.__class__.__name__, unit_length
+                )
+            )
+
+        if unit_length == "kpc":
+            factor = kpc_per_arcsec
+        elif unit_length == "arcsec":
+            factor = 1.0 / kpc_per_arcsec
+        else:
+            raise exc.ProfileException(
+                "The unit_length {} is not supported".format(unit_length)
+            )
+
+        for name in self.length_attributes:
+            value = getattr(self, name)
+            if value is not None:
+                setattr(new_population, name, factor * value)
+
+        new_population._unit_length = unit_length
+
+        return new_population
+
+    @grids.convert_coordinates_to_grid
+    def convergence_from_grid(self, grid):
+        """
+        Calculate the summed convergence of every member of the population at a given set of arc-second gridded \
+        coordinates.
+
+        Parameters
+        ----------
+        grid : aa.Grid
+            The grid of (y,x) arc-second coordinates the convergence is computed on.
+        """
+        convergence = self.convergence_from_kernel(
+            grid=np.asarray(grid, dtype="float64"),
+            convergence=np.zeros(grid.shape[0]),
+        )
+        return grid.mapping.array_stored_1d_from_sub_array_1d(sub_array_1d=convergence)
+
+    @grids.convert_coordinates_to_grid
+    def deflections_from_grid(self, grid):
+        """
+        Calculate the summed deflection angles of every member of the population at a given set of arc-second \
+        gridded coordinates.
+
+        Parameters
+        ----------
+        grid : aa.Grid
+            The grid of (y,x) arc-second coordinates the deflection angles are computed on.
+        """
+        deflections = self.deflections_from_kernel(
+            grid=np.asarray(grid, dtype="float64"),
+            deflections=np.zeros((grid.shape[0], 2)),
+        )
+        return grid.mapping.grid_stored_1d_from_sub_grid_1d(sub_grid_1d=deflections)
+
+    def convergence_from_kernel(self, grid, convergence):
+        raise NotImplementedError("convergence_from_kernel should be overridden")
+
+    def mass_within_circularized_radius(self, radius):
+        """The summed mass of every member within a circle of the input radius centred on that member, in angular \
+        units.
+
+        Every member is spherical, so its mass within a radius r is pi * r times its deflection angle at r, which is \
+        closed-form for every member type. Members do not contribute beyond the cutoff radius of their centre.
+
+        Parameters
+        ----------
+        radius : float
+            The radius of the circle around every member.
+        """
+        radius = float(radius)
+
+        if self.cutoff_radius is not None:
+            radius = min(radius, float(self.cutoff_radius))
+
+        radii = np.full(self.total_members, radius)
+
+        return np.sum(
+            np.pi
+            * radii
+            * multipole_util.member_radial_deflections_from_radii(
+                self.member_parameters, self.member_type, radii
+            )
+        )
+
+    def mass_within_circle(self, radius):
+        """Every member is spherical, so the circle of the input radius centred on every member encloses the same \
+        mass as its circularized radius."""
+        return self.mass_within_circularized_radius(radius=radius)
+
+    @property
+    def member_parameters(self):
+        raise NotImplementedError("member_parameters should be overridden")
+
+    def deflections_from_kernel(self, grid, deflections):
+        """Add the deflection angles of every member to *deflections*, using the *deflections_engine*."""
+        member_parameters = self.member_parameters
+
+        cutoff_radius = np.inf if self.cutoff_radius is None else self.cutoff_radius
+
+        if self.deflections_engine == "direct":
+            return multipole_util.deflections_via_direct_sum_from_grid(
+                grid,
+                self.centres,
+                member_parameters,
+                self.member_type,
+                self.radial_minimum,
+                float(cutoff_radius),
+                deflections,
+            )
+        elif self.deflections_engine == "tree":
+
+            if not 0.0 < self.tree_opening_angle < 1.0:
+                raise exc.ProfileException(
+                    "The tree_opening_angle of a {} must be between 0.0 and 1.0, but is {}".format(
+                        self.__class__.__name__, self.tree_opening_angle
+                    )
+                )
+
+            member_tail_weights, member_extents = (
+                multipole_util.member_tails_from_parameters(
+                    member_parameters=member_parameters,
+                    member_type=self.member_type,
+                    tolerance=self.tree_member_tolerance,
+                )
+            )
+            tree = multipole_util.tree_from_members(
+                member_centres=self.centres,
+                member_masses=multipole_util.member_masses_from_parameters(
+                    member_parameters=member_parameters, member_type=self.member_type
+                ),
+                member_tail_weights=member_tail_weights,
+                member_extents=member_extents,
+                leaf_size=self.tree_leaf_size,
+                order=self.tree_multipole_order,
+                tail_order=self.tree_tail_order,
+            )
+            return multipole_util.deflections_via_tree_from_grid(
+                grid,
+                self.centres,
+                member_parameters,
+                self.member_type,
+                self.radial_minimum,
+                float(cutoff_radius),
+                float(self.tree_opening_angle),
+                *tree,
+                deflections,
+            )
+
+        raise exc.ProfileException(
+            "The deflections_engine {} is not supported by the {} profile".format(
+                self.deflections_engine, self.__class__.__name__
+            )
+        )
+
+    def __eq__(self, other):
+        if (
+            self.__class__ is not other.__class__
+            or self.__dict__.keys() != other.__dict__.keys()
+        ):
+            return False
+
+        return all(
+            np.array_equal(value, other.__dict__[key])
+            for key, value in self.__dict__.items()
+        )
+
+    def __repr__(self):
+        return "{}\ntotal_members: {}\ncutoff_radius: {}".format(
+            self.__class__.__name__, self.total_members, self.cutoff_radius
+        )
+
+
+class PointMassPopulation(AbstractMassPopulation):
+
+    member_class = tmp.PointMass
+    member_type = multipole_util.point_mass
+
+    length_attributes = ("centres", "einstein_radii", "cutoff_radius")
+
+    def __init__(self, centres, einstein_radii, cutoff_radius=None):
+        """ A population of point-masses.
+
+        Parameters
+        ----------
+        centres : ndarray
+            The (y,x) arc-second coordinates of the centre of every point-mass, of shape [total_members, 2].
+        einstein_radii : ndarray
+            The arc-second Einstein radius of every point-mass.
+        cutoff_radius : float or None
+            Every point-mass only deflects the (y,x) coordinates within this radius of its centre. If None, every \
+            point-mass deflects every coordinate.
+        """
+        super(PointMassPopulation, self).__init__(
+            centres=centres, cutoff_radius=cutoff_radius
+        )
+
+        self.einstein_radii = self.member_arrays_from_values(
+            einstein_radii=einstein_radii
+        )["einstein_radii"]
+
+    @classmethod
+    def from_profiles(cls, profiles, cutoff_radius=None):
+        """Create a population from a list of *PointMass* profiles."""
+        return cls(
+            centres=[profile.centre for profile in profiles],
+            einstein_radii=[profile.einstein_radius for profile in profiles],
+            cutoff_radius=cutoff_radius,
+        )
+
+    @property
+    def einstein_radius(self):
+        """The Einstein radius of a single point-mass with the total mass of the population, which encloses a mass \
+        of pi * einstein_radius^2."""
+        return np.sqrt(np.sum(np.square(self.einstein_radii)))
+
+    @property
+    def einstein_radius_via_mean_convergence(self):
+        return self.einstein_radius
+
+    @property
+    def is_point_mass(self):
+        return True
+
+    def convergence_from_kernel(self, grid, convergence):
+        return convergence
+
+    @property
+    def member_parameters(self):
+        return self.einstein_radii[:, None]
+
+
+class SphericalTruncatedNFWPopulation(AbstractMassPopulation, dmp.DarkProfile):
+
+    member_class = dmp.SphericalTruncatedNFW
+    member_type = multipole_util.truncated_nfw
+
+    length_attributes = ("centres", "scale_radii", "truncation_radii", "cutoff_radius")
+
+    def __init__(
+        self, centres, kappa_s, scale_radii, truncation_radii, cutoff_radius=None
+    ):
+        """ A population of spherical truncated NFW profiles (Baltz, Marshall & Oguri 2009), such as the subhalos \
+        of a lens galaxy.
+
+        Parameters
+        ----------
+        centres : ndarray
+            The (y,x) arc-second coordinates of the centre of every member, of shape [total_members, 2].
+        kappa_s : ndarray
+            The overall normalization of every member's dark matter profile.
+        scale_radii : ndarray
+            The arc-second radius where the density of every member is equal to its characteristic density.
+        truncation_radii : ndarray
+            The arc-second radius where every member is truncated.
+        cutoff_radius : float or None
+            Every member only contributes to the (y,x) coordinates within this radius of its centre. If None, every \
+            member contributes to every coordinate.
+        """
+        super(SphericalTruncatedNFWPopulation, self).__init__(
+            centres=centres, cutoff_radius=cutoff_radius
+        )
+
+        member_arrays = self.member_arrays_from_values(
+            kappa_s=kappa_s, scale_radii=scale_radii, truncation_radii=truncation_radii
+        )
+
+        self.kappa_s = member_arrays["kappa_s"]
+        self.scale_radii = member_arrays["scale_radii"]
+        self.truncation_radii = member_arrays["truncation_radii"]
+
+    @classmethod
+    def from_profiles(cls, profiles, cutoff_radius=None):
+        """Create a population from a list of *SphericalTruncatedNFW* profiles."""
+        return cls(
+            centres=[profile.centre for profile in profiles],
+            kappa_s=[profile.kappa_s for profile in profiles],
+            scale_radii=[profile.scale_radius for profile in profiles],
+            truncation_radii=[profile.truncation_radius for profile in profiles],
+            cutoff_radius=cutoff_radius,
+        )
+
+    def potential_from_grid(self, grid):
+        return grid.mapping.array_stored_1d_from_sub_array_1d(
+            sub_array_1d=np.zeros(shape=grid.sub_shape_1d)
+        )
+
+    def convergence_from_kernel(self, grid, convergence):
+        return truncated_nfw_convergence_from_grid(
+            grid=grid,
+            centres=self.centres,
+            kappa_s=self.kappa_s,
+            scale_radii=self.scale_radii,
+            truncation_radii=self.truncation_radii,
+            radial_minimum=self.radial_minimum,
+            cutoff_radius_squared=self.cutoff_radius_squared,
+            convergence=convergence,
+        )
+
+    @property
+    def member_parameters(self):
+        return np.stack(
+            (self.kappa_s, self.scale_radii, self.truncation_radii), axis=-1
+        )
+
+
+@decorator_util.jit()
+def truncated_nfw_convergence_from_grid(
+    grid,
+    centres,
+    kappa_s,
+    scale_radii,
+    truncation_radii,
+    radial_minimum,
+    cutoff_radius_squared,
+    convergence,
+):
+    """Add the convergence of every truncated NFW profile, 2 * kappa_s * L(r / scale_radius) as computed by \
+    *SphericalTruncatedNFW.convergence_func*, to *convergence*."""
+    for member in range(centres.shape[0]):
+
+        tau = truncation_radii[member] / scale_radii[member]
+        tau_squared = tau * tau
+        normalization = 2.0 * kappa_s[member] * tau_squared / (tau_squared + 1.0) ** 2
+
+        for index in range(grid.shape[0]):
+
+            y = grid[index, 0] - centres[member, 0]
+            x = grid[index, 1] - centres[member, 1]
+
+            if y * y + x * x > cutoff_radius_squared:
+                continue
+
+            y, x, radius = multipole_util.coordinate_moved_to_radial_minimum(
+                y, x, radial_minimum
+            )
+
+            eta = radius / scale_radii[member]
+            root = np.sqrt(tau_squared + eta * eta)
+
+            f = multipole_util.truncated_nfw_coord_func_f(eta)
+
+            if eta == 1.0:
+                g = 1.0 / 3.0
+            else:
+                g = (1.0 - f) / (eta * eta - 1.0)
+
+            convergence[index] += normalization * (
+                (tau_squared + 1.0) * g
+                + 2.0 * f
+                - np.pi / root
+                + ((tau_squared - 1.0) / (tau * root))
+                * multipole_util.truncated_nfw_coord_func_k(eta, tau)
+            )
+
+    return convergence
@@ -1,6 +1,5 @@
-from pyquad import quad_grid
-
 import numpy as np
+import warnings
 
 import autofit as af
 from autoarray.structures import arrays
@@ -9,9 +8,9 @@ from autoastro import dimensions as dim
 from autoastro.profiles import geometry_profiles
 
 from autoastro.profiles import mass_profiles as mp
+from autoastro.util import mge_util
 
 from scipy.special import wofz
-import warnings
 
 
 class StellarProfile:
@@ -82,14 +81,35 @@ class EllipticalGaussian(mp.EllipticalMassProfile, StellarProfile):
             grid_complex=input_grid, q=1
         ) - self.omega_from_grid_and_q(grid_complex=input_grid, q=self.axis_ratio)
 
+    @grids.convert_coordinates_to_grid
+    @grids.grid_interpolate
+    @geometry_profiles.cache
+    @geometry_profiles.transform_grid
+    @geometry_profiles.move_grid_to_radial_minimum
     def deflections_from_grid(self, grid):
+        """
+        Calculate the deflection angles at a given set of arc-second gridded coordinates.
 
-        with warnings.catch_warnings():
-            warnings.filterwarnings("error")
-            try:
-                return self.deflections_from_grid_via_analytic(grid=grid)
-            except RuntimeWarning:
-                return self.deflections_from_grid_via_integrator(grid=grid)
+        The deflection angles are computed with the scaled Faddeeva form of *deflections_via_faddeeva_from_grid*, \
+        which cannot overflow. Any coordinate whose deflection angles are still not finite is integrated \
+        individually, without recomputing the rest of the grid.
+
+        Parameters
+        ----------
+        grid : aa.Grid
+            The grid of (y,x) arc-second coordinates the deflection angles are computed on.
+        """
+        deflections = self.deflections_via_faddeeva_from_grid(grid=grid)
+
+        not_finite = ~np.all(np.isfinite(deflections), axis=1)
+
+        if np.any(not_finite):
+            deflections[not_finite] = self.deflections_via_integrator_from_grid(
+                grid=np.asarray(grid)[not_finite],
+                sigma=self.sigma / np.sqrt(self.axis_ratio),
+            )
+
+        return self.rotate_grid_from_profile(deflections)
 
     @grids.convert_coordinates_to_grid
     @grids.grid_interpolate
@@ -106,20 +126,36 @@ class EllipticalGaussian(mp.EllipticalMassProfile, StellarProfile):
             The grid of (y,x) arc-second coordinates the deflection angles are computed on.
 
         """
-
-        deflections = (
-            self.mass_to_light_ratio
-            * self.intensity
-            * (1.0 / self.sigma * np.sqrt(2.0 * np.pi))
-            * self.sigma
-            * np.sqrt((2 * np.pi) / (1.0 - self.axis_ratio ** 2.0))
-            * self.sigma_from_grid(grid=grid)
+        return self.rotate_grid_from_profile(
+            self.deflections_via_faddeeva_from_grid(grid=grid)
         )
 
-        return self.rotate_grid_from_profile(
-            np.multiply(
-                1.0, np.vstack((-1.0 * np.imag(deflections), np.real(deflections))).T
-            )
+    def deflections_via_faddeeva_from_grid(self, grid):
+        """
+        Calculate the deflection angles on a grid of (y,x) coordinates in the reference frame of the profile, \
+        without rotating them back to the frame of the grid.
+
+        The unscaled form of *sigma_from_grid* multiplies exp(y^2) by the Faddeeva function, which overflows at \
+        large radii and as the axis-ratio tends to 1. This evaluates the same closed-form solution with the scaled \
+        Faddeeva form of *mge_util*, in which the Faddeeva function is only evaluated in the upper complex \
+        half-plane and every exponential is bounded by 1, using the spherical solution for circular profiles.
+
+        Parameters
+        ----------
+        grid : TransformedGrid(ndarray)
+            The (y, x) coordinates in the reference frame of the profile.
+        """
+        return mge_util.deflections_from_grid_and_gaussians(
+            grid=grid,
+            axis_ratio=self.axis_ratio,
+            sigmas=np.array([self.sigma / np.sqrt(self.axis_ratio)]),
+            amplitudes=np.array(
+                [
+                    self.mass_to_light_ratio
+                    * self.intensity
+                    * (1.0 / self.sigma * np.sqrt(2.0 * np.pi))
+                ]
+            ),
         )
 
     @grids.convert_coordinates_to_grid
@@ -137,6 +173,22 @@ class EllipticalGaussian(mp.EllipticalMassProfile, StellarProfile):
             The grid of (y,x) arc-second coordinates the deflection angles are computed on.
 
         """
+        return self.rotate_grid_from_profile(
+            self.deflections_via_integrator_from_grid(grid=grid, sigma=self.sigma)
+        )
+
+    def deflections_via_integrator_from_grid(self, grid, sigma):
+        """
+        Integrate the deflection angles on a grid of (y,x) coordinates in the reference frame of the profile, for \
+        the sigma used in the integrand of *deflection_func*, without rotating them back to the frame of the grid.
+
+        Parameters
+        ----------
+        grid : TransformedGrid(ndarray)
+            The (y, x) coordinates in the reference frame of the profile.
+        sigma : float
+            The sigma of the integrand, which is sigma / sqrt(axis_ratio) for the profile of the closed-form solution.
+        """
 
         def calculate_deflection_component(npow, index):
 
@@ -145,13 +197,11 @@ class EllipticalGaussian(mp.EllipticalMassProfile, StellarProfile):
                 (1.0 / self.sigma * np.sqrt(2.0 * np.pi))
                 * self.intensity
                 * self.mass_to_light_ratio
-                * quad_grid(
-                    self.deflection_func,
-                    0.0,
-                    1.0,
-                    grid,
-                    args=(npow, self.axis_ratio, self.sigma),
-                )[0]
+                * self.deflection_integral_from_grid(
+                    grid=grid,
+                    func=self.deflection_func,
+                    args=(npow, self.axis_ratio, sigma),
+                )
             )
 
             return deflection_grid
@@ -159,9 +209,7 @@ class EllipticalGaussian(mp.EllipticalMassProfile, StellarProfile):
         deflection_y = calculate_deflection_component(1.0, 0)
         deflection_x = calculate_deflection_component(0.0, 1)
 
-        return self.rotate_grid_from_profile(
-            np.multiply(1.0, np.vstack((deflection_y, deflection_x)).T)
-        )
+        return np.vstack((deflection_y, deflection_x)).T
 
     @staticmethod
     def deflection_func(u, y, x, npow, axis_ratio, sigma):
@@ -190,6 +238,12 @@ class EllipticalGaussian(mp.EllipticalMassProfile, StellarProfile):
     def convergence_func(self, grid_radius):
         return self.mass_to_light_ratio * self.intensity_at_radius(grid_radius)
 
+    @property
+    def circularized_radius_rescale(self):
+        """The convergence is a function of the eccentric radius, which is already the radius of the circle with the \
+        same area as the ellipse."""
+        return 1.0
+
     def intensity_at_radius(self, grid_radii):
         """Calculate the intensity of the Gaussian light profile on a grid of radial coordinates.
 
@@ -267,6 +321,12 @@ class AbstractEllipticalSersic(mp.EllipticalMassProfile, StellarProfile):
     def convergence_func(self, grid_radius):
         return self.mass_to_light_ratio * self.intensity_at_radius(grid_radius)
 
+    @property
+    def circularized_radius_rescale(self):
+        """The convergence is a function of the eccentric radius, which is already the radius of the circle with the \
+        same area as the ellipse."""
+        return 1.0
+
     @grids.convert_coordinates_to_grid
     def potential_from_grid(self, grid):
         return arrays.Array.manual_1d(
@@ -318,6 +378,67 @@ class AbstractEllipticalSersic(mp.EllipticalMassProfile, StellarProfile):
     def unit_mass(self):
         return self.mass_to_light_ratio.unit_mass
 
+    @property
+    def mge_decomposition(self):
+        """The multi-Gaussian expansion of the profile in units of its effective radius and central convergence \
+        (see *mge_util.decomposition_from_sersic_index*)."""
+        return mge_util.decomposition_from_sersic_index(
+            sersic_index=float(self.sersic_index),
+            sersic_constant=float(self.sersic_constant),
+        )
+
+    @property
+    def mge_is_accurate(self):
+        """Whether the multi-Gaussian expansion of the profile encloses its mass to *mge_util.enclosed_mass_tolerance*, \
+        warning if it does not, in which case the deflection angles of the "mge" engine are integrated instead."""
+        error = self.mge_decomposition[2]
+
+        if error < mge_util.enclosed_mass_tolerance:
+            return True
+
+        warnings.warn(
+            "The multi-Gaussian expansion of {} encloses its mass to a fractional error of {:.1e}, above the "
+            "tolerance {:.1e}, so its deflection angles are integrated instead".format(
+                self.__class__.__name__, error, mge_util.enclosed_mass_tolerance
+            )
+        )
+
+        return False
+
+    @property
+    def mge_sigmas_and_amplitudes(self):
+        """The sigmas and central convergences of the Gaussians of the profile's multi-Gaussian expansion, which \
+        is cached for every profile with the same Sersic index."""
+        sigmas, amplitudes, _ = self.mge_decomposition
+        return (
+            self.effective_radius * sigmas,
+            self.mass_to_light_ratio * self.intensity * amplitudes,
+        )
+
+    def deflections_via_mge_from_grid(self, grid):
+        """
+        Calculate the deflection angles at a given set of arc-second gridded coordinates, by summing the analytic \
+        deflection angles of the Gaussians of the profile's multi-Gaussian expansion.
+
+        This is used by *deflections_from_grid* when the profile's *deflections_engine* is "mge".
+
+        Parameters
+        ----------
+        grid : aa.Grid
+            The grid of (y,x) arc-second coordinates in the profile's reference frame the deflection angles are \
+            computed on.
+        """
+        sigmas, amplitudes = self.mge_sigmas_and_amplitudes
+
+        return self.rotate_grid_from_profile(
+            mge_util.deflections_from_grid_and_gaussians(
+                grid=grid,
+                axis_ratio=self.axis_ratio,
+                sigmas=sigmas,
+                amplitudes=amplitudes,
+            )
+        )
+
 
 class EllipticalSersic(AbstractEllipticalSersic):
     @staticmethod
@@ -337,6 +458,7 @@ class EllipticalSersic(AbstractEllipticalSersic):
     @grids.grid_interpolate
     @geometry_profiles.cache
     @geometry_profiles.transform_grid
+    @geometry_profiles.tabulate_radially
     @geometry_profiles.move_grid_to_radial_minimum
     def deflections_from_grid(self, grid):
         """
@@ -349,6 +471,9 @@ class EllipticalSersic(AbstractEllipticalSersic):
 
         """
 
+        if self.deflections_engine == "mge" and self.mge_is_accurate:
+            return self.deflections_via_mge_from_grid(grid=grid)
+
         def calculate_deflection_component(npow, index):
             sersic_constant = self.sersic_constant
 
@@ -356,11 +481,9 @@ class EllipticalSersic(AbstractEllipticalSersic):
             deflection_grid *= (
                 self.intensity
                 * self.mass_to_light_ratio
-                * quad_grid(
-                    self.deflection_func,
-                    0.0,
-                    1.0,
-                    grid,
+                * self.deflection_integral_from_grid(
+                    grid=grid,
+                    func=self.deflection_func,
                     args=(
                         npow,
                         self.axis_ratio,
@@ -368,7 +491,7 @@ class EllipticalSersic(AbstractEllipticalSersic):
                         self.effective_radius,
                         sersic_constant,
                     ),
-                )[0]
+                )
             )
 
             return deflection_grid
@@ -376,9 +499,7 @@ class EllipticalSersic(AbstractEllipticalSersic):
         deflection_y = calculate_deflection_component(1.0, 0)
         deflection_x = calculate_deflection_component(0.0, 1)
 
-        return self.rotate_grid_from_profile(
-            np.multiply(1.0, np.vstack((deflection_y, deflection_x)).T)
-        )
+        return self.rotate_grid_from_profile(np.vstack((deflection_y, deflection_x)).T)
 
 
 class SphericalSersic(EllipticalSersic):
@@ -617,6 +738,25 @@ class EllipticalSersicRadialGradient(AbstractEllipticalSersic):
         )
         self.mass_to_light_gradient = mass_to_light_gradient
 
+    @property
+    def mge_decomposition(self):
+        return mge_util.decomposition_from_sersic_index(
+            sersic_index=float(self.sersic_index),
+            sersic_constant=float(self.sersic_constant),
+            mass_to_light_gradient=float(self.mass_to_light_gradient),
+        )
+
+    @property
+    def mge_sigmas_and_amplitudes(self):
+        sigmas, amplitudes, _ = self.mge_decomposition
+        return (
+            self.effective_radius * sigmas,
+            self.mass_to_light_ratio
+            * self.intensity
+            * (self.axis_ratio ** -self.mass_to_light_gradient)
+            * amplitudes,
+        )
+
     @grids.convert_coordinates_to_grid
     @geometry_profiles.transform_grid
     @geometry_profiles.move_grid_to_radial_minimum
@@ -635,6 +775,7 @@ class EllipticalSersicRadialGradient(AbstractEllipticalSersic):
     @grids.grid_interpolate
     @geometry_profiles.cache
     @geometry_profiles.transform_grid
+    @geometry_profiles.tabulate_radially
     @geometry_profiles.move_grid_to_radial_minimum
     def deflections_from_grid(self, grid):
         """
@@ -647,6 +788,9 @@ class EllipticalSersicRadialGradient(AbstractEllipticalSersic):
 
         """
 
+        if self.deflections_engine == "mge" and self.mge_is_accurate:
+            return self.deflections_via_mge_from_grid(grid=grid)
+
         def calculate_deflection_component(npow, index):
             sersic_constant = self.sersic_constant
 
@@ -654,11 +798,9 @@ class EllipticalSersicRadialGradient(AbstractEllipticalSersic):
             deflection_grid *= (
                 self.intensity
                 * self.mass_to_light_ratio
-                * quad_grid(
-                    self.deflection_func,
-                    0.0,
-                    1.0,
-                    grid,
+                * self.deflection_integral_from_grid(
+                    grid=grid,
+                    func=self.deflection_func,
                     args=(
                         npow,
                         self.axis_ratio,
@@ -667,16 +809,14 @@ class EllipticalSersicRadialGradient(AbstractEllipticalSersic):
                         self.mass_to_light_gradient,
                         sersic_constant,
                     ),
-                )[0]
+                )
             )
             return deflection_grid
 
         deflection_y = calculate_deflection_component(1.0, 0)
         deflection_x = calculate_deflection_component(0.0, 1)
 
-        return self.rotate_grid_from_profile(
-            np.multiply(1.0, np.vstack((deflection_y, deflection_x)).T)
-        )
+        return self.rotate_grid_from_profile(np.vstack((deflection_y, deflection_x)).T)
 
     def convergence_func(self, grid_radius):
         return (
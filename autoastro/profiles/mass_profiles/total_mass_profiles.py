@@ -1,4 +1,3 @@
-from scipy import special
 from pyquad import quad_grid
 
 import numpy as np
@@ -9,6 +8,7 @@ from autoarray.structures import arrays
 from autoarray.structures import grids
 from autoastro import dimensions as dim
 from autoastro.profiles import geometry_profiles
+from autoastro.util import hyp2f1_util
 
 from autoastro.profiles import mass_profiles as mp
 
@@ -51,12 +51,58 @@ class PointMass(geometry_profiles.SphericalProfile, mp.MassProfile):
             grid=grid, radius=self.einstein_radius ** 2 / grid_radii
         )
 
+    def hessian_from_grid(self, grid):
+        """
+        Calculate the Hessian of the lensing potential at a given set of arc-second gridded coordinates.
+
+        The point-mass has zero convergence away from its centre and deflection angles alpha = einstein_radius^2 / z*, \
+        where z = x + iy relative to its centre, so its complex shear is gamma = -alpha / z*.
+
+        Parameters
+        ----------
+        grid : aa.Grid
+            The grid of (y,x) arc-second coordinates the Hessian is computed on.
+        """
+        deflections = np.asarray(self.deflections_from_grid(grid=grid))
+
+        z = (np.asarray(grid)[:, 1] - self.centre[1]) + 1j * (
+            np.asarray(grid)[:, 0] - self.centre[0]
+        )
+
+        with np.errstate(all="ignore"):
+            shear = -(deflections[:, 1] + 1j * deflections[:, 0]) / np.conj(z)
+
+        shear[z == 0.0] = 0.0
+
+        return self.hessian_from_convergence_and_shear(
+            grid=grid, convergence=np.zeros(shape=shear.shape), shear=shear
+        )
+
+    @property
+    def einstein_radius_via_mean_convergence(self):
+        """The point-mass encloses a mass of pi * einstein_radius^2 within every radius, so its mean convergence is \
+        1.0 at its Einstein radius."""
+        return self.einstein_radius
+
+    def mass_within_circularized_radius(self, radius):
+        return np.pi * self.einstein_radius ** 2.0
+
     @property
     def is_point_mass(self):
         return True
 
 
 class EllipticalBrokenPowerLaw(mp.EllipticalMassProfile, mp.MassProfile):
+
+    # How the hypergeometric functions of the deflection angles are computed (series | scipy). The series engine sums
+    # their series until the terms that remain are below hyp2f1_tolerance of the sum, in hyp2f1_precision
+    # (float64 | float32) arithmetic (see *hyp2f1_util*).
+    hyp2f1_engine = "series"
+    hyp2f1_tolerance = 1.0e-10
+    hyp2f1_precision = "float64"
+
+    result_settings = ("hyp2f1_engine", "hyp2f1_tolerance", "hyp2f1_precision")
+
     def __init__(
         self,
         centre: dim.Position = (0.0, 0.0),
@@ -113,16 +159,26 @@ class EllipticalBrokenPowerLaw(mp.EllipticalMassProfile, mp.MassProfile):
         # Elliptical radius
         radius = np.hypot(grid[:, 1] * self.axis_ratio, grid[:, 0])
 
+        return self.convergence_func(grid_radius=radius)
+
+    def convergence_func(self, grid_radius):
+
         # Inside break radius
-        kappa_inner = self.kB * (self.break_radius / radius) ** self.inner_slope
+        kappa_inner = self.kB * (self.break_radius / grid_radius) ** self.inner_slope
 
         # Outside break radius
-        kappa_outer = self.kB * (self.break_radius / radius) ** self.outer_slope
+        kappa_outer = self.kB * (self.break_radius / grid_radius) ** self.outer_slope
 
-        return kappa_inner * (radius <= self.break_radius) + kappa_outer * (
-            radius > self.break_radius
+        return kappa_inner * (grid_radius <= self.break_radius) + kappa_outer * (
+            grid_radius > self.break_radius
         )
 
+    @property
+    def circularized_radius_rescale(self):
+        """The convergence is a function of the radius sqrt((axis_ratio * x)^2 + y^2), the semi-minor axis of an \
+        ellipse with the same area as a circle of radius 1 / sqrt(axis_ratio) times its semi-minor axis."""
+        return 1.0 / np.sqrt(self.axis_ratio)
+
     @grids.convert_coordinates_to_grid
     def potential_from_grid(self, grid):
         return arrays.Array.manual_1d(
@@ -132,7 +188,7 @@ class EllipticalBrokenPowerLaw(mp.EllipticalMassProfile, mp.MassProfile):
     @grids.convert_coordinates_to_grid
     @geometry_profiles.transform_grid
     @geometry_profiles.move_grid_to_radial_minimum
-    def deflections_from_grid(self, grid, max_terms=20):
+    def deflections_from_grid(self, grid):
         """
         Returns the complex deflection angle from eq. 18 and 19
         """
@@ -150,63 +206,61 @@ class EllipticalBrokenPowerLaw(mp.EllipticalMassProfile, mp.MassProfile):
             / (self.axis_ratio * z * (2 - self.inner_slope))
         )
 
-        # Hypergeometric functions
-        # (in order of appearance in eq. 18 and 19)
-        # These can also be computed with scipy.special.hyp2f1(), it's
-        # much slower can be a useful test
-        F1 = self.hyp2f1_series(
-            self.inner_slope, self.axis_ratio, R, z, max_terms=max_terms
-        )
-        F2 = self.hyp2f1_series(
-            self.inner_slope, self.axis_ratio, self.break_radius, z, max_terms=max_terms
-        )
-        F3 = self.hyp2f1_series(
-            self.outer_slope, self.axis_ratio, R, z, max_terms=max_terms
-        )
-        F4 = self.hyp2f1_series(
-            self.outer_slope, self.axis_ratio, self.break_radius, z, max_terms=max_terms
-        )
+        # u of eq. 25 at the elliptical radius and the break radius, which the hypergeometric functions of the inner
+        # and outer slope share
+        u_radius = self.u_from_radius(r=R, z=z)
+        u_break = self.u_from_radius(r=self.break_radius, z=z)
+
+        inner = R <= self.break_radius
+        outer = ~inner
+
+        deflections = np.zeros(z.shape, dtype="complex128")
 
         # theta < break radius (eq. 18)
-        inner_part = factors * F1 * (self.break_radius / R) ** (self.inner_slope - 2)
+        deflections[inner] = (
+            factors[inner]
+            * self.hyp2f1_series(self.inner_slope, u_radius[inner])
+            * (self.break_radius / R[inner]) ** (self.inner_slope - 2)
+        )
 
         # theta > break radius (eq. 19)
-        outer_part = factors * (
-            F2
-            + self.dt * (((self.break_radius / R) ** (self.outer_slope - 2)) * F3 - F4)
+        deflections[outer] = factors[outer] * (
+            self.hyp2f1_series(self.inner_slope, u_break[outer])
+            + self.dt
+            * (
+                ((self.break_radius / R[outer]) ** (self.outer_slope - 2))
+                * self.hyp2f1_series(self.outer_slope, u_radius[outer])
+                - self.hyp2f1_series(self.outer_slope, u_break[outer])
+            )
         )
 
-        # Combine and take the conjugate
-        deflections = (
-            inner_part * (R <= self.break_radius) + outer_part * (R > self.break_radius)
-        ).conjugate()
+        # Take the conjugate
+        deflections = deflections.conjugate()
 
         return self.rotate_grid_from_profile(
-            np.multiply(1.0, np.vstack((np.imag(deflections), np.real(deflections))).T)
+            np.vstack((np.imag(deflections), np.real(deflections))).T
         )
 
-    @staticmethod
-    def hyp2f1_series(t, q, r, z, max_terms=20):
+    def u_from_radius(self, r, z):
         """
-        Computes eq. 26 for a radius r, slope t,
-        axis ratio q, and coordinates z.
+        Computes u from eq. 25 for a radius r and coordinates z.
         """
+        q_ = (1 - self.axis_ratio ** 2) / (self.axis_ratio ** 2)
+        return 0.5 * (1 - np.sqrt(1 - q_ * (r / z) ** 2))
 
-        # u from eq. 25
-        q_ = (1 - q ** 2) / (q ** 2)
-        u = 0.5 * (1 - np.sqrt(1 - q_ * (r / z) ** 2))
-
-        # First coefficient
-        a_n = 1.0
-
-        # Storage for sum
-        F = np.zeros_like(z, dtype="complex64")
-
-        for n in range(max_terms):
-            F += a_n * (u ** n)
-            a_n *= ((2 * n) + 4 - (2 * t)) / ((2 * n) + 4 - t)
-
-        return F
+    def hyp2f1_series(self, t, u):
+        """
+        Computes eq. 26, the hypergeometric function 2F1(1, 2 - t; 2 - t / 2; u), for a slope t and u from eq. 25 \
+        (see *hyp2f1_util*).
+        """
+        return hyp2f1_util.hyp2f1_from_values(
+            b=2.0 - t,
+            c=2.0 - 0.5 * t,
+            w=u,
+            engine=self.hyp2f1_engine,
+            tolerance=self.hyp2f1_tolerance,
+            precision=self.hyp2f1_precision,
+        )
 
 
 class SphericalBrokenPowerLaw(EllipticalBrokenPowerLaw):
@@ -300,14 +354,7 @@ class EllipticalCoredPowerLaw(mp.EllipticalMassProfile, mp.MassProfile):
 
         """
 
-        covnergence_grid = np.zeros(grid.sub_shape_1d)
-
-        grid_eta = self.grid_to_elliptical_radii(grid)
-
-        for i in range(grid.sub_shape_1d):
-            covnergence_grid[i] = self.convergence_func(grid_eta[i])
-
-        return covnergence_grid
+        return self.convergence_func(grid_radius=self.grid_to_elliptical_radii(grid))
 
     @grids.convert_coordinates_to_grid
     @geometry_profiles.transform_grid
@@ -355,13 +402,11 @@ class EllipticalCoredPowerLaw(mp.EllipticalMassProfile, mp.MassProfile):
             deflection_grid = self.axis_ratio * grid[:, index]
             deflection_grid *= (
                 einstein_radius_rescaled
-                * quad_grid(
-                    self.deflection_func,
-                    0.0,
-                    1.0,
-                    grid,
+                * self.deflection_integral_from_grid(
+                    grid=grid,
+                    func=self.deflection_func,
                     args=(npow, self.axis_ratio, self.slope, self.core_radius),
-                )[0]
+                )
             )
 
             return deflection_grid
@@ -369,9 +414,7 @@ class EllipticalCoredPowerLaw(mp.EllipticalMassProfile, mp.MassProfile):
         deflection_y = calculate_deflection_component(1.0, 0)
         deflection_x = calculate_deflection_component(0.0, 1)
 
-        return self.rotate_grid_from_profile(
-            np.multiply(1.0, np.vstack((deflection_y, deflection_x)).T)
-        )
+        return self.rotate_grid_from_profile(np.vstack((deflection_y, deflection_x)).T)
 
     def convergence_func(self, grid_radius):
         return self.einstein_radius_rescaled * (
@@ -495,6 +538,16 @@ class SphericalCoredPowerLaw(EllipticalCoredPowerLaw):
 
 
 class EllipticalPowerLaw(EllipticalCoredPowerLaw):
+
+    # How the hypergeometric function of the deflection angles is computed (series | scipy). The series engine sums
+    # its series until the terms that remain are below hyp2f1_tolerance of the sum, in hyp2f1_precision
+    # (float64 | float32) arithmetic (see *hyp2f1_util*).
+    hyp2f1_engine = "series"
+    hyp2f1_tolerance = 1.0e-10
+    hyp2f1_precision = "float64"
+
+    result_settings = ("hyp2f1_engine", "hyp2f1_tolerance", "hyp2f1_precision")
+
     @af.map_types
     def __init__(
         self,
@@ -530,6 +583,31 @@ class EllipticalPowerLaw(EllipticalCoredPowerLaw):
             core_radius=dim.Length(0.0),
         )
 
+    @grids.convert_coordinates_to_grid
+    @geometry_profiles.transform_grid
+    @geometry_profiles.move_grid_to_radial_minimum
+    def potential_from_grid(self, grid):
+        """
+        Calculate the potential at a given set of arc-second gridded coordinates.
+
+        Without a core, the potential of a power-law is a homogeneous function of degree (3 - slope) of the \
+        coordinates relative to its centre and the deflection angles are its gradient, so Euler's theorem gives the \
+        closed-form potential psi = (x * alpha_x + y * alpha_y) / (3 - slope) from the analytic deflection angles, \
+        without integrating *potential_func* for every coordinate.
+
+        Parameters
+        ----------
+        grid : aa.Grid
+            The grid of (y,x) arc-second coordinates the potential is computed on.
+        """
+        deflections = self.deflections_from_grid(grid=grid)
+
+        grid_rotated = self.rotate_grid_from_profile(grid_elliptical=grid)
+
+        return np.sum(np.multiply(grid_rotated, deflections), axis=1) / (
+            3.0 - self.slope
+        )
+
     @grids.convert_coordinates_to_grid
     @geometry_profiles.transform_grid
     @geometry_profiles.move_grid_to_radial_minimum
@@ -570,7 +648,9 @@ class EllipticalPowerLaw(EllipticalCoredPowerLaw):
             / (1.0 + self.axis_ratio)
             * (b / R) ** (slope - 1.0)
             * z
-            * special.hyp2f1(1.0, 0.5 * slope, 2.0 - 0.5 * slope, -factor * z ** 2)
+            * self.hyp2f1_from_values(
+                b=0.5 * slope, c=2.0 - 0.5 * slope, w=-factor * z ** 2
+            )
         )
 
         deflection_y = complex_angle.imag
@@ -583,11 +663,125 @@ class EllipticalPowerLaw(EllipticalCoredPowerLaw):
 
         return self.rotate_grid_from_profile(np.vstack((deflection_y, deflection_x)).T)
 
+    @classmethod
+    def deflections_from_grid_and_batch_parameters(cls, grid, parameters):
+        """
+        Calculate the deflection angles of a batch of power-law profiles in one NumPy broadcast, using the same \
+        expressions as *deflections_from_grid* with every parameter a column of shape [total_profiles, 1].
+
+        Parameters
+        ----------
+        grid : aa.Grid
+            The grid of (y,x) arc-second coordinates the deflection angles are computed on.
+        parameters : dict
+            The constructor arguments of every profile of the batch (see *batch_parameters_from_params_array*). \
+            Spherical profiles, which have no axis_ratio or phi, are computed with an axis_ratio of 1.0.
+        """
+        axis_ratio = parameters.get("axis_ratio", 1.0)
+        phi = parameters.get("phi")
+
+        grid_y, grid_x = cls.batch_grid_to_reference_frame(
+            grid=np.asarray(grid), centre=parameters["centre"], phi=phi
+        )
+
+        slope = parameters["slope"] - 1.0
+        einstein_radius = (2.0 / (axis_ratio ** -0.5 + axis_ratio ** 0.5)) * parameters[
+            "einstein_radius"
+        ]
+
+        factor = (1.0 - axis_ratio) / (1.0 + axis_ratio)
+        b = einstein_radius * np.sqrt(axis_ratio)
+        angle = np.arctan2(grid_y, axis_ratio * grid_x)
+        R = np.sqrt(axis_ratio ** 2 * grid_x ** 2 + grid_y ** 2)
+        z = np.cos(angle) + 1j * np.sin(angle)
+
+        complex_angle = (
+            2.0
+            * b
+            / (1.0 + axis_ratio)
+            * (b / R) ** (slope - 1.0)
+            * z
+            * cls.hyp2f1_from_values(
+                b=0.5 * slope, c=2.0 - 0.5 * slope, w=-factor * z ** 2
+            )
+        )
+
+        rescale_factor = ((1.0 + axis_ratio) / 2.0) ** (slope - 1)
+
+        return cls.batch_grid_from_reference_frame(
+            grid_y=rescale_factor * complex_angle.imag,
+            grid_x=rescale_factor * complex_angle.real,
+            phi=phi,
+        )
+
+    @classmethod
+    def hyp2f1_from_values(cls, b, c, w):
+        """The hypergeometric function 2F1(1, b; c; w) of the deflection angles (Tessore & Metcalf 2015), computed \
+        with the *hyp2f1_engine* of the profile (see *hyp2f1_util*)."""
+        return hyp2f1_util.hyp2f1_from_values(
+            b=b,
+            c=c,
+            w=w,
+            engine=cls.hyp2f1_engine,
+            tolerance=cls.hyp2f1_tolerance,
+            precision=cls.hyp2f1_precision,
+        )
+
+    def hessian_from_grid(self, grid):
+        """
+        Calculate the Hessian of the lensing potential at a given set of arc-second gridded coordinates.
+
+        The deflection angles of a power-law are a homogeneous function of degree (2 - slope) of the coordinates \
+        z = x + iy relative to its centre (Tessore & Metcalf 2015), so Euler's theorem gives the complex shear from \
+        the convergence and deflection angles, gamma = ((2 - slope) * alpha - kappa * z) / z*, without any numerical \
+        differentiation.
+
+        Parameters
+        ----------
+        grid : aa.Grid
+            The grid of (y,x) arc-second coordinates the Hessian is computed on.
+        """
+        convergence = np.asarray(self.convergence_from_grid(grid=grid))
+        deflections = np.asarray(self.deflections_from_grid(grid=grid))
+
+        z = (np.asarray(grid)[:, 1] - self.centre[1]) + 1j * (
+            np.asarray(grid)[:, 0] - self.centre[0]
+        )
+
+        with np.errstate(all="ignore"):
+            shear = (
+                (2.0 - self.slope) * (deflections[:, 1] + 1j * deflections[:, 0])
+                - convergence * z
+            ) / np.conj(z)
+
+        shear[z == 0.0] = 0.0
+
+        return self.hessian_from_convergence_and_shear(
+            grid=grid, convergence=convergence, shear=shear
+        )
+
+    @property
+    def einstein_radius_via_mean_convergence(self):
+        """The closed-form radius within which the mean convergence of the power-law is 1.0.
+
+        The mean convergence within the ellipse of elliptical radius r is 2 / (1 + axis_ratio) * \
+        (einstein_radius / r)^(slope - 1), which is 1.0 for r = einstein_radius * (2 / (1 + axis_ratio))^(1 / \
+        (slope - 1)). This is rescaled to the radius of the circle with the same area.
+        """
+        return (
+            self.circularized_radius_rescale
+            * self.einstein_radius
+            * (2.0 / (1.0 + self.axis_ratio)) ** (1.0 / (self.slope - 1.0))
+        )
+
     def convergence_func(self, grid_radius):
-        if grid_radius > 0.0:
-            return self.einstein_radius_rescaled * grid_radius ** (-(self.slope - 1))
-        else:
-            return np.inf
+        grid_radius = np.asarray(grid_radius, dtype="float64")
+        with np.errstate(divide="ignore"):
+            return np.where(
+                grid_radius > 0.0,
+                self.einstein_radius_rescaled * grid_radius ** (-(self.slope - 1)),
+                np.inf,
+            )[()]
 
     @staticmethod
     def potential_func(u, y, x, axis_ratio, slope, core_radius):
@@ -796,6 +990,40 @@ class EllipticalIsothermal(EllipticalPowerLaw):
             np.multiply(factor, np.vstack((deflection_y, deflection_x)).T)
         )
 
+    @classmethod
+    def deflections_from_grid_and_batch_parameters(cls, grid, parameters):
+        """
+        Calculate the deflection angles of a batch of isothermal profiles in one NumPy broadcast, using the same \
+        expressions as *deflections_from_grid* with every parameter a column of shape [total_profiles, 1].
+
+        Parameters
+        ----------
+        grid : aa.Grid
+            The grid of (y,x) arc-second coordinates the deflection angles are computed on.
+        parameters : dict
+            The constructor arguments of every profile of the batch (see *batch_parameters_from_params_array*).
+        """
+        axis_ratio = np.minimum(parameters["axis_ratio"], 0.99999)
+
+        grid_y, grid_x = cls.batch_grid_to_reference_frame(
+            grid=np.asarray(grid), centre=parameters["centre"], phi=parameters["phi"]
+        )
+
+        factor = (
+            2.0
+            * (parameters["einstein_radius"] / (1.0 + axis_ratio))
+            * axis_ratio
+            / np.sqrt(1 - axis_ratio ** 2)
+        )
+
+        psi = np.sqrt(axis_ratio ** 2 * np.square(grid_x) + np.square(grid_y))
+
+        return cls.batch_grid_from_reference_frame(
+            grid_y=factor * np.arctanh(np.sqrt(1 - axis_ratio ** 2) * grid_y / psi),
+            grid_x=factor * np.arctan(np.sqrt(1 - axis_ratio ** 2) * grid_x / psi),
+            phi=parameters["phi"],
+        )
+
 
 class SphericalIsothermal(EllipticalIsothermal):
     @af.map_types
@@ -850,3 +1078,28 @@ class SphericalIsothermal(EllipticalIsothermal):
             grid=grid,
             radius=np.full(grid.sub_shape_1d, 2.0 * self.einstein_radius_rescaled),
         )
+
+    @classmethod
+    def deflections_from_grid_and_batch_parameters(cls, grid, parameters):
+        """
+        Calculate the deflection angles of a batch of spherical isothermal profiles in one NumPy broadcast, which \
+        have a magnitude of the Einstein radius and point towards the profile centre.
+
+        Parameters
+        ----------
+        grid : aa.Grid
+            The grid of (y,x) arc-second coordinates the deflection angles are computed on.
+        parameters : dict
+            The constructor arguments of every profile of the batch (see *batch_parameters_from_params_array*).
+        """
+        grid_y, grid_x = cls.batch_grid_to_reference_frame(
+            grid=np.asarray(grid), centre=parameters["centre"]
+        )
+
+        radius = parameters["einstein_radius"] / np.sqrt(
+            np.square(grid_y) + np.square(grid_x)
+        )
+
+        return cls.batch_grid_from_reference_frame(
+            grid_y=radius * grid_y, grid_x=radius * grid_x
+        )
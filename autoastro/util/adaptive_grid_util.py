@@ -0,0 +1,271 @@
+import warnings
+
+import numpy as np
+from scipy.spatial import Delaunay
+
+"""
+An adaptive hierarchical grid of (y,x) nodes on which a function is evaluated and from which its values are linearly \
+interpolated onto the coordinates of a grid, which refines a coarse uniform grid wherever its interpolation is \
+inaccurate instead of evaluating the function on a uniform grid fine enough everywhere.
+
+The coarse grid covers the coordinates with square cells of a given pixel scale, aligned to (0.0, 0.0) so the same \
+coordinates give the same coarse grid. At every level of refinement the function is computed at the centre and edge \
+midpoints of every cell, and a cell is split into four if it is within one cell of a centre (e.g. of a mass profile, \
+where the deflection angles have a cusp) or if the value at any of these nodes differs from its linear interpolation \
+between the corners of the cell by more than an error target. Only cells containing coordinates are refined and \
+every level computes the function on all of its new nodes in one call, so most nodes are placed where the function \
+varies most.
+
+Cells of the finest level which are close to a centre or whose error still exceeds the target, such as those at a \
+cusp which linear interpolation cannot follow, are not interpolated: the function is computed at the coordinates \
+inside them, which are added to the nodes.
+
+The number of evaluations of the function can be capped, as the adaptive grid is only worth using if it evaluates \
+the function fewer times than the coordinates it covers. Refinement then stops at the last level whose nodes are \
+within the cap (and the coordinates of cells at a cusp are only computed if they are within it), with a warning \
+that the interpolation may not meet the error target.
+"""
+
+
+def codes_from_keys(keys):
+    """Encode the integer (y,x) keys of nodes on the finest grid as one integer per node."""
+    return (keys[:, 0] + 2 ** 30) * 2 ** 31 + (keys[:, 1] + 2 ** 30)
+
+
+def cells_from_grid_and_size(grid, size):
+    """The unique integer (y,x) keys of the lower-left corners of the cells of a given size (in units of the finest \
+    grid) that contain the coordinates of a grid, where the coordinates are in units of the finest grid."""
+    return np.unique(np.floor(grid / size).astype("int64") * size, axis=0)
+
+
+def corners_from_cells_and_size(cells, size):
+    """The integer (y,x) keys of the four corners of every cell, of shape [total_cells, 4, 2]."""
+    return cells[:, None, :] + size * np.array([[0, 0], [0, 1], [1, 0], [1, 1]])
+
+
+def nodes_and_values_from_grid_and_values_func(
+    grid,
+    values_func,
+    pixel_scale,
+    centres,
+    error_target,
+    refinement_levels,
+    maximum_evaluations=None,
+):
+    """Compute the nodes of an adaptive hierarchical grid covering the coordinates of a grid and the values of a \
+    function on them.
+
+    Parameters
+    ----------
+    grid : ndarray
+        The (y,x) coordinates of shape [total_coordinates, 2] the nodes cover.
+    values_func : func
+        A function which takes an ndarray of (y,x) coordinates of shape [total_nodes, 2] and returns the values of \
+        shape [total_nodes] (or [total_nodes, total_components]) which are interpolated.
+    pixel_scale : float
+        The arc-second size of the cells of the coarse grid.
+    centres : [(float, float)]
+        The (y,x) centres close to which cells are refined regardless of the error of their interpolation.
+    error_target : float
+        The maximum difference between the value at the centre or an edge midpoint of a cell and its linear \
+        interpolation between the corners of the cell before the cell is refined, in the units of the function.
+    refinement_levels : int
+        The maximum number of times a cell of the coarse grid is split, such that the finest cells have a size of \
+        pixel_scale / 2^refinement_levels.
+    maximum_evaluations : int or None
+        If input, the maximum number of nodes the function is evaluated at. Cells are not refined, and the \
+        coordinates in cells at a cusp are not computed, if this would exceed it.
+
+    Returns
+    -------
+    (ndarray, ndarray) or (None, None)
+        The (y,x) nodes of shape [total_nodes, 2] and the values of the function on them, or None if the coarse grid \
+        alone has more than *maximum_evaluations* nodes.
+    """
+    # The keys of nodes are in units of half the size of the finest cells, so the centres of the finest cells are nodes.
+
+    scale = 2 ** (refinement_levels + 1)
+    spacing = pixel_scale / scale
+
+    grid = np.asarray(grid) / spacing
+    centres = np.asarray(centres, dtype="float64").reshape(-1, 2) / spacing
+
+    node_indexes = {}
+    node_keys = []
+    node_values = []
+
+    def within_maximum_evaluations(total_evaluations):
+        return maximum_evaluations is None or total_evaluations <= maximum_evaluations
+
+    def warn_maximum_evaluations():
+        warnings.warn(
+            "The adaptive grid is not refined beyond {} evaluations of the function, so its interpolation may "
+            "not meet the error target {}".format(maximum_evaluations, error_target)
+        )
+
+    def total_new_from_keys(keys):
+        """The number of nodes with the given keys the function has not been computed at."""
+        codes = np.unique(codes_from_keys(keys=keys))
+        return sum(code not in node_indexes for code in codes)
+
+    def values_from_keys(keys):
+        """The values of the function at nodes with the given keys, computing it at nodes which are new."""
+        codes = codes_from_keys(keys=keys)
+
+        new_codes, new_indexes = np.unique(codes, return_index=True)
+        new = np.array([code not in node_indexes for code in new_codes], dtype="bool")
+
+        if np.any(new):
+
+            new_keys = keys[new_indexes[new]]
+
+            for code in new_codes[new]:
+                node_indexes[code] = len(node_indexes)
+
+            node_keys.append(new_keys)
+            node_values.append(np.asarray(values_func(spacing * new_keys)))
+
+        values = np.concatenate(node_values)
+
+        return values[np.array([node_indexes[code] for code in codes], dtype="int")]
+
+    test_offsets = np.array([[1, 1], [0, 1], [1, 0], [1, 2], [2, 1]])
+    test_corners = [[0, 1, 2, 3], [0, 1], [0, 2], [1, 3], [2, 3]]
+
+    size = scale
+    cells = cells_from_grid_and_size(grid=grid, size=size)
+
+    exact_cells = np.zeros((0, 2), dtype="int64")
+
+    for level in range(refinement_levels + 1):
+
+        half = size // 2
+
+        corner_keys = corners_from_cells_and_size(cells=cells, size=size).reshape(-1, 2)
+
+        # The centre and edge midpoints of every cell, which are the new nodes of the cell if it is refined, and the
+        # corners whose mean is their linear interpolation.
+
+        test_keys = (cells[:, None, :] + half * test_offsets).reshape(-1, 2)
+
+        if not within_maximum_evaluations(
+            total_evaluations=len(node_indexes)
+            + total_new_from_keys(keys=np.concatenate((corner_keys, test_keys)))
+        ):
+            if level == 0:
+                return None, None
+            warn_maximum_evaluations()
+            break
+
+        corner_values = values_from_keys(keys=corner_keys)
+        corner_values = corner_values.reshape(
+            (cells.shape[0], 4) + corner_values.shape[1:]
+        )
+
+        test_values = values_from_keys(keys=test_keys)
+        test_values = test_values.reshape((cells.shape[0], 5) + test_values.shape[1:])
+
+        error = np.abs(
+            test_values
+            - np.stack(
+                [
+                    np.mean(corner_values[:, corners], axis=1)
+                    for corners in test_corners
+                ],
+                axis=1,
+            )
+        )
+
+        error = np.max(error.reshape(cells.shape[0], -1), axis=1)
+
+        refine = error > error_target
+
+        if centres.shape[0] > 0:
+            refine |= close_to_centres_from_grid(
+                grid=cells + half, centres=centres, distance=1.5 * size
+            )
+
+        if level == refinement_levels:
+            exact_cells = cells[refine]
+            break
+
+        if not np.any(refine):
+            break
+
+        children = (
+            cells[refine][:, None, :]
+            + half * np.array([[0, 0], [0, 1], [1, 0], [1, 1]])
+        ).reshape(-1, 2)
+
+        occupied = codes_from_keys(keys=cells_from_grid_and_size(grid=grid, size=half))
+
+        cells = children[np.isin(codes_from_keys(keys=children), occupied)]
+        size = half
+
+    nodes = np.concatenate(node_keys)
+    values = np.concatenate(node_values)
+
+    exact = np.isin(
+        codes_from_keys(keys=np.floor(grid / size).astype("int64") * size),
+        codes_from_keys(keys=exact_cells),
+    )
+
+    if np.any(exact) and not within_maximum_evaluations(
+        total_evaluations=len(node_indexes) + np.sum(exact)
+    ):
+        warn_maximum_evaluations()
+    elif np.any(exact):
+
+        # The value of a function with a cusp at a node on a centre does not describe the coordinates around it.
+
+        if centres.shape[0] > 0:
+            far = ~close_to_centres_from_grid(
+                grid=nodes, centres=centres, distance=1.5 * size
+            )
+            nodes = nodes[far]
+            values = values[far]
+
+        nodes = np.concatenate((nodes, grid[exact]))
+        values = np.concatenate(
+            (values, np.asarray(values_func(spacing * grid[exact])))
+        )
+
+    return spacing * nodes, values
+
+
+def close_to_centres_from_grid(grid, centres, distance):
+    """Whether every (y,x) coordinate is within a distance of a centre along both y and x."""
+    offsets = np.abs(grid[:, None, :] - centres[None, :, :])
+    return np.any(np.all(offsets <= distance, axis=2), axis=1)
+
+
+def interpolation_weights_from_grid_and_nodes(grid, nodes):
+    """The vertices and barycentric weights which linearly interpolate values on the nodes of a Delaunay \
+    triangulation onto the coordinates of a grid, each of shape [total_coordinates, 3].
+
+    Parameters
+    ----------
+    grid : ndarray
+        The (y,x) coordinates of shape [total_coordinates, 2] the values are interpolated onto.
+    nodes : ndarray
+        The (y,x) nodes of shape [total_nodes, 2] the values are computed on.
+    """
+    grid = np.asarray(grid)
+
+    triangulation = Delaunay(nodes)
+    simplex = triangulation.find_simplex(grid)
+
+    vertices = np.take(triangulation.simplices, simplex, axis=0)
+    transform = np.take(triangulation.transform, simplex, axis=0)
+
+    barycentric = np.einsum("njk,nk->nj", transform[:, :2, :], grid - transform[:, 2])
+
+    return vertices, np.hstack(
+        (barycentric, 1.0 - barycentric.sum(axis=1, keepdims=True))
+    )
+
+
+def interpolated_values_from_values(values, vertices, weights):
+    """Interpolate values of shape [total_nodes] (or [total_nodes, total_components]) on the nodes of a triangulation \
+    onto the coordinates of a grid with the vertices and weights of *interpolation_weights_from_grid_and_nodes*."""
+    return np.einsum("nj,nj...->n...", weights, np.take(values, vertices, axis=0))
@@ -0,0 +1,297 @@
+import numpy as np
+from scipy import fft
+
+from autoarray import decorator_util
+
+"""
+The lensing potential and deflection angles of a pixelized convergence map, such as the projected mass of a \
+simulated halo, which are the convolution of the convergence with the kernels
+
+    psi(r) = ln(|r|) / pi        alpha(r) = r / (pi * |r|^2)
+
+computed with fast Fourier transforms of the convergence zero-padded to twice its shape, so the periodic convolution \
+of the FFT does not wrap around the edges of the map. This costs O(N log N) for a map of N pixels.
+
+Every pixel is treated as a point mass of mass convergence * pixel_area at its centre, except for the contribution \
+of a pixel to its own potential, which uses the mean of ln(|r|) over the pixel (the deflection angle of a pixel at \
+its own centre is zero by symmetry).
+"""
+
+
+def pixel_centres_from_shape(shape_2d, pixel_scales, origin):
+    """The y and x arc-second coordinates of the centres of the rows and columns of a map, where the y coordinates \
+    decrease and the x coordinates increase with the index of the row and column, as for an *aa.grid*.
+
+    Parameters
+    ----------
+    shape_2d : (int, int)
+        The number of rows and columns of the map.
+    pixel_scales : (float, float)
+        The arc-second (y,x) size of every pixel of the map.
+    origin : (float, float)
+        The arc-second (y,x) coordinates of the centre of the map.
+    """
+    y_centres = origin[0] + pixel_scales[0] * (
+        0.5 * (shape_2d[0] - 1) - np.arange(shape_2d[0])
+    )
+    x_centres = origin[1] + pixel_scales[1] * (
+        np.arange(shape_2d[1]) - 0.5 * (shape_2d[1] - 1)
+    )
+
+    return y_centres, x_centres
+
+
+def mean_log_radius_of_pixel(pixel_scales):
+    """The mean of ln(|r|) over a pixel centred on the origin, from the integral of ln(x^2 + y^2) over one of its \
+    quadrants, 0 < y < b and 0 < x < a.
+
+    Parameters
+    ----------
+    pixel_scales : (float, float)
+        The arc-second (y,x) size of the pixel.
+    """
+    b = 0.5 * pixel_scales[0]
+    a = 0.5 * pixel_scales[1]
+
+    integral = (
+        a * b * (np.log(a ** 2 + b ** 2) - 3.0)
+        + a ** 2 * np.arctan(b / a)
+        + b ** 2 * np.arctan(a / b)
+    )
+
+    return 0.5 * integral / (a * b)
+
+
+def pixel_areas_within_circle_from_shape(
+    shape_2d, pixel_scales, origin, centre, radius, order=32
+):
+    """The area of every pixel of a map within a circle, of shape [total_y_pixels, total_x_pixels].
+
+    Pixels entirely inside (outside) the circle have the area of a pixel (zero). The area of every pixel the edge of \
+    the circle crosses is the integral over x of the length of its columns within the circle, computed with a \
+    Gauss-Legendre rule of *order* nodes.
+
+    Parameters
+    ----------
+    shape_2d : (int, int)
+        The number of rows and columns of the map.
+    pixel_scales : (float, float)
+        The arc-second (y,x) size of every pixel of the map.
+    origin : (float, float)
+        The arc-second (y,x) coordinates of the centre of the map.
+    centre : (float, float)
+        The arc-second (y,x) coordinates of the centre of the circle.
+    radius : float
+        The arc-second radius of the circle.
+    order : int
+        The number of Gauss-Legendre nodes of the integral over every pixel the edge of the circle crosses.
+    """
+    y_centres, x_centres = pixel_centres_from_shape(
+        shape_2d=shape_2d, pixel_scales=pixel_scales, origin=origin
+    )
+
+    y_0, x_0 = np.meshgrid(
+        y_centres - centre[0] - 0.5 * pixel_scales[0],
+        x_centres - centre[1] - 0.5 * pixel_scales[1],
+        indexing="ij",
+    )
+    y_1 = y_0 + pixel_scales[0]
+    x_1 = x_0 + pixel_scales[1]
+
+    nearest_y = np.maximum(0.0, np.maximum(y_0, -y_1))
+    nearest_x = np.maximum(0.0, np.maximum(x_0, -x_1))
+    farthest_y = np.maximum(np.abs(y_0), np.abs(y_1))
+    farthest_x = np.maximum(np.abs(x_0), np.abs(x_1))
+
+    areas = np.zeros(shape_2d)
+    areas[farthest_y ** 2 + farthest_x ** 2 <= radius ** 2] = (
+        pixel_scales[0] * pixel_scales[1]
+    )
+
+    edge = (nearest_y ** 2 + nearest_x ** 2 < radius ** 2) & (
+        farthest_y ** 2 + farthest_x ** 2 > radius ** 2
+    )
+
+    x_lower = np.maximum(x_0[edge], -radius)[:, None]
+    x_upper = np.minimum(x_1[edge], radius)[:, None]
+
+    nodes, weights = np.polynomial.legendre.leggauss(order)
+
+    x = 0.5 * (x_upper + x_lower) + 0.5 * (x_upper - x_lower) * nodes[None, :]
+    height = np.sqrt(np.maximum(radius ** 2 - x ** 2, 0.0))
+
+    y_lower = y_0[edge][:, None]
+    y_upper = y_1[edge][:, None]
+
+    lengths = np.clip(height, y_lower, y_upper) - np.clip(-height, y_lower, y_upper)
+
+    areas[edge] = 0.5 * (x_upper[:, 0] - x_lower[:, 0]) * np.dot(lengths, weights)
+
+    return areas
+
+
+def kernels_from_shape(shape_2d, pixel_scales):
+    """The potential and (y,x) deflection angle kernels of a map, tabulated at every offset (in pixels) between two \
+    of its pixels and multiplied by the area of a pixel.
+
+    The kernels have shape [2 * shape_2d[0] - 1, 2 * shape_2d[1] - 1], with the zero offset in their centre.
+
+    Parameters
+    ----------
+    shape_2d : (int, int)
+        The number of rows and columns of the map.
+    pixel_scales : (float, float)
+        The arc-second (y,x) size of every pixel of the map.
+    """
+    row_offsets = np.arange(-(shape_2d[0] - 1), shape_2d[0])
+    column_offsets = np.arange(-(shape_2d[1] - 1), shape_2d[1])
+
+    y = -pixel_scales[0] * row_offsets[:, None] * np.ones(column_offsets.shape[0])
+    x = pixel_scales[1] * column_offsets[None, :] * np.ones((row_offsets.shape[0], 1))
+
+    radius_squared = y ** 2 + x ** 2
+
+    centre = (shape_2d[0] - 1, shape_2d[1] - 1)
+
+    radius_squared[centre] = 1.0
+
+    normalization = pixel_scales[0] * pixel_scales[1] / np.pi
+
+    potential_kernel = 0.5 * normalization * np.log(radius_squared)
+    potential_kernel[centre] = normalization * mean_log_radius_of_pixel(
+        pixel_scales=pixel_scales
+    )
+
+    deflections_y_kernel = normalization * y / radius_squared
+    deflections_x_kernel = normalization * x / radius_squared
+
+    return potential_kernel, deflections_y_kernel, deflections_x_kernel
+
+
+def potential_and_deflections_via_fft_from_convergence(convergence_2d, pixel_scales):
+    """Compute the lensing potential and (y,x) deflection angles at the centre of every pixel of a convergence map, \
+    by convolving the zero-padded map with the potential and deflection angle kernels using fast Fourier transforms.
+
+    Parameters
+    ----------
+    convergence_2d : ndarray
+        The convergence of every pixel of the map, of shape [total_y_pixels, total_x_pixels].
+    pixel_scales : (float, float)
+        The arc-second (y,x) size of every pixel of the map.
+
+    Returns
+    -------
+    (ndarray, ndarray, ndarray)
+        The potential, y deflection angle and x deflection angle of every pixel, each with the shape of the map.
+    """
+    shape_2d = convergence_2d.shape
+
+    fft_shape = (
+        fft.next_fast_len(2 * shape_2d[0] - 1, real=True),
+        fft.next_fast_len(2 * shape_2d[1] - 1, real=True),
+    )
+
+    convergence_fft = fft.rfft2(convergence_2d, s=fft_shape)
+
+    def convolved(kernel):
+        convolution = fft.irfft2(
+            convergence_fft * fft.rfft2(kernel, s=fft_shape), s=fft_shape
+        )
+        return convolution[
+            shape_2d[0] - 1 : 2 * shape_2d[0] - 1, shape_2d[1] - 1 : 2 * shape_2d[1] - 1
+        ]
+
+    return tuple(
+        convolved(kernel)
+        for kernel in kernels_from_shape(shape_2d=shape_2d, pixel_scales=pixel_scales)
+    )
+
+
+@decorator_util.jit()
+def values_via_bilinear_interpolation_from_grid(
+    grid, maps_2d, y_top, x_left, pixel_scales_y, pixel_scales_x
+):
+    """Bilinearly interpolate maps tabulated at the pixel centres of a map onto a grid of (y,x) coordinates.
+
+    Coordinates within half a pixel of the edge of the map take the values at the edge of the map.
+
+    Parameters
+    ----------
+    grid : ndarray
+        The (y, x) coordinates of shape [total_coordinates, 2] the maps are interpolated onto.
+    maps_2d : ndarray
+        The maps of shape [total_maps, total_y_pixels, total_x_pixels].
+    y_top, x_left : float
+        The arc-second y coordinate of the centres of the top row and x coordinate of the centres of the left \
+        column of the map.
+    pixel_scales_y, pixel_scales_x : float
+        The arc-second (y,x) size of every pixel of the map.
+    """
+    total_rows = maps_2d.shape[1]
+    total_columns = maps_2d.shape[2]
+
+    values = np.zeros((grid.shape[0], maps_2d.shape[0]))
+
+    for index in range(grid.shape[0]):
+
+        row = min(max((y_top - grid[index, 0]) / pixel_scales_y, 0.0), total_rows - 1.0)
+        column = min(
+            max((grid[index, 1] - x_left) / pixel_scales_x, 0.0), total_columns - 1.0
+        )
+
+        row_0 = min(int(row), max(total_rows - 2, 0))
+        column_0 = min(int(column), max(total_columns - 2, 0))
+        row_1 = min(row_0 + 1, total_rows - 1)
+        column_1 = min(column_0 + 1, total_columns - 1)
+
+        row_weight = row - row_0
+        column_weight = column - column_0
+
+        for map_index in range(maps_2d.shape[0]):
+            values[index, map_index] = (1.0 - row_weight) * (
+                (1.0 - column_weight) * maps_2d[map_index, row_0, column_0]
+                + column_weight * maps_2d[map_index, row_0, column_1]
+            ) + row_weight * (
+                (1.0 - column_weight) * maps_2d[map_index, row_1, column_0]
+                + column_weight * maps_2d[map_index, row_1, column_1]
+            )
+
+    return values
+
+
+@decorator_util.jit()
+def potential_and_deflections_via_direct_sum_from_grid(grid, pixel_centres, masses):
+    """Compute the lensing potential and (y,x) deflection angles of the pixels of a map, as point masses, at every \
+    (y,x) coordinate of a grid by summing over the pixels. This is used for coordinates outside the map, where \
+    the results of the FFT are not tabulated.
+
+    Parameters
+    ----------
+    grid : ndarray
+        The (y, x) coordinates of shape [total_coordinates, 2].
+    pixel_centres : ndarray
+        The (y,x) centre of every pixel with a non-zero mass, of shape [total_pixels, 2].
+    masses : ndarray
+        The convergence of every pixel multiplied by its area and divided by pi.
+
+    Returns
+    -------
+    ndarray
+        The potential, y deflection angle and x deflection angle at every coordinate, of shape \
+        [total_coordinates, 3].
+    """
+    values = np.zeros((grid.shape[0], 3))
+
+    for index in range(grid.shape[0]):
+        for pixel in range(pixel_centres.shape[0]):
+
+            y = grid[index, 0] - pixel_centres[pixel, 0]
+            x = grid[index, 1] - pixel_centres[pixel, 1]
+
+            radius_squared = y * y + x * x
+
+            values[index, 0] += 0.5 * masses[pixel] * np.log(radius_squared)
+            values[index, 1] += masses[pixel] * y / radius_squared
+            values[index, 2] += masses[pixel] * x / radius_squared
+
+    return values
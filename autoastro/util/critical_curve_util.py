@@ -0,0 +1,144 @@
+import numpy as np
+from scipy import ndimage
+from skimage import measure
+
+"""
+Tracing of contours of zero value, such as the critical curves of a lens where its tangential or radial eigen values \
+are zero, using a quadtree refinement of a coarse uniform grid of (y,x) coordinates.
+
+The values are computed on the nodes of the coarse grid and every cell whose corner values bracket a sign change is \
+split into four, computing the values only on the new nodes of these cells. Cells without a sign change are filled \
+by bilinear interpolation, which cannot introduce a contour. After every refinement level the contours are traced \
+with marching squares on the refined grid, so every contour is returned at the resolution of the finest level while \
+the values are only computed close to the contours.
+"""
+
+
+def contours_from_values_func(values_func, bounding_box, shape_2d, refinement_levels):
+    """Trace every contour of zero value of one or more fields, which are computed together by *values_func*.
+
+    Parameters
+    ----------
+    values_func : func
+        A function which takes an ndarray of (y,x) coordinates of shape [total_coordinates, 2] and returns a list of \
+        ndarrays of shape [total_coordinates], one for every field whose contours are traced.
+    bounding_box : [float, float, float, float]
+        The [y_min, y_max, x_min, x_max] bounding box of the coarse grid, whose corners are nodes of the grid.
+    shape_2d : (int, int)
+        The number of nodes of the coarse grid along y and x.
+    refinement_levels : int
+        The number of times cells bracketing a sign change are split into four.
+
+    Returns
+    -------
+    [[ndarray]]
+        For every field, the list of contours traced, each an ndarray of (y,x) coordinates of shape \
+        [total_points, 2].
+    """
+    y_min, y_max, x_min, x_max = bounding_box
+
+    grid = grid_from_bounding_box_and_shape(
+        bounding_box=bounding_box, shape_2d=shape_2d
+    )
+
+    values = np.stack(values_func(grid.reshape(-1, 2))).reshape((-1,) + tuple(shape_2d))
+
+    for level in range(refinement_levels):
+
+        cells_to_refine = cells_with_sign_change_from_values(values=values)
+
+        values = upsampled_values_from_values(values=values)
+
+        nodes_to_compute = nodes_to_compute_from_cells_to_refine(
+            cells_to_refine=cells_to_refine
+        )
+
+        if np.any(nodes_to_compute):
+
+            grid = grid_from_bounding_box_and_shape(
+                bounding_box=bounding_box, shape_2d=values.shape[1:]
+            )
+
+            values[:, nodes_to_compute] = np.stack(values_func(grid[nodes_to_compute]))
+
+    shape_2d = values.shape[1:]
+
+    pixel_scales = (
+        (y_max - y_min) / (shape_2d[0] - 1),
+        (x_max - x_min) / (shape_2d[1] - 1),
+    )
+
+    return [
+        [
+            np.stack(
+                (
+                    y_max - contour[:, 0] * pixel_scales[0],
+                    x_min + contour[:, 1] * pixel_scales[1],
+                ),
+                axis=-1,
+            )
+            for contour in measure.find_contours(field, 0.0)
+        ]
+        for field in values
+    ]
+
+
+def grid_from_bounding_box_and_shape(bounding_box, shape_2d):
+    """The (y,x) coordinates of the nodes of a uniform grid spanning a bounding box, of shape [shape_2d, 2], where \
+    the first row of nodes is at y_max and the first column at x_min."""
+    y_min, y_max, x_min, x_max = bounding_box
+
+    y, x = np.meshgrid(
+        np.linspace(y_max, y_min, shape_2d[0]),
+        np.linspace(x_min, x_max, shape_2d[1]),
+        indexing="ij",
+    )
+
+    return np.stack((y, x), axis=-1)
+
+
+def cells_with_sign_change_from_values(values):
+    """Flag every cell of the grid whose four corner values bracket a sign change, in any field."""
+    corners = np.stack(
+        (values[:, :-1, :-1], values[:, :-1, 1:], values[:, 1:, :-1], values[:, 1:, 1:])
+    )
+
+    with np.errstate(invalid="ignore"):
+        return np.any(
+            np.sign(np.min(corners, axis=0)) != np.sign(np.max(corners, axis=0)),
+            axis=0,
+        )
+
+
+def upsampled_values_from_values(values):
+    """Split every cell of the grid into four, filling the new nodes by bilinear interpolation."""
+    fields, rows, columns = values.shape
+
+    upsampled = np.zeros((fields, 2 * rows - 1, 2 * columns - 1))
+
+    upsampled[:, ::2, ::2] = values
+    upsampled[:, 1::2, ::2] = 0.5 * (values[:, :-1, :] + values[:, 1:, :])
+    upsampled[:, ::2, 1::2] = 0.5 * (values[:, :, :-1] + values[:, :, 1:])
+    upsampled[:, 1::2, 1::2] = 0.25 * (
+        values[:, :-1, :-1]
+        + values[:, :-1, 1:]
+        + values[:, 1:, :-1]
+        + values[:, 1:, 1:]
+    )
+
+    return upsampled
+
+
+def nodes_to_compute_from_cells_to_refine(cells_to_refine):
+    """The new nodes of the upsampled grid that lie in or on the edges of the cells being refined, which are the \
+    nodes whose values are computed rather than interpolated."""
+    rows, columns = cells_to_refine.shape
+
+    cell_centres = np.zeros((2 * rows + 1, 2 * columns + 1), dtype="bool")
+    cell_centres[1::2, 1::2] = cells_to_refine
+
+    nodes = ndimage.binary_dilation(cell_centres, structure=np.ones((3, 3)))
+
+    nodes[::2, ::2] = False
+
+    return nodes
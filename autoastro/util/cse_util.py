@@ -0,0 +1,116 @@
+import numpy as np
+
+"""
+Cored steep ellipsoid (CSE) expansion of the convergence of elliptical mass profiles (Oguri 2021). A CSE of core \
+radius s has convergence s / (2 * (s^2 + xi^2)^(3/2)), where xi is the elliptical radius sqrt(x^2 + y^2 / q^2), and \
+closed-form deflection angles. Representing a profile's convergence as a sum of CSEs with log-spaced core radii \
+therefore gives its deflection angles without any numerical integration, with the contribution of every CSE and \
+every (y,x) coordinate computed as a single NumPy broadcast of shape (pixels, cses).
+
+The expansion is computed for a dimensionless convergence profile, where radii are in units of the profile's scale \
+radius, and is rescaled to the profile's scale radius and normalization.
+"""
+
+total_cses = 60
+minimum_core = 1.0e-5
+maximum_core = 1.0e5
+radii_per_cse = 5
+max_elements_per_chunk = 2 ** 20
+
+
+def radii_for_decomposition():
+    """The dimensionless radii at which a convergence profile is fitted by its CSE expansion, which extend half a \
+    decade inside the smallest and largest core radii."""
+    return np.logspace(
+        np.log10(minimum_core) - 0.5,
+        np.log10(maximum_core) - 0.5,
+        radii_per_cse * total_cses,
+    )
+
+
+def decomposition_from_convergence(convergence):
+    """Decompose a dimensionless convergence profile, evaluated at the radii *radii_for_decomposition*, into a sum of \
+    CSEs with log-spaced core radii.
+
+    The amplitudes are fitted by linear least-squares, with every radius weighted by the inverse of the convergence so \
+    the fractional error of the expansion is minimized over the full range of radii. The core radii and amplitudes \
+    returned are read-only, so they can be shared by every profile with the same dimensionless convergence.
+
+    Parameters
+    ----------
+    convergence : ndarray
+        The dimensionless convergence at the radii *radii_for_decomposition*.
+    """
+    radii = radii_for_decomposition()
+
+    cores = np.logspace(np.log10(minimum_core), np.log10(maximum_core), total_cses)
+
+    cses = cores[None, :] / (
+        2.0 * (np.square(cores[None, :]) + np.square(radii[:, None])) ** 1.5
+    )
+
+    weights = 1.0 / convergence
+
+    amplitudes = np.linalg.lstsq(
+        cses * weights[:, None], convergence * weights, rcond=None
+    )[0]
+
+    cores.flags.writeable = False
+    amplitudes.flags.writeable = False
+
+    return cores, amplitudes
+
+
+def deflections_from_grid_and_cses(grid, axis_ratio, cores, amplitudes):
+    """Compute the deflection angles of a sum of CSEs, whose convergence is \
+    amplitude * core / (2 * (core^2 + xi^2)^(3/2)), on a grid of (y,x) coordinates in the reference frame of the CSEs.
+
+    Parameters
+    ----------
+    grid : ndarray
+        The (y,x) coordinates in the reference frame of the CSEs the deflection angles are computed on.
+    axis_ratio : float
+        The axis-ratio q of every CSE.
+    cores : ndarray
+        The core radius of every CSE.
+    amplitudes : ndarray
+        The amplitude of every CSE.
+    """
+    y = np.asarray(grid[:, 0])
+    x = np.asarray(grid[:, 1])
+
+    deflections = np.zeros((y.shape[0], 2))
+
+    chunk_size = max(1, max_elements_per_chunk // cores.shape[0])
+
+    for start in range(0, y.shape[0], chunk_size):
+
+        end = start + chunk_size
+
+        y_chunk = y[start:end, None]
+        x_chunk = x[start:end, None]
+
+        psi = np.sqrt(
+            axis_ratio ** 2 * (np.square(cores[None, :]) + np.square(x_chunk))
+            + np.square(y_chunk)
+        )
+
+        denominator = psi * (
+            np.square(psi + cores[None, :])
+            + (1.0 - axis_ratio ** 2) * np.square(x_chunk)
+        )
+
+        deflections[start:end, 0] = (
+            axis_ratio
+            * y[start:end]
+            * np.dot((psi + cores[None, :]) / denominator, amplitudes)
+        )
+        deflections[start:end, 1] = (
+            axis_ratio
+            * x[start:end]
+            * np.dot(
+                (psi + axis_ratio ** 2 * cores[None, :]) / denominator, amplitudes
+            )
+        )
+
+    return deflections
@@ -0,0 +1,135 @@
+import numpy as np
+from scipy import special
+
+from autoarray import decorator_util
+from autoastro import exc
+
+"""
+The Gauss hypergeometric function 2F1(1, b; c; w) of complex w with |w| < 1, which gives the deflection angles of \
+the elliptical power-law (Tessore & Metcalf 2015) and broken power-law (O'Riordan et al. 2020) mass profiles.
+
+Its series sum_n (b)_n / (c)_n * w^n is summed in a compiled loop, where every term is the previous term times \
+w * (b + n) / (c + n), until the geometric bound |term| * r / (1 - r) on the terms that remain is below a relative \
+tolerance of the sum. The ratio r = |w| * max(1, |(b + n) / (c + n)|) bounds the ratio of every remaining term to \
+the previous one, including when b > c (e.g. a power-law slope above 2), where (b + n) / (c + n) falls towards 1 \
+as n increases. The arithmetic is performed in float64 (complex128) or float32 (complex64) precision.
+
+The series diverges for |w| >= 1, and converges slowly as |w| tends to 1. Values with |w| >= 1, or whose series \
+has not converged after *max_terms* terms, are computed with *scipy.special.hyp2f1* instead.
+"""
+
+max_terms = 10000
+
+complex_dtypes = {"float64": "complex128", "float32": "complex64"}
+
+
+@decorator_util.jit()
+def hyp2f1_via_series_from_values(w, b, c, tolerance, hyp2f1, converged):
+    """Sum the series of 2F1(1, b; c; w) for every value of w, into *hyp2f1*, which must be an array of ones whose \
+    precision sets the precision of the sum, and flag in *converged* whether the series converged.
+
+    Parameters
+    ----------
+    w : ndarray
+        The complex values of shape [total_values] the function is computed at.
+    b, c : ndarray
+        The parameters b and c of the function for every value, of shape [total_values].
+    tolerance : float
+        The relative tolerance of the sum to which the series is truncated.
+    hyp2f1 : ndarray
+        The array of ones of shape [total_values] the function is summed into.
+    converged : ndarray
+        The boolean array of shape [total_values] which is True for every value whose series converged.
+    """
+    for index in range(w.shape[0]):
+
+        value = w[index]
+        b_n = b[index]
+        c_n = c[index]
+
+        unit = hyp2f1[index].real
+
+        abs_value = abs(value)
+
+        converged[index] = False
+
+        if abs_value >= unit:
+            continue
+
+        total = hyp2f1[index]
+        term = total
+
+        for n in range(max_terms):
+
+            term = term * (b_n / c_n) * value
+            total += term
+
+            b_n += unit
+            c_n += unit
+
+            ratio = abs_value * max(unit, abs(b_n / c_n))
+
+            if ratio < unit and (term.real ** 2 + term.imag ** 2) * (
+                ratio / (tolerance * (unit - ratio))
+            ) ** 2 <= (total.real ** 2 + total.imag ** 2):
+                converged[index] = True
+                break
+
+        hyp2f1[index] = total
+
+    return hyp2f1
+
+
+def hyp2f1_from_values(
+    b, c, w, engine="series", tolerance=1.0e-10, precision="float64"
+):
+    """Compute the hypergeometric function 2F1(1, b; c; w) for an array of complex values w, where b and c are \
+    floats or arrays which broadcast against w.
+
+    Parameters
+    ----------
+    b, c : float or ndarray
+        The parameters b and c of the function.
+    w : ndarray
+        The complex values the function is computed at. The series is only summed for |w| < 1, with other values \
+        computed with *scipy.special.hyp2f1*.
+    engine : str
+        Whether the function is computed by summing its series (series) or with *scipy.special.hyp2f1* (scipy).
+    tolerance : float
+        The relative tolerance of the sum to which the series is truncated.
+    precision : str
+        The precision of the series (float64 | float32).
+    """
+    if engine == "scipy":
+        return special.hyp2f1(1.0, b, c, w)
+
+    if engine != "series":
+        raise exc.ProfileException(
+            "The hyp2f1 engine {} is not supported".format(engine)
+        )
+
+    if precision not in complex_dtypes:
+        raise exc.ProfileException(
+            "The hyp2f1 precision {} is not supported".format(precision)
+        )
+
+    w, b, c = np.broadcast_arrays(w, b, c)
+
+    shape = w.shape
+
+    w = np.ascontiguousarray(w, dtype=complex_dtypes[precision]).ravel()
+    b = np.ascontiguousarray(b, dtype=precision).ravel()
+    c = np.ascontiguousarray(c, dtype=precision).ravel()
+
+    converged = np.zeros(w.size, dtype="bool")
+
+    hyp2f1 = hyp2f1_via_series_from_values(
+        w, b, c, tolerance, np.ones(w.size, dtype=complex_dtypes[precision]), converged
+    )
+
+    if not np.all(converged):
+        hyp2f1[~converged] = special.hyp2f1(
+            1.0, b[~converged], c[~converged], w[~converged]
+        )
+
+    return hyp2f1.reshape(shape)
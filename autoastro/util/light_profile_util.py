@@ -0,0 +1,158 @@
+import numpy as np
+
+from autoarray import decorator_util
+
+"""
+Fused kernels for the images of elliptical light profiles, which read the (y,x) coordinates of a grid and write the \
+intensity of every coordinate into a single output buffer in one pass.
+
+Every coordinate is translated to the profile centre and rotated to its orientation with a rotation matrix, moved to \
+the radial minimum if it is within it and converted to an elliptical radius, without allocating the intermediate \
+arrays of the transform_grid and move_grid_to_radial_minimum decorators.
+"""
+
+
+@decorator_util.jit()
+def elliptical_radius_from_coordinate(
+    y, x, centre_y, centre_x, cos_phi, sin_phi, axis_ratio, radial_minimum
+):
+    """The elliptical radius of a (y,x) coordinate in the reference frame of a profile, after it is moved to the \
+    radial minimum (which is applied to the circular radius and is therefore independent of the rotation)."""
+    y_shifted = y - centre_y
+    x_shifted = x - centre_x
+
+    y_profile = y_shifted * cos_phi - x_shifted * sin_phi
+    x_profile = x_shifted * cos_phi + y_shifted * sin_phi
+
+    radius_squared = y_shifted * y_shifted + x_shifted * x_shifted
+
+    if radius_squared < radial_minimum * radial_minimum:
+        if radius_squared == 0.0:
+            y_profile = radial_minimum
+            x_profile = radial_minimum
+        else:
+            rescale = radial_minimum / np.sqrt(radius_squared)
+            y_profile *= rescale
+            x_profile *= rescale
+
+    y_profile /= axis_ratio
+
+    return np.sqrt(x_profile * x_profile + y_profile * y_profile)
+
+
+@decorator_util.jit()
+def gaussian_profile_image_from_grid(
+    grid,
+    centre_y,
+    centre_x,
+    cos_phi,
+    sin_phi,
+    axis_ratio,
+    radial_minimum,
+    intensity,
+    sigma,
+):
+    """Calculate the intensity of an elliptical Gaussian light profile on a grid of (y,x) coordinates.
+
+    Parameters
+    ----------
+    grid : ndarray
+        The (y, x) coordinates of shape [total_coordinates, 2] in the original reference frame of the grid.
+    centre_y, centre_x : float
+        The (y,x) arc-second coordinates of the profile centre.
+    cos_phi, sin_phi : float
+        The cosine and sine of the rotation angle of the profile counter-clockwise from the positive x-axis.
+    axis_ratio : float
+        Ratio of the profile's ellipse's minor and major axes (b/a).
+    radial_minimum : float
+        Coordinates within this radius of the centre are moved to it.
+    intensity : float
+        Overall intensity normalisation of the light profile.
+    sigma : float
+        The sigma value of the Gaussian.
+    """
+    profile_image = np.empty(grid.shape[0])
+
+    normalization = intensity / (sigma * np.sqrt(2.0 * np.pi))
+
+    for index in range(grid.shape[0]):
+
+        radius = elliptical_radius_from_coordinate(
+            grid[index, 0],
+            grid[index, 1],
+            centre_y,
+            centre_x,
+            cos_phi,
+            sin_phi,
+            axis_ratio,
+            radial_minimum,
+        )
+
+        profile_image[index] = normalization * np.exp(
+            -0.5 * (radius / sigma) * (radius / sigma)
+        )
+
+    return profile_image
+
+
+@decorator_util.jit()
+def sersic_profile_image_from_grid(
+    grid,
+    centre_y,
+    centre_x,
+    cos_phi,
+    sin_phi,
+    axis_ratio,
+    radial_minimum,
+    intensity,
+    effective_radius,
+    sersic_index,
+    sersic_constant,
+):
+    """Calculate the intensity of an elliptical Sersic light profile on a grid of (y,x) coordinates, which is a \
+    function of the eccentric radius (the elliptical radius multiplied by the square root of the axis-ratio).
+
+    Parameters
+    ----------
+    grid : ndarray
+        The (y, x) coordinates of shape [total_coordinates, 2] in the original reference frame of the grid.
+    centre_y, centre_x : float
+        The (y,x) arc-second coordinates of the profile centre.
+    cos_phi, sin_phi : float
+        The cosine and sine of the rotation angle of the profile counter-clockwise from the positive x-axis.
+    axis_ratio : float
+        Ratio of the profile's ellipse's minor and major axes (b/a).
+    radial_minimum : float
+        Coordinates within this radius of the centre are moved to it.
+    intensity : float
+        Overall intensity normalisation of the light profile.
+    effective_radius : float
+        The circular radius containing half the light of the profile.
+    sersic_index : float
+        Controls the concentration of the profile.
+    sersic_constant : float
+        The Sersic constant b of the profile, which depends on its Sersic index.
+    """
+    profile_image = np.empty(grid.shape[0])
+
+    radius_scale = np.sqrt(axis_ratio) / effective_radius
+    exponent = 1.0 / sersic_index
+
+    for index in range(grid.shape[0]):
+
+        radius = elliptical_radius_from_coordinate(
+            grid[index, 0],
+            grid[index, 1],
+            centre_y,
+            centre_x,
+            cos_phi,
+            sin_phi,
+            axis_ratio,
+            radial_minimum,
+        )
+
+        profile_image[index] = intensity * np.exp(
+            -sersic_constant * ((radius * radius_scale) ** exponent - 1.0)
+        )
+
+    return profile_image
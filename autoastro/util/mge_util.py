@@ -0,0 +1,241 @@
+import numpy as np
+from functools import lru_cache
+from scipy.special import gamma, gammainc, wofz
+
+"""
+Multi-Gaussian expansion (MGE) of the convergence of Sersic mass profiles, which represents the profile as a sum of \
+elliptical Gaussians of fixed axis-ratio whose deflection angles have a closed-form solution in terms of the \
+Faddeeva function (Shajib 2019). The deflection angles of every Gaussian and every (y,x) coordinate are computed \
+as a single NumPy broadcast of shape (pixels, gaussians).
+
+The decomposition is computed in units where the effective radius and intensity of the profile are 1, so it depends \
+only on the Sersic index (and mass-to-light gradient) and is cached for every profile that shares these values.
+
+The accuracy of a decomposition is measured by the fractional error of the mass it encloses within circles of radii \
+from *enclosed_mass_minimum_radius* effective radii outwards, which sets the error of the deflection angles. Steep \
+profiles (e.g. a low Sersic index) are fitted with more Gaussians until this error is below \
+*enclosed_mass_tolerance*, and profiles no decomposition describes to this tolerance (e.g. the cusp of a steep \
+mass-to-light gradient, whose mass is inside the smallest Gaussian) are flagged by their error.
+"""
+
+total_gaussians = (60, 90, 120)
+minimum_sigma = 1.0e-5
+maximum_sigma = 1.0e3
+radii_per_gaussian = 4
+relative_weight_floor = 1.0e-8
+maximum_sersic_exponent = 60.0
+max_elements_per_chunk = 2 ** 20
+enclosed_mass_minimum_radius = 1.0e-2
+enclosed_mass_tolerance = 2.0e-4
+
+
+@lru_cache(maxsize=128)
+def decomposition_from_sersic_index(
+    sersic_index, sersic_constant, mass_to_light_gradient=0.0
+):
+    """Decompose the convergence profile (r)^-g * exp(-b * (r^(1/n) - 1)), where r is in units of the effective \
+    radius, into a sum of Gaussians of log-spaced sigma.
+
+    The amplitudes are fitted by linear least-squares, with every radius weighted by the inverse of the convergence \
+    so the fractional error of the expansion is minimized from the centre of the profile to the radius where the \
+    exponent exceeds *maximum_sersic_exponent* (beyond which the profile contains no mass). The profile is fitted \
+    with each number of Gaussians of *total_gaussians* in turn, until the error of its enclosed mass is below \
+    *enclosed_mass_tolerance*, and the most accurate decomposition is returned.
+
+    The sigmas and amplitudes returned are read-only, as they are shared by every profile with the same Sersic index.
+
+    Parameters
+    ----------
+    sersic_index : float
+        The Sersic index n of the profile.
+    sersic_constant : float
+        The Sersic constant b of the profile, which ensures the effective radius contains half its light.
+    mass_to_light_gradient : float
+        The radial gradient g of the mass-to-light ratio of the profile.
+
+    Returns
+    -------
+    (ndarray, ndarray, float)
+        The sigma and central convergence of every Gaussian and the maximum fractional error of the mass they \
+        enclose (see *enclosed_mass_error_from_gaussians*).
+    """
+    cutoff_radius = min(
+        maximum_sigma, (1.0 + maximum_sersic_exponent / sersic_constant) ** sersic_index
+    )
+
+    decomposition = None
+
+    for gaussians in total_gaussians:
+
+        sigmas = np.logspace(
+            np.log10(minimum_sigma), np.log10(cutoff_radius), gaussians
+        )
+        radii = np.logspace(
+            np.log10(minimum_sigma) - 1.0,
+            np.log10(cutoff_radius) + 0.5,
+            radii_per_gaussian * gaussians + 200,
+        )
+
+        convergence = (radii ** -mass_to_light_gradient) * np.exp(
+            -sersic_constant * ((radii ** (1.0 / sersic_index)) - 1.0)
+        )
+
+        weights = 1.0 / np.maximum(
+            convergence, relative_weight_floor * np.max(convergence)
+        )
+
+        amplitudes = np.linalg.lstsq(
+            np.exp(-0.5 * np.square(radii[:, None] / sigmas[None, :]))
+            * weights[:, None],
+            convergence * weights,
+            rcond=None,
+        )[0]
+
+        error = enclosed_mass_error_from_gaussians(
+            sigmas=sigmas,
+            amplitudes=amplitudes,
+            sersic_index=sersic_index,
+            sersic_constant=sersic_constant,
+            mass_to_light_gradient=mass_to_light_gradient,
+            cutoff_radius=cutoff_radius,
+        )
+
+        if decomposition is None or error < decomposition[2]:
+            decomposition = (sigmas, amplitudes, error)
+
+        if error < enclosed_mass_tolerance:
+            break
+
+    decomposition[0].flags.writeable = False
+    decomposition[1].flags.writeable = False
+
+    return decomposition
+
+
+def enclosed_mass_error_from_gaussians(
+    sigmas,
+    amplitudes,
+    sersic_index,
+    sersic_constant,
+    mass_to_light_gradient,
+    cutoff_radius,
+):
+    """The maximum fractional error of the mass a sum of circular Gaussians encloses within a circle, compared to \
+    that of the convergence profile (r)^-g * exp(-b * (r^(1/n) - 1)) they decompose, for radii from \
+    *enclosed_mass_minimum_radius* to the cutoff radius of the decomposition.
+
+    The enclosed mass of the profile (divided by 2 pi) is e^b * n * b^(-k) * gamma(k) * P(k, b * r^(1/n)), where \
+    k = n * (2 - g) and P is the regularized lower incomplete gamma function.
+    """
+    radii = np.logspace(
+        np.log10(enclosed_mass_minimum_radius), np.log10(cutoff_radius), 300
+    )
+
+    exponent = sersic_index * (2.0 - mass_to_light_gradient)
+
+    enclosed_mass = (
+        np.exp(sersic_constant)
+        * sersic_index
+        * sersic_constant ** -exponent
+        * gamma(exponent)
+        * gammainc(exponent, sersic_constant * radii ** (1.0 / sersic_index))
+    )
+
+    gaussians_enclosed_mass = np.sum(
+        amplitudes
+        * np.square(sigmas)
+        * -np.expm1(-0.5 * np.square(radii[:, None] / sigmas[None, :])),
+        axis=1,
+    )
+
+    return np.max(np.abs(gaussians_enclosed_mass - enclosed_mass) / enclosed_mass)
+
+
+def deflections_from_grid_and_gaussians(grid, axis_ratio, sigmas, amplitudes):
+    """Compute the deflection angles of a sum of elliptical Gaussians, whose convergence is \
+    amplitude * exp(-eta^2 / (2 * sigma^2)) where eta is the elliptical radius sqrt(q * x^2 + y^2 / q) used by the \
+    mass profiles, on a grid of (y,x) coordinates in the reference frame of the Gaussians.
+
+    The scaled Faddeeva form of the deflection angles is used, evaluating the Faddeeva function in the upper \
+    complex half-plane only (the deflections at y < 0 follow from the reflection symmetry of the profile), so the \
+    calculation cannot overflow. Circular Gaussians (axis_ratio = 1) use the spherical solution.
+
+    Parameters
+    ----------
+    grid : ndarray
+        The (y,x) coordinates in the reference frame of the Gaussians the deflection angles are computed on.
+    axis_ratio : float
+        The axis-ratio q of every Gaussian.
+    sigmas : ndarray
+        The sigma of every Gaussian.
+    amplitudes : ndarray
+        The central convergence of every Gaussian.
+    """
+    y = np.asarray(grid[:, 0])
+    x = np.asarray(grid[:, 1])
+
+    deflections = np.zeros((y.shape[0], 2))
+
+    chunk_size = max(1, max_elements_per_chunk // sigmas.shape[0])
+
+    for start in range(0, y.shape[0], chunk_size):
+
+        end = start + chunk_size
+
+        if 1.0 - axis_ratio < 1.0e-6:
+            deflections[start:end] = spherical_deflections_from_coordinates(
+                y=y[start:end], x=x[start:end], sigmas=sigmas, amplitudes=amplitudes
+            )
+        else:
+            deflections[start:end] = elliptical_deflections_from_coordinates(
+                y=y[start:end],
+                x=x[start:end],
+                axis_ratio=axis_ratio,
+                sigmas=sigmas,
+                amplitudes=amplitudes,
+            )
+
+    return deflections
+
+
+def elliptical_deflections_from_coordinates(y, x, axis_ratio, sigmas, amplitudes):
+
+    sigmas_major = sigmas * np.sqrt(axis_ratio)
+    scale = sigmas_major[None, :] * np.sqrt(2.0 * (1.0 - axis_ratio ** 2))
+
+    z_x = axis_ratio * x[:, None] / scale
+    z_y = axis_ratio * np.abs(y)[:, None] / scale
+
+    exponent = np.exp(
+        -np.square(z_x) * (1.0 - axis_ratio ** 2)
+        - np.square(z_y) * ((1.0 / axis_ratio ** 2) - 1.0)
+    )
+
+    sigma_func = -1j * (
+        wofz(z_x + 1j * z_y)
+        - exponent * wofz(axis_ratio * z_x + 1j * z_y / axis_ratio)
+    )
+
+    deflections = np.dot(
+        sigma_func,
+        amplitudes * sigmas_major * np.sqrt(2.0 * np.pi / (1.0 - axis_ratio ** 2)),
+    )
+
+    return np.vstack(
+        (-np.where(y < 0.0, -1.0, 1.0) * np.imag(deflections), np.real(deflections))
+    ).T
+
+
+def spherical_deflections_from_coordinates(y, x, sigmas, amplitudes):
+
+    radii_squared = np.square(y) + np.square(x)
+
+    with np.errstate(all="ignore"):
+        deflection_over_radius = np.dot(
+            -np.expm1(-0.5 * radii_squared[:, None] / np.square(sigmas[None, :])),
+            2.0 * amplitudes * np.square(sigmas),
+        ) / radii_squared
+
+    deflection_over_radius[radii_squared == 0.0] = 0.0
+
+    return np.vstack((deflection_over_radius * y, deflection_over_radius * x)).T
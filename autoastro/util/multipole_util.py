@@ -0,0 +1,504 @@
+import numpy as np
+
+from autoarray import decorator_util
+
+"""
+Deflection angles of populations of many spherical mass profiles (point-masses or truncated NFW profiles), summed \
+either directly over every member and (y,x) coordinate or with a Barnes-Hut tree of the members.
+
+The tree recursively splits the members into quadrants, and every node stores the complex multipole moments \
+a_k = sum(m_i * (z_i - z_c)^k) of the total masses m_i of its members about its centre of mass z_c. For a coordinate \
+z far from a node, the complex conjugate of the deflection angle of its members (as point-masses) is \
+sum_k a_k / (z - z_c)^(k+1). A node is approximated by this expansion when its radius is smaller than the opening \
+angle times its distance from the coordinate and the coordinate is beyond the extent of its members, and is otherwise \
+opened, with the members of the leaves that are opened computed exactly. Evaluating M coordinates therefore costs \
+O(M * log(N)) rather than O(M * N) for N members.
+
+The mass of a truncated NFW profile outside a radius R falls as R^-2, such that far from its truncation radius its \
+deflection angle is that of a point-mass of its total mass m_i times (1 - D_i / R^2). Every node therefore also \
+stores the moments b_jk = sum(w_i * (z_i - z_c)^j * conj(z_i - z_c)^k) of the weights w_i = m_i * D_i of its members, \
+whose expansion sum_jk (k+1) * b_jk / ((z - z_c)^(j+1) * conj(z - z_c)^(k+2)) is the deflection angle this tail is \
+missing. The extent of a member is the distance beyond which its deflection angle is given by these two expansions \
+to a fractional tolerance, which is zero for a point-mass and a few truncation radii for a truncated NFW profile.
+
+Every member is described by a row of *member_parameters*, which is its Einstein radius for a point-mass and its \
+(kappa_s, scale_radius, truncation_radius) for a truncated NFW profile.
+"""
+
+point_mass = 0
+truncated_nfw = 1
+
+
+@decorator_util.jit()
+def coordinate_moved_to_radial_minimum(y, x, radial_minimum):
+    """Move a (y,x) coordinate relative to the centre of a member to its radial minimum if it is within it, as \
+    *move_grid_to_radial_minimum*, returning the moved coordinate and its radius."""
+    radius_squared = y * y + x * x
+
+    if radius_squared < radial_minimum * radial_minimum:
+        if radius_squared == 0.0:
+            y = radial_minimum
+            x = radial_minimum
+        else:
+            rescale = radial_minimum / np.sqrt(radius_squared)
+            y *= rescale
+            x *= rescale
+        radius_squared = y * y + x * x
+
+    return y, x, np.sqrt(radius_squared)
+
+
+@decorator_util.jit()
+def truncated_nfw_coord_func_f(eta):
+    if eta > 1.0:
+        return np.arccos(1.0 / eta) / np.sqrt(eta * eta - 1.0)
+    elif eta < 1.0:
+        return np.arccosh(1.0 / eta) / np.sqrt(1.0 - eta * eta)
+    return 1.0
+
+
+@decorator_util.jit()
+def truncated_nfw_coord_func_k(eta, tau):
+    return np.log(eta / (np.sqrt(eta * eta + tau * tau) + tau))
+
+
+@decorator_util.jit()
+def member_deflection_from_coordinate(
+    y, x, member_parameters, member_type, radial_minimum
+):
+    """The (y,x) deflection angle of one member at a (y,x) coordinate relative to its centre.
+
+    A point-mass deflects by einstein_radius^2 / r and a truncated NFW profile by \
+    4 * kappa_s * scale_radius * M(eta) / eta, where eta = r / scale_radius (see \
+    *SphericalTruncatedNFW.deflections_from_grid*), both towards the member's centre.
+    """
+    y, x, radius = coordinate_moved_to_radial_minimum(y, x, radial_minimum)
+
+    if member_type == point_mass:
+
+        deflection = member_parameters[0] ** 2 / (radius * radius)
+
+    else:
+
+        kappa_s = member_parameters[0]
+        scale_radius = member_parameters[1]
+        tau = member_parameters[2] / scale_radius
+        tau_squared = tau * tau
+
+        eta = radius / scale_radius
+        root = np.sqrt(tau_squared + eta * eta)
+
+        m = (
+            (tau_squared + 2.0 * eta * eta - 1.0) * truncated_nfw_coord_func_f(eta)
+            + np.pi * tau
+            + (tau_squared - 1.0) * np.log(tau)
+            + root
+            * (
+                ((tau_squared - 1.0) / tau) * truncated_nfw_coord_func_k(eta, tau)
+                - np.pi
+            )
+        )
+
+        deflection = (
+            4.0
+            * kappa_s
+            * scale_radius
+            * tau_squared
+            / (tau_squared + 1.0) ** 2
+            * m
+            / (eta * radius)
+        )
+
+    return deflection * y, deflection * x
+
+
+def member_masses_from_parameters(member_parameters, member_type):
+    """The total mass of every member, such that its deflection angle tends to mass / r far from its centre (i.e. \
+    einstein_radius^2 for a point-mass)."""
+    if member_type == point_mass:
+        return member_parameters[:, 0] ** 2
+
+    kappa_s, scale_radius, truncation_radius = member_parameters.T
+
+    tau = truncation_radius / scale_radius
+
+    return (
+        4.0
+        * kappa_s
+        * scale_radius ** 2
+        * tau ** 2
+        / (tau ** 2 + 1.0) ** 2
+        * ((tau ** 2 - 1.0) * np.log(tau) + np.pi * tau - (tau ** 2 + 1.0))
+    )
+
+
+@decorator_util.jit()
+def member_radial_deflections_from_radii(member_parameters, member_type, radii):
+    """The radial deflection angle of every member at a radius from its centre."""
+    deflections = np.zeros(radii.shape[0])
+
+    for member in range(radii.shape[0]):
+        deflections[member] = member_deflection_from_coordinate(
+            radii[member], 0.0, member_parameters[member], member_type, 0.0
+        )[0]
+
+    return deflections
+
+
+def member_tails_from_parameters(member_parameters, member_type, tolerance):
+    """The tail weight w_i = m_i * D_i of every member, where its deflection angle far from its centre is that of a \
+    point-mass times (1 - D_i / R^2), and its extent, the distance beyond which the deflection angle of this tail is \
+    accurate to a fractional *tolerance*. Both are zero for a point-mass.
+
+    For a truncated NFW profile D_i is measured at 1000 truncation radii. The fractional error of the tail falls \
+    as E_i / R^3, where E_i is the largest value measured between 1 and 50 truncation radii, such that its extent is \
+    (E_i / tolerance)^(1/3), and at least its truncation radius.
+
+    Returns
+    -------
+    (ndarray, ndarray)
+        The tail weight and extent of every member.
+    """
+    if member_type == point_mass:
+        zeros = np.zeros(member_parameters.shape[0])
+        return zeros, zeros.copy()
+
+    masses = member_masses_from_parameters(
+        member_parameters=member_parameters, member_type=member_type
+    )
+    truncation_radii = member_parameters[:, 2]
+
+    def deficits_from_radii(radii):
+        return (
+            1.0
+            - radii
+            * member_radial_deflections_from_radii(
+                member_parameters, member_type, radii
+            )
+            / masses
+        )
+
+    tail_radii = 1000.0 * truncation_radii
+    tail_coefficients = deficits_from_radii(radii=tail_radii) * tail_radii ** 2
+
+    error_coefficients = np.zeros(member_parameters.shape[0])
+
+    for multiple in (1.0, 2.0, 5.0, 10.0, 20.0, 50.0):
+
+        radii = multiple * truncation_radii
+
+        error_coefficients = np.maximum(
+            error_coefficients,
+            np.abs(tail_coefficients / radii ** 2 - deficits_from_radii(radii=radii))
+            * radii ** 3,
+        )
+
+    extents = np.maximum(truncation_radii, np.cbrt(error_coefficients / tolerance))
+
+    return masses * tail_coefficients, extents
+
+
+@decorator_util.jit()
+def deflections_via_direct_sum_from_grid(
+    grid,
+    member_centres,
+    member_parameters,
+    member_type,
+    radial_minimum,
+    cutoff_radius,
+    deflections,
+):
+    """Add the deflection angles of every member at every (y,x) coordinate within the cutoff radius of its centre \
+    to *deflections*."""
+    cutoff_radius_squared = cutoff_radius * cutoff_radius
+
+    for member in range(member_centres.shape[0]):
+        for index in range(grid.shape[0]):
+
+            y = grid[index, 0] - member_centres[member, 0]
+            x = grid[index, 1] - member_centres[member, 1]
+
+            if y * y + x * x > cutoff_radius_squared:
+                continue
+
+            deflection_y, deflection_x = member_deflection_from_coordinate(
+                y, x, member_parameters[member], member_type, radial_minimum
+            )
+
+            deflections[index, 0] += deflection_y
+            deflections[index, 1] += deflection_x
+
+    return deflections
+
+
+def tree_from_members(
+    member_centres,
+    member_masses,
+    member_tail_weights,
+    member_extents,
+    leaf_size,
+    order,
+    tail_order,
+):
+    """Build the Barnes-Hut tree of a population of members, by recursively splitting the square bounding their \
+    centres into quadrants until every leaf has at most *leaf_size* members.
+
+    Parameters
+    ----------
+    member_centres : ndarray
+        The (y,x) centre of every member, of shape [total_members, 2].
+    member_masses : ndarray
+        The total mass of every member.
+    member_tail_weights : ndarray
+        The tail weight of every member (see *member_tails_from_parameters*).
+    member_extents : ndarray
+        The distance from every member within which the expansions of the nodes it is in are not used.
+    leaf_size : int
+        The maximum number of members of a leaf.
+    order : int
+        The highest order of the multipole moments of every node.
+    tail_order : int
+        The highest order j + k of the tail moments of every node.
+
+    Returns
+    -------
+    (ndarray, ...)
+        The members sorted such that every node's members are contiguous, and for every node its complex centre \
+        of mass, radius, largest member extent, four children (-1 for none), first and last member, complex \
+        multipole moments and complex tail moments.
+    """
+    total_members = member_centres.shape[0]
+
+    member_order = np.arange(total_members)
+
+    z = member_centres[:, 1] + 1j * member_centres[:, 0]
+
+    half_size = 0.5 * max(np.ptp(member_centres[:, 0]), np.ptp(member_centres[:, 1]))
+    box_centre = 0.5 * (np.min(member_centres, axis=0) + np.max(member_centres, axis=0))
+
+    node_boxes = [(box_centre[0], box_centre[1], half_size)]
+    node_starts = [0]
+    node_ends = [total_members]
+    node_children = [[-1, -1, -1, -1]]
+
+    node = 0
+
+    while node < len(node_boxes):
+
+        start, end = node_starts[node], node_ends[node]
+        centre_y, centre_x, half_size = node_boxes[node]
+
+        if end - start > leaf_size and half_size > 1.0e-8:
+
+            members = member_order[start:end]
+
+            quadrants = 2 * (member_centres[members, 0] < centre_y) + (
+                member_centres[members, 1] >= centre_x
+            )
+
+            sort = np.argsort(quadrants, kind="stable")
+
+            member_order[start:end] = members[sort]
+
+            counts = np.bincount(quadrants, minlength=4)
+
+            child_start = start
+
+            for quadrant in range(4):
+
+                if counts[quadrant] > 0:
+
+                    node_children[node][quadrant] = len(node_boxes)
+
+                    node_boxes.append(
+                        (
+                            centre_y + (0.5 if quadrant < 2 else -0.5) * half_size,
+                            centre_x + (0.5 if quadrant % 2 == 1 else -0.5) * half_size,
+                            0.5 * half_size,
+                        )
+                    )
+                    node_starts.append(child_start)
+                    node_ends.append(child_start + counts[quadrant])
+                    node_children.append([-1, -1, -1, -1])
+
+                child_start += counts[quadrant]
+
+        node += 1
+
+    total_nodes = len(node_boxes)
+
+    node_centres = np.zeros(total_nodes, dtype="complex128")
+    node_radii = np.zeros(total_nodes)
+    node_extents = np.zeros(total_nodes)
+    node_moments = np.zeros((total_nodes, order + 1), dtype="complex128")
+    node_tail_moments = np.zeros(
+        (total_nodes, tail_order + 1, tail_order + 1), dtype="complex128"
+    )
+
+    powers = np.arange(order + 1)
+    tail_powers = np.arange(tail_order + 1)
+
+    for node in range(total_nodes):
+
+        members = member_order[node_starts[node] : node_ends[node]]
+
+        masses = member_masses[members]
+
+        if np.sum(masses) > 0.0:
+            node_centres[node] = np.sum(masses * z[members]) / np.sum(masses)
+        else:
+            node_centres[node] = np.mean(z[members])
+
+        offsets = z[members] - node_centres[node]
+
+        node_radii[node] = np.max(np.abs(offsets))
+        node_extents[node] = np.max(member_extents[members])
+        node_moments[node] = np.sum(
+            masses[:, None] * offsets[:, None] ** powers[None, :], axis=0
+        )
+
+        tail_weights = member_tail_weights[members]
+
+        if np.any(tail_weights != 0.0):
+            node_tail_moments[node] = np.einsum(
+                "i,ij,ik->jk",
+                tail_weights,
+                offsets[:, None] ** tail_powers[None, :],
+                np.conj(offsets)[:, None] ** tail_powers[None, :],
+            )
+            node_tail_moments[node][
+                tail_powers[:, None] + tail_powers[None, :] > tail_order
+            ] = 0.0
+
+    return (
+        member_order,
+        node_centres,
+        node_radii,
+        node_extents,
+        np.array(node_children, dtype="int64"),
+        np.array(node_starts, dtype="int64"),
+        np.array(node_ends, dtype="int64"),
+        node_moments,
+        node_tail_moments,
+    )
+
+
+@decorator_util.jit()
+def deflections_via_tree_from_grid(
+    grid,
+    member_centres,
+    member_parameters,
+    member_type,
+    radial_minimum,
+    cutoff_radius,
+    opening_angle,
+    member_order,
+    node_centres,
+    node_radii,
+    node_extents,
+    node_children,
+    node_starts,
+    node_ends,
+    node_moments,
+    node_tail_moments,
+    deflections,
+):
+    """Add the deflection angles of every member at every (y,x) coordinate to *deflections*, by walking the \
+    Barnes-Hut tree of the members from its root.
+
+    A node entirely beyond the cutoff radius of the coordinate is skipped, and a node entirely within it whose radius \
+    is less than *opening_angle* times its distance, and whose members are all further than their extent from the \
+    coordinate, is approximated by its multipole and tail expansions. Otherwise its children are walked, or if it is \
+    a leaf the deflection angles of its members are computed exactly.
+    """
+    stack = np.zeros(node_centres.shape[0], dtype=np.int64)
+
+    for index in range(grid.shape[0]):
+
+        z = grid[index, 1] + 1j * grid[index, 0]
+
+        deflection = 0.0 + 0.0j
+
+        stack[0] = 0
+        stack_size = 1
+
+        while stack_size > 0:
+
+            stack_size -= 1
+            node = stack[stack_size]
+
+            offset = z - node_centres[node]
+            distance = np.abs(offset)
+
+            if distance - node_radii[node] > cutoff_radius:
+                continue
+
+            if (
+                node_radii[node] < opening_angle * distance
+                and distance - node_radii[node] >= node_extents[node]
+                and distance + node_radii[node] <= cutoff_radius
+            ):
+
+                inverse_offset = 1.0 / offset
+                term = inverse_offset
+                expansion = 0.0 + 0.0j
+
+                for k in range(node_moments.shape[1]):
+                    expansion += node_moments[node, k] * term
+                    term *= inverse_offset
+
+                deflection += np.conj(expansion)
+
+                if node_tail_moments[node, 0, 0] != 0.0:
+
+                    inverse_offset_conj = np.conj(inverse_offset)
+                    tail = 0.0 + 0.0j
+                    term_j = inverse_offset
+
+                    for j in range(node_tail_moments.shape[1]):
+                        term_k = inverse_offset_conj * inverse_offset_conj
+                        for k in range(node_tail_moments.shape[2] - j):
+                            tail += (
+                                (k + 1)
+                                * node_tail_moments[node, j, k]
+                                * term_j
+                                * term_k
+                            )
+                            term_k *= inverse_offset_conj
+                        term_j *= inverse_offset
+
+                    deflection -= tail
+
+            elif (
+                node_children[node, 0] < 0
+                and node_children[node, 1] < 0
+                and (node_children[node, 2] < 0 and node_children[node, 3] < 0)
+            ):
+
+                for position in range(node_starts[node], node_ends[node]):
+
+                    member = member_order[position]
+
+                    y = grid[index, 0] - member_centres[member, 0]
+                    x = grid[index, 1] - member_centres[member, 1]
+
+                    if y * y + x * x > cutoff_radius * cutoff_radius:
+                        continue
+
+                    deflection_y, deflection_x = member_deflection_from_coordinate(
+                        y, x, member_parameters[member], member_type, radial_minimum
+                    )
+
+                    deflection += deflection_x + 1j * deflection_y
+
+            else:
+
+                for child in range(4):
+                    if node_children[node, child] >= 0:
+                        stack[stack_size] = node_children[node, child]
+                        stack_size += 1
+
+        deflections[index, 0] += deflection.imag
+        deflections[index, 1] += deflection.real
+
+    return deflections
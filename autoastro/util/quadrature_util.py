@@ -0,0 +1,136 @@
+import numpy as np
+from functools import lru_cache
+
+"""
+Fixed-order Gauss-Legendre quadrature of the 1D integrals over u in [0, 1] that appear in the deflection angles of \
+elliptical mass profiles (e.g. Keeton 2001). Every integrand is evaluated for all (y,x) coordinates and all quadrature \
+nodes as a single NumPy broadcast of shape (pixels, nodes), as opposed to *pyquad.quad_grid* which integrates each \
+coordinate adaptively in turn.
+
+The integrals are performed using the substitution u = t^2, which removes the 1/sqrt(u) behaviour of cuspy \
+convergence profiles at u -> 0 and means the Gauss-Legendre nodes are concentrated where these integrands vary most.
+"""
+
+minimum_order = 8
+maximum_order = 256
+pixels_for_order_estimate = 64
+max_elements_per_chunk = 2 ** 21
+
+
+@lru_cache(maxsize=None)
+def nodes_and_weights_from_order(order):
+    """The Gauss-Legendre nodes u and weights of the integral over u in [0, 1], including the Jacobian of the \
+    u = t^2 substitution.
+
+    The nodes and weights are cached, so all profiles integrated at the same order share the same node set.
+
+    Parameters
+    ----------
+    order : int
+        The number of Gauss-Legendre nodes.
+    """
+    nodes, weights = np.polynomial.legendre.leggauss(order)
+    t = 0.5 * (nodes + 1.0)
+    return np.square(t), weights * t
+
+
+def integral_from_grid(func, grid, args=(), order=64):
+    """Integrate a function *func(u, y, x, *args)* over u in [0, 1] for every (y,x) coordinate on a grid, using a \
+    fixed-order Gauss-Legendre rule.
+
+    The function must accept NumPy arrays for u, y and x, which are broadcast against one another with shapes \
+    (1, nodes), (pixels, 1) and (pixels, 1). Large grids are evaluated in chunks of pixels to bound memory use.
+
+    Parameters
+    ----------
+    func : (u, y, x, *args) -> ndarray
+        The integrand, which must be vectorized over u, y and x.
+    grid : ndarray
+        The (y,x) coordinates the integral is computed for.
+    args : tuple
+        The additional arguments passed to the integrand.
+    order : int
+        The number of Gauss-Legendre nodes.
+    """
+    u, weights = nodes_and_weights_from_order(order)
+    u = u[None, :]
+
+    y = np.asarray(grid[:, 0])[:, None]
+    x = np.asarray(grid[:, 1])[:, None]
+
+    integral = np.zeros(y.shape[0])
+
+    chunk_size = max(1, max_elements_per_chunk // order)
+
+    for start in range(0, y.shape[0], chunk_size):
+        end = start + chunk_size
+        integral[start:end] = np.dot(
+            func(u, y[start:end], x[start:end], *args), weights
+        )
+
+    return integral
+
+
+def order_from_tolerance(func, grid, args=(), tolerance=1.0e-6):
+    """Estimate the number of Gauss-Legendre nodes needed to integrate a function over u in [0, 1] for every \
+    coordinate on a grid to a fractional accuracy *tolerance*.
+
+    The integral is computed for a subset of coordinates spread evenly in radius (including the innermost and \
+    outermost coordinates, where the integrands are most sharply peaked) with the order doubled until two \
+    successive estimates agree to within the tolerance.
+
+    If the estimates still disagree at *maximum_order* the integrand is too sharply peaked for the fixed-order rule, \
+    which is returned with *converged* set to False so the caller can integrate adaptively instead.
+
+    Parameters
+    ----------
+    func : (u, y, x, *args) -> ndarray
+        The integrand, which must be vectorized over u, y and x.
+    grid : ndarray
+        The (y,x) coordinates the integral is computed for.
+    args : tuple
+        The additional arguments passed to the integrand.
+    tolerance : float
+        The fractional accuracy the integral is computed to.
+
+    Returns
+    -------
+    (int, bool)
+        The order of the Gauss-Legendre rule and whether it meets the tolerance.
+    """
+    grid = np.asarray(grid)
+
+    radii = np.sqrt(np.square(grid[:, 0]) + np.square(grid[:, 1]))
+    sorted_indexes = np.argsort(radii)
+    sample_indexes = sorted_indexes[
+        np.unique(
+            np.linspace(
+                0, radii.shape[0] - 1, min(radii.shape[0], pixels_for_order_estimate)
+            ).astype("int")
+        )
+    ]
+    sample_grid = grid[sample_indexes]
+
+    order = minimum_order
+    integral = integral_from_grid(func=func, grid=sample_grid, args=args, order=order)
+
+    while order < maximum_order:
+
+        integral_refined = integral_from_grid(
+            func=func, grid=sample_grid, args=args, order=2 * order
+        )
+
+        with np.errstate(all="ignore"):
+            fractional_error = np.abs(integral_refined - integral) / np.abs(
+                integral_refined
+            )
+
+        fractional_error = fractional_error[np.isfinite(fractional_error)]
+
+        if fractional_error.size == 0 or np.max(fractional_error) < tolerance:
+            return order, True
+
+        order *= 2
+        integral = integral_refined
+
+    return maximum_order, False
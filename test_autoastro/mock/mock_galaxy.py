@@ -6,17 +6,24 @@ class MockGalaxy:
         self.value = value
         self.shape = shape
 
-    def profile_image_from_grid(self, grid):
-        return np.full(shape=self.shape, fill_value=self.value)
+    def values_from_shape(self, shape, out):
+        values = np.full(shape=shape, fill_value=self.value)
+        if out is None:
+            return values
+        out += values
+        return out
 
-    def convergence_from_grid(self, grid):
-        return np.full(shape=self.shape, fill_value=self.value)
+    def profile_image_from_grid(self, grid, out=None):
+        return self.values_from_shape(shape=self.shape, out=out)
 
-    def potential_from_grid(self, grid):
-        return np.full(shape=self.shape, fill_value=self.value)
+    def convergence_from_grid(self, grid, out=None):
+        return self.values_from_shape(shape=self.shape, out=out)
 
-    def deflections_from_grid(self, grid):
-        return np.full(shape=(self.shape, 2), fill_value=self.value)
+    def potential_from_grid(self, grid, out=None):
+        return self.values_from_shape(shape=self.shape, out=out)
+
+    def deflections_from_grid(self, grid, out=None):
+        return self.values_from_shape(shape=(self.shape, 2), out=out)
 
 
 class MockHyperGalaxy:
@@ -360,3 +360,93 @@ class TestCompareToManual:
         )
 
         assert likelihood == pytest.approx(fit.likelihood, 1e-4)
+
+
+class TestMemo:
+    def test__same_parameters_fitted_again__model_data_and_likelihood_from_memo(
+        self, gal_data_7x7, sub_mask_7x7, monkeypatch, tmp_path
+    ):
+        galaxy_fit_data = aast.masked.galaxy_data(
+            galaxy_data=gal_data_7x7, mask=sub_mask_7x7, use_convergence=True
+        )
+
+        def galaxy_from_einstein_radius(einstein_radius):
+            return aast.Galaxy(
+                redshift=0.5,
+                mass=aast.mp.SphericalIsothermal(einstein_radius=einstein_radius),
+            )
+
+        fit = aast.fit_galaxy(
+            galaxy_data=galaxy_fit_data,
+            model_galaxies=[galaxy_from_einstein_radius(1.0)],
+        )
+
+        memo = aast.galaxy.fit_galaxy.GalaxyFitMemo(directory=str(tmp_path))
+
+        monkeypatch.setattr(aast.fit_galaxy, "memo", memo)
+
+        for einstein_radius in [1.0, 2.0, 1.0]:
+            memo_fit = aast.fit_galaxy(
+                galaxy_data=galaxy_fit_data,
+                model_galaxies=[galaxy_from_einstein_radius(einstein_radius)],
+            )
+
+        assert memo.fits.hits == 1
+        assert memo.fits.misses == 2
+        assert memo_fit.likelihood == fit.likelihood
+        assert (memo_fit.model_data == fit.model_data).all()
+        assert len(os.listdir(str(tmp_path))) == 2
+
+        # A new memo of the same directory, as in a resumed search, loads the fit.
+
+        memo = aast.galaxy.fit_galaxy.GalaxyFitMemo(directory=str(tmp_path))
+
+        monkeypatch.setattr(aast.fit_galaxy, "memo", memo)
+
+        memo_fit = aast.fit_galaxy(
+            galaxy_data=galaxy_fit_data,
+            model_galaxies=[galaxy_from_einstein_radius(1.0)],
+        )
+
+        assert memo_fit.likelihood == fit.likelihood
+        assert memo_fit.model_data.in_2d == pytest.approx(fit.model_data.in_2d, 1e-8)
+        assert memo_fit.chi_squared == pytest.approx(fit.chi_squared, 1e-8)
+
+
+class TestGalaxyDatasetFit:
+    def test__likelihood_is_sum_of_likelihoods_of_individual_fits(
+        self, gal_data_7x7, sub_mask_7x7
+    ):
+        galaxy_fit_datas = [
+            aast.masked.galaxy_data(
+                galaxy_data=gal_data_7x7, mask=sub_mask_7x7, use_deflections_y=True
+            ),
+            aast.masked.galaxy_data(
+                galaxy_data=gal_data_7x7, mask=sub_mask_7x7, use_deflections_x=True
+            ),
+        ]
+
+        galaxy = aast.Galaxy(
+            redshift=0.5,
+            mass=aast.mp.EllipticalIsothermal(axis_ratio=0.8, einstein_radius=1.0),
+        )
+
+        fit = aast.fit_galaxy_dataset(
+            galaxy_dataset=aast.masked.galaxy_dataset(
+                masked_galaxy_datas=galaxy_fit_datas
+            ),
+            model_galaxies=[galaxy],
+        )
+
+        fits = [
+            aast.fit_galaxy(galaxy_data=galaxy_fit_data, model_galaxies=[galaxy])
+            for galaxy_fit_data in galaxy_fit_datas
+        ]
+
+        assert fit.galaxy_fits[1].model_data == pytest.approx(
+            fits[1].model_data, 1.0e-8
+        )
+        assert fit.likelihood == pytest.approx(
+            fits[0].likelihood + fits[1].likelihood, 1.0e-8
+        )
+        assert fit.figure_of_merit == fit.likelihood
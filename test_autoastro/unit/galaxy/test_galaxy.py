@@ -7,6 +7,7 @@ import autoarray as aa
 from autoarray.structures import grids
 import autoastro as aast
 from autoastro import exc
+from autoastro.profiles import geometry_profiles
 from test_autoastro.mock import mock_cosmology
 
 import os
@@ -834,6 +835,24 @@ class TestMassProfiles:
 
             assert (mp_deflections == gal_deflections).all()
 
+        def test__out_buffer__deflections_of_galaxies_added_into_it_in_place(
+            self, gal_x1_mp, gal_x2_mp
+        ):
+            grid = aa.grid_irregular.manual_1d([[1.05, -0.55], [0.5, 0.3]])
+
+            out = np.ones((2, 2))
+
+            deflections = gal_x1_mp.deflections_from_grid(grid=grid, out=out)
+            deflections = gal_x2_mp.deflections_from_grid(grid=grid, out=out)
+
+            assert np.shares_memory(deflections, out)
+            assert out == pytest.approx(
+                1.0
+                + gal_x1_mp.deflections_from_grid(grid=grid)
+                + gal_x2_mp.deflections_from_grid(grid=grid),
+                1.0e-8,
+            )
+
         def test__coordinates_in__coordinates_out(
             self, mp_0, gal_x1_mp, mp_1, gal_x2_mp
         ):
@@ -1621,6 +1640,77 @@ class TestMassAndLightProfiles:
         assert 2 == len(gal_multi_profiles.mass_profiles)
 
 
+class TestCacheProfileResults:
+    def test__unchanged_profiles_taken_from_cache__changed_profiles_evaluated(
+        self, monkeypatch
+    ):
+        monkeypatch.setattr(aast.Galaxy, "cache_profile_results", True)
+        monkeypatch.setattr(
+            aast.Galaxy, "profile_results", geometry_profiles.GridCache()
+        )
+
+        grid = aa.grid.uniform(shape_2d=(4, 4), pixel_scales=0.5, sub_size=1)
+
+        def galaxy_from_einstein_radius(einstein_radius):
+            return aast.Galaxy(
+                redshift=0.5,
+                shear=aast.mp.ExternalShear(magnitude=0.1, phi=30.0),
+                sis=aast.mp.SphericalIsothermal(einstein_radius=einstein_radius),
+            )
+
+        deflections = galaxy_from_einstein_radius(1.0).deflections_from_grid(grid=grid)
+
+        assert aast.Galaxy.profile_results.misses == 2
+
+        deflections_1 = galaxy_from_einstein_radius(1.0).deflections_from_grid(
+            grid=grid
+        )
+
+        assert aast.Galaxy.profile_results.hits == 2
+        assert (deflections_1 == deflections).all()
+
+        galaxy = galaxy_from_einstein_radius(2.0)
+
+        deflections = galaxy.deflections_from_grid(grid=grid)
+
+        assert aast.Galaxy.profile_results.hits == 3
+        assert aast.Galaxy.profile_results.misses == 3
+
+        monkeypatch.setattr(aast.Galaxy, "cache_profile_results", False)
+
+        assert deflections == pytest.approx(
+            galaxy.deflections_from_grid(grid=grid), 1.0e-8
+        )
+
+    def test__profiles_with_different_result_settings__not_taken_from_cache(
+        self, monkeypatch
+    ):
+        monkeypatch.setattr(aast.Galaxy, "cache_profile_results", True)
+        monkeypatch.setattr(
+            aast.Galaxy, "profile_results", geometry_profiles.GridCache()
+        )
+
+        grid = aa.grid.uniform(shape_2d=(4, 4), pixel_scales=0.5, sub_size=1)
+
+        power_law = aast.mp.EllipticalPowerLaw(
+            axis_ratio=0.7, phi=30.0, einstein_radius=1.0, slope=2.2
+        )
+        power_law_float32 = aast.mp.EllipticalPowerLaw(
+            axis_ratio=0.7, phi=30.0, einstein_radius=1.0, slope=2.2
+        )
+        power_law_float32.hyp2f1_precision = "float32"
+
+        assert power_law.parameters_key != power_law_float32.parameters_key
+
+        aast.Galaxy(redshift=0.5, mass=power_law).deflections_from_grid(grid=grid)
+        aast.Galaxy(redshift=0.5, mass=power_law_float32).deflections_from_grid(
+            grid=grid
+        )
+
+        assert aast.Galaxy.profile_results.hits == 0
+        assert aast.Galaxy.profile_results.misses == 2
+
+
 class TestSummarizeInUnits:
     def test__galaxy_with_two_light_and_mass_profiles(self, lp_0, lp_1, mp_0, mp_1):
 
@@ -1699,12 +1789,12 @@ class TestSummarizeInUnits:
         i += 1
         assert (
             summary_text[i]
-            == "einstein_radius                                   2.99 arcsec"
+            == "einstein_radius                                   3.00 arcsec"
         )
         i += 1
         assert (
             summary_text[i]
-            == "einstein_mass                                     2.8177e+01 angular"
+            == "einstein_mass                                     2.8274e+01 angular"
         )
         i += 1
         assert (
@@ -1728,7 +1818,7 @@ class TestSummarizeInUnits:
         i += 1
         assert (
             summary_text[i]
-            == "einstein_mass                                     3.1308e+00 angular"
+            == "einstein_mass                                     3.1416e+00 angular"
         )
         i += 1
         assert (
@@ -1752,7 +1842,7 @@ class TestSummarizeInUnits:
         i += 1
         assert (
             summary_text[i]
-            == "einstein_mass                                     1.2523e+01 angular"
+            == "einstein_mass                                     1.2566e+01 angular"
         )
         i += 1
         assert (
@@ -104,6 +104,102 @@ class TestGalaxyFitData:
         assert (gal_data_7x7.grid.interpolator.vtx == new_grid.interpolator.vtx).all()
         assert (gal_data_7x7.grid.interpolator.wts == new_grid.interpolator.wts).all()
 
+    def test__interpolation_error_target__adaptive_interpolation_of_profile_quantity(
+        self, gal_data_7x7, sub_mask_7x7
+    ):
+
+        galaxy = aast.Galaxy(
+            redshift=0.5,
+            mass=aast.mp.SphericalIsothermal(centre=(0.1, -0.2), einstein_radius=1.0),
+        )
+
+        image = aa.array.ones(shape_2d=(80, 80), pixel_scales=0.05)
+        gal_data = aast.galaxy_data(image=image, noise_map=image, pixel_scales=0.05)
+
+        mask = aa.mask.circular(
+            shape_2d=(80, 80), pixel_scales=0.05, radius=1.5, sub_size=2
+        )
+
+        galaxy_fit_data = aast.masked.galaxy_data(
+            galaxy_data=gal_data, mask=mask, use_deflections_y=True
+        )
+
+        deflections_y = galaxy_fit_data.profile_quantity_from_galaxies(
+            galaxies=[galaxy]
+        )
+
+        galaxy_fit_data = aast.masked.galaxy_data(
+            galaxy_data=gal_data,
+            mask=mask,
+            pixel_scale_interpolation_grid=1.0,
+            interpolation_error_target=1.0e-3,
+            interpolation_refinement_levels=3,
+            use_deflections_y=True,
+        )
+
+        assert galaxy_fit_data.profile_quantity_from_galaxies(
+            galaxies=[galaxy]
+        ).in_1d_binned == pytest.approx(deflections_y.in_1d_binned, abs=2.0e-3)
+
+        assert galaxy_fit_data.interpolation_weights.misses == 1
+
+        galaxy_fit_data.profile_quantity_from_galaxies(galaxies=[galaxy])
+
+        assert galaxy_fit_data.interpolation_weights.hits == 1
+
+        with pytest.raises(exc.GalaxyException):
+            aast.masked.galaxy_data(
+                galaxy_data=gal_data_7x7,
+                mask=sub_mask_7x7,
+                interpolation_error_target=1.0e-3,
+                use_deflections_y=True,
+            )
+
+    def test__interpolation_error_target__fewer_evaluations_than_coordinates(
+        self, gal_data_7x7, sub_mask_7x7
+    ):
+
+        galaxy = aast.Galaxy(
+            redshift=0.5,
+            mass=aast.mp.SphericalIsothermal(centre=(0.1, -0.2), einstein_radius=1.0),
+        )
+
+        galaxy_fit_data = aast.masked.galaxy_data(
+            galaxy_data=gal_data_7x7,
+            mask=sub_mask_7x7,
+            pixel_scale_interpolation_grid=1.0,
+            interpolation_error_target=1.0e-3,
+            interpolation_refinement_levels=3,
+            use_deflections_y=True,
+        )
+
+        profile_quantity_from_galaxies_and_grid = (
+            galaxy_fit_data.profile_quantity_from_galaxies_and_grid
+        )
+        evaluations = []
+
+        def profile_quantity_counted(galaxies, grid):
+            evaluations.append(grid.shape[0])
+            return profile_quantity_from_galaxies_and_grid(galaxies=galaxies, grid=grid)
+
+        galaxy_fit_data.profile_quantity_from_galaxies_and_grid = (
+            profile_quantity_counted
+        )
+
+        # The coarse grid of the 3x3 mask alone has more nodes than its sub-grid has coordinates, so the profile
+        # quantity is computed on the grid.
+
+        deflections_y = galaxy_fit_data.profile_quantity_from_galaxies(
+            galaxies=[galaxy]
+        )
+
+        assert sum(evaluations) <= galaxy_fit_data.grid.shape[0]
+        assert galaxy_fit_data.interpolation_weights.misses == 0
+        assert deflections_y.in_1d_binned == pytest.approx(
+            galaxy.deflections_from_grid(grid=galaxy_fit_data.grid).in_1d_binned[:, 0],
+            1.0e-8,
+        )
+
     def test__gal_data_7x7_image(self, gal_data_7x7, sub_mask_7x7):
 
         galaxy_fit_data = aast.masked.galaxy_data(
@@ -572,3 +668,78 @@ class TestGalaxyFitData:
                 use_potential=True,
                 use_deflections_x=True,
             )
+
+
+class TestMaskedGalaxyDataset:
+    def test__deflections_y_and_x__same_as_individual_data__deflections_computed_once(
+        self, gal_data_7x7, sub_mask_7x7
+    ):
+        galaxy = aast.Galaxy(
+            redshift=0.5,
+            mass=aast.mp.EllipticalIsothermal(
+                centre=(0.1, 0.2), axis_ratio=0.8, einstein_radius=1.0
+            ),
+        )
+
+        galaxy_fit_datas = [
+            aast.masked.galaxy_data(
+                galaxy_data=gal_data_7x7, mask=sub_mask_7x7, use_deflections_y=True
+            ),
+            aast.masked.galaxy_data(
+                galaxy_data=gal_data_7x7, mask=sub_mask_7x7, use_deflections_x=True
+            ),
+            aast.masked.galaxy_data(
+                galaxy_data=gal_data_7x7, mask=sub_mask_7x7, use_convergence=True
+            ),
+        ]
+
+        galaxy_dataset = aast.masked.galaxy_dataset(
+            masked_galaxy_datas=galaxy_fit_datas
+        )
+
+        calls = []
+
+        deflections_from_grid = galaxy.deflections_from_grid
+
+        def counted_deflections_from_grid(grid, out=None):
+            calls.append(grid)
+            return deflections_from_grid(grid=grid, out=out)
+
+        galaxy.deflections_from_grid = counted_deflections_from_grid
+
+        profile_quantities = galaxy_dataset.profile_quantities_from_galaxies(
+            galaxies=[galaxy]
+        )
+
+        assert len(calls) == 1
+
+        for galaxy_fit_data, profile_quantity in zip(
+            galaxy_fit_datas, profile_quantities
+        ):
+            assert profile_quantity == pytest.approx(
+                galaxy_fit_data.profile_quantity_from_galaxies(galaxies=[galaxy]),
+                1.0e-8,
+            )
+
+        assert profile_quantities[1] == pytest.approx(
+            deflections_from_grid(grid=galaxy_fit_datas[0].grid)[:, 1], 1.0e-8
+        )
+
+    def test__different_masks__raises_exception(
+        self, gal_data_7x7, mask_7x7, sub_mask_7x7
+    ):
+        with pytest.raises(exc.GalaxyException):
+            aast.masked.galaxy_dataset(
+                masked_galaxy_datas=[
+                    aast.masked.galaxy_data(
+                        galaxy_data=gal_data_7x7,
+                        mask=sub_mask_7x7,
+                        use_deflections_y=True,
+                    ),
+                    aast.masked.galaxy_data(
+                        galaxy_data=gal_data_7x7,
+                        mask=mask_7x7,
+                        use_deflections_x=True,
+                    ),
+                ]
+            )
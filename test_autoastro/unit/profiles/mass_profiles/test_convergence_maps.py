@@ -0,0 +1,205 @@
+import autofit as af
+import autoarray as aa
+import autoastro as aast
+import numpy as np
+import pytest
+from autoastro import exc
+
+
+@pytest.fixture(autouse=True)
+def reset_config():
+    """
+    Use configuration from the default path. You may want to change this to set a specific path.
+    """
+    af.conf.instance = af.conf.default
+
+
+convergence = np.array(
+    [
+        [0.1, 0.2, 0.0, 0.4, 0.1],
+        [0.3, 1.5, 0.7, 0.2, 0.0],
+        [0.0, 0.6, 2.0, 0.8, 0.3],
+        [0.2, 0.1, 0.5, 0.4, 0.1],
+    ]
+)
+
+
+def pixel_sum_from_grid(grid, convergence_map):
+    """The potential and deflection angles of the pixels of a map as point masses, excluding the pixel a \
+    coordinate is at the centre of."""
+    y_centres, x_centres = convergence_map.pixel_centres
+    masses = convergence_map.convergence * 0.1 * 0.2 / np.pi
+
+    values = np.zeros((grid.shape[0], 3))
+
+    for index, (y, x) in enumerate(grid):
+        for row, y_centre in enumerate(y_centres):
+            for column, x_centre in enumerate(x_centres):
+
+                radius_squared = (y - y_centre) ** 2 + (x - x_centre) ** 2
+
+                if radius_squared > 1.0e-12:
+                    values[index] += masses[row, column] * np.array(
+                        [
+                            0.5 * np.log(radius_squared),
+                            (y - y_centre) / radius_squared,
+                            (x - x_centre) / radius_squared,
+                        ]
+                    )
+
+    return values
+
+
+class TestConvergenceMap:
+    def test__convergence_from_grid__pixel_values_inside_map_zero_outside(self):
+
+        convergence_map = aast.mp.ConvergenceMap(
+            convergence=convergence, pixel_scales=(0.1, 0.2), origin=(1.0, 0.5)
+        )
+
+        grid = aa.grid.uniform(
+            shape_2d=(4, 5), pixel_scales=(0.1, 0.2), origin=(1.0, 0.5), sub_size=1
+        )
+
+        assert convergence_map.convergence_from_grid(grid=grid).in_2d == pytest.approx(
+            convergence, 1.0e-8
+        )
+
+        grid = aa.grid_irregular.manual_1d([[1.16, 0.02], [0.96, 0.5], [3.0, 0.5]])
+
+        assert convergence_map.convergence_from_grid(grid=grid) == pytest.approx(
+            np.array([0.1, 2.0, 0.0]), 1.0e-8
+        )
+
+    def test__potential_and_deflections_at_pixel_centres__same_as_sum_over_pixels(self):
+
+        convergence_map = aast.mp.ConvergenceMap(
+            convergence=convergence, pixel_scales=(0.1, 0.2), origin=(1.0, 0.5)
+        )
+
+        grid = aa.grid.uniform(
+            shape_2d=(4, 5), pixel_scales=(0.1, 0.2), origin=(1.0, 0.5), sub_size=1
+        )
+
+        pixel_sum = pixel_sum_from_grid(
+            grid=np.asarray(grid), convergence_map=convergence_map
+        )
+
+        deflections = convergence_map.deflections_from_grid(grid=grid)
+
+        assert deflections == pytest.approx(pixel_sum[:, 1:], 1.0e-8)
+
+        pixel_potential = (
+            convergence.ravel()
+            * 0.1
+            * 0.2
+            / np.pi
+            * aast.util.convergence_map_util.mean_log_radius_of_pixel(
+                pixel_scales=(0.1, 0.2)
+            )
+        )
+
+        potential = convergence_map.potential_from_grid(grid=grid)
+
+        assert potential == pytest.approx(pixel_sum[:, 0] + pixel_potential, 1.0e-8)
+
+    def test__potential_and_deflections_outside_map__same_as_sum_over_pixels(self):
+
+        convergence_map = aast.mp.ConvergenceMap(
+            convergence=convergence, pixel_scales=(0.1, 0.2), origin=(1.0, 0.5)
+        )
+
+        grid = aa.grid_irregular.manual_1d([[3.0, 0.5], [-2.0, 4.0]])
+
+        pixel_sum = pixel_sum_from_grid(
+            grid=np.asarray(grid), convergence_map=convergence_map
+        )
+
+        assert convergence_map.potential_from_grid(grid=grid) == pytest.approx(
+            pixel_sum[:, 0], 1.0e-8
+        )
+        assert convergence_map.deflections_from_grid(grid=grid) == pytest.approx(
+            pixel_sum[:, 1:], 1.0e-8
+        )
+
+    def test__single_pixel__deflections_same_as_point_mass(self):
+
+        convergence_map = aast.mp.ConvergenceMap(
+            convergence=np.array([[np.pi]]), pixel_scales=1.0, origin=(0.5, -0.5)
+        )
+        point_mass = aast.mp.PointMass(centre=(0.5, -0.5), einstein_radius=1.0)
+
+        grid = aa.grid_irregular.manual_1d([[2.0, 1.0], [-3.0, 0.5]])
+
+        assert convergence_map.deflections_from_grid(grid=grid) == pytest.approx(
+            point_mass.deflections_from_grid(grid=grid), 1.0e-8
+        )
+
+    def test__mass_within_circle__convergence_times_pixel_area_within_circle(self):
+
+        convergence_map = aast.mp.ConvergenceMap(
+            convergence=2.0 * np.ones((10, 10)), pixel_scales=0.1, origin=(0.5, -0.5)
+        )
+
+        assert convergence_map.mass_within_circularized_radius(
+            radius=0.3
+        ) == pytest.approx(2.0 * np.pi * 0.3 ** 2, 1.0e-4)
+        assert convergence_map.mass_within_circularized_radius(
+            radius=1.0
+        ) == pytest.approx(2.0, 1.0e-8)
+        assert convergence_map.mass_within_circle_in_units(radius=1.0) == pytest.approx(
+            2.0, 1.0e-8
+        )
+
+        galaxy = aast.Galaxy(redshift=0.5, mass=convergence_map)
+
+        assert galaxy.einstein_radius_in_units() == pytest.approx(
+            np.sqrt(2.0 / np.pi), 1.0e-4
+        )
+
+    def test__convergence_bounding_box__extent_of_map(self):
+
+        convergence_map = aast.mp.ConvergenceMap(
+            convergence=convergence, pixel_scales=(0.1, 0.2), origin=(1.0, 0.5)
+        )
+
+        assert convergence_map.convergence_bounding_box() == pytest.approx(
+            [0.8, 1.2, 0.0, 1.0], 1.0e-8
+        )
+
+        galaxy = aast.Galaxy(redshift=0.5, mass=convergence_map)
+
+        assert galaxy.convergence_bounding_box() == pytest.approx(
+            [0.8, 1.2, 0.0, 1.0], 1.0e-8
+        )
+
+        convergence_map = aast.mp.ConvergenceMap(
+            convergence=2.0 * np.ones((10, 10)), pixel_scales=0.1, origin=(0.5, -0.5)
+        )
+
+        assert len(convergence_map.critical_curves) > 0
+
+    def test__from_array_and_units(self):
+
+        array = aa.array.manual_2d(
+            array=convergence, pixel_scales=(0.1, 0.2), origin=(1.0, 0.5)
+        )
+
+        convergence_map = aast.mp.ConvergenceMap.from_array(array=array)
+
+        assert convergence_map == aast.mp.ConvergenceMap(
+            convergence=convergence, pixel_scales=(0.1, 0.2), origin=(1.0, 0.5)
+        )
+
+        convergence_map = convergence_map.new_object_with_units_converted(
+            unit_length="kpc", kpc_per_arcsec=2.0
+        )
+
+        assert convergence_map.unit_length == "kpc"
+        assert convergence_map.pixel_scales == pytest.approx((0.2, 0.4), 1.0e-8)
+        assert convergence_map.origin == pytest.approx((2.0, 1.0), 1.0e-8)
+
+    def test__convergence_not_2d__raises_exception(self):
+
+        with pytest.raises(exc.ProfileException):
+            aast.mp.ConvergenceMap(convergence=np.ones(3), pixel_scales=0.1)
@@ -1,11 +1,13 @@
 import numpy as np
 import pytest
 from astropy import cosmology as cosmo
+from scipy.integrate import quad
 
 import autofit as af
 import autoarray as aa
 from autoarray.structures import grids
 import autoastro as aast
+from autoastro.profiles.mass_profiles import dark_mass_profiles
 
 from test_autoastro.mock import mock_cosmology
 
@@ -748,6 +750,127 @@ class TestAbstractNFW:
         assert mass_at_truncation_radius == pytest.approx(177609204745.61484, 1.0e-4)
 
 
+class TestGeneralizedNFWIntegralTable:
+    def test__interpolated_integrals_match_quad(self):
+
+        table = dark_mass_profiles.gnfw_integral_table()
+
+        eta = np.array([1.0e-5, 0.003, 0.5, 1.0, 7.0, 2000.0])
+
+        for inner_slope in [0.33, 1.0, 1.77]:
+
+            surface_density_integral = table.surface_density_integral_from_eta(
+                eta=eta, inner_slope=inner_slope
+            )
+            deflection_integral = table.deflection_integral_from_eta(
+                eta=eta, inner_slope=inner_slope
+            )
+
+            for i in range(eta.shape[0]):
+
+                assert surface_density_integral[i] == pytest.approx(
+                    quad(
+                        lambda y: (3 - inner_slope)
+                        * (y + eta[i]) ** (inner_slope - 4)
+                        * (1 - np.sqrt(1 - y ** 2)),
+                        a=0.0,
+                        b=1.0,
+                        points=(min(eta[i], 0.5),),
+                        epsabs=0.0,
+                        limit=200,
+                    )[0],
+                    1.0e-5,
+                )
+                assert deflection_integral[i] == pytest.approx(
+                    quad(
+                        lambda y: (y + eta[i]) ** (inner_slope - 3)
+                        * ((1 - np.sqrt(1 - y ** 2)) / y),
+                        a=0.0,
+                        b=1.0,
+                        points=(min(eta[i], 0.5),),
+                        epsabs=0.0,
+                        limit=200,
+                    )[0],
+                    1.0e-5,
+                )
+
+    def test__values_outside_table__computed_with_quad(self):
+
+        table = dark_mass_profiles.GeneralizedNFWIntegralTable.from_quadrature(
+            minimum_log_eta=-1.0,
+            maximum_log_eta=1.0,
+            total_eta=21,
+            inner_slopes=np.linspace(0.5, 1.5, 5),
+        )
+
+        eta = np.array([0.01, 0.5, 100.0])
+
+        assert table.deflection_integral_from_eta(
+            eta=eta, inner_slope=1.0
+        ) == pytest.approx(
+            dark_mass_profiles.gnfw_integral_table().deflection_integral_from_eta(
+                eta=eta, inner_slope=1.0
+            ),
+            1.0e-4,
+        )
+        assert table.surface_density_integral_from_eta(
+            eta=eta, inner_slope=2.0
+        ) == pytest.approx(
+            dark_mass_profiles.gnfw_integral_table().surface_density_integral_from_eta(
+                eta=eta, inner_slope=2.0
+            ),
+            1.0e-4,
+        )
+
+    def test__table_saved_to_and_loaded_from_integral_table_path(self, tmpdir):
+
+        file_path = os.path.join(str(tmpdir), "gnfw_integral_table.npz")
+
+        table = dark_mass_profiles.GeneralizedNFWIntegralTable.from_quadrature(
+            total_eta=21, inner_slopes=np.linspace(0.5, 1.5, 5)
+        )
+        table.save(file_path=file_path)
+
+        dark_mass_profiles.AbstractEllipticalGeneralizedNFW.integral_table_path = (
+            file_path
+        )
+
+        try:
+            table_loaded = dark_mass_profiles.gnfw_integral_table()
+        finally:
+            dark_mass_profiles.AbstractEllipticalGeneralizedNFW.integral_table_path = (
+                None
+            )
+            dark_mass_profiles.gnfw_integral_tables.pop(file_path)
+
+        assert (table_loaded.log_eta == table.log_eta).all()
+        assert (table_loaded.deflection_integrals == table.deflection_integrals).all()
+
+    def test__integral_table_path_without_extension__table_reloaded_from_npz_file(
+        self, tmpdir, monkeypatch
+    ):
+
+        file_path = os.path.join(str(tmpdir), "gnfw_integral_table")
+
+        table = dark_mass_profiles.GeneralizedNFWIntegralTable.from_quadrature(
+            total_eta=21, inner_slopes=np.linspace(0.5, 1.5, 5)
+        )
+        table.save(file_path=file_path)
+
+        assert os.path.isfile(file_path + ".npz")
+
+        monkeypatch.setattr(
+            dark_mass_profiles.AbstractEllipticalGeneralizedNFW,
+            "integral_table_path",
+            file_path,
+        )
+        monkeypatch.setattr(dark_mass_profiles, "gnfw_integral_tables", {})
+
+        table_loaded = dark_mass_profiles.gnfw_integral_table()
+
+        assert (table_loaded.log_eta == table.log_eta).all()
+
+
 class TestGeneralizedNFW:
     def test__constructor_and_units(self):
         # gnfw = aast.EllipticalGeneralizedNFW(centre=(0.7, 1.0), axis_ratio=0.7, phi=45.0,
@@ -816,6 +939,37 @@ class TestGeneralizedNFW:
         #                                    phi=90.0, inner_slope=1.5, scale_radius=1.0)
         # assert gnfw.convergence_from_grid(grid=aa.grid_irregular.manual_1d([[0.0, 1.0]])) == pytest.approx(0.30840 * 2, 1e-3)
 
+    def test__convergence_func__vectorized_and_matches_quad(self):
+        gnfw = aast.mp.EllipticalGeneralizedNFW(
+            centre=(0.0, 0.0), kappa_s=1.0, inner_slope=1.5, scale_radius=2.0
+        )
+
+        grid_radius = np.array([0.01, 0.5, 2.0, 10.0])
+
+        convergence = gnfw.convergence_func(grid_radius=grid_radius)
+
+        assert convergence.shape == (4,)
+        assert (grid_radius == np.array([0.01, 0.5, 2.0, 10.0])).all()
+
+        for radius, value in zip(grid_radius, convergence):
+
+            eta = radius / 2.0
+
+            integral = quad(
+                lambda y: (y + eta) ** (1.5 - 4) * (1 - np.sqrt(1 - y ** 2)),
+                a=0.0,
+                b=1.0,
+                epsabs=0.0,
+            )[0]
+
+            assert value == pytest.approx(
+                2.0 * eta ** (1 - 1.5) * ((1 + eta) ** (1.5 - 3) + 1.5 * integral),
+                1.0e-5,
+            )
+            assert gnfw.convergence_func(grid_radius=radius) == pytest.approx(
+                value, 1.0e-8
+            )
+
     def test__potential_correct_values(self):
         gnfw = aast.mp.SphericalGeneralizedNFW(
             centre=(0.0, 0.0), kappa_s=1.0, inner_slope=0.5, scale_radius=8.0
@@ -866,6 +1020,64 @@ class TestGeneralizedNFW:
         # assert deflections[0, 0] == pytest.approx(-5.99032, 1e-3)
         # assert deflections[0, 1] == pytest.approx(-4.02541, 1e-3)
 
+    def test__deflections__cse_engine__correct_values(self):
+        gnfw = aast.mp.EllipticalGeneralizedNFW(
+            centre=(0.0, 0.0),
+            kappa_s=1.0,
+            axis_ratio=0.3,
+            phi=100.0,
+            inner_slope=0.5,
+            scale_radius=8.0,
+        )
+        gnfw.deflections_engine = "cse"
+
+        deflections = gnfw.deflections_from_grid(
+            grid=aa.grid_irregular.manual_1d([[0.1875, 0.1625]])
+        )
+        assert deflections[0, 0] == pytest.approx(0.26604, 1e-3)
+        assert deflections[0, 1] == pytest.approx(0.58988, 1e-3)
+
+        gnfw = aast.mp.EllipticalGeneralizedNFW(
+            centre=(0.3, 0.2),
+            kappa_s=2.5,
+            axis_ratio=0.5,
+            phi=100.0,
+            inner_slope=1.5,
+            scale_radius=4.0,
+        )
+        gnfw.deflections_engine = "cse"
+
+        deflections = gnfw.deflections_from_grid(
+            grid=aa.grid_irregular.manual_1d([[0.1875, 0.1625]])
+        )
+        assert deflections[0, 0] == pytest.approx(-5.99032, 1e-3)
+        assert deflections[0, 1] == pytest.approx(-4.02541, 1e-3)
+
+        gnfw = aast.mp.SphericalGeneralizedNFW(
+            centre=(0.3, 0.2), kappa_s=2.5, inner_slope=1.5, scale_radius=4.0
+        )
+        gnfw.deflections_engine = "cse"
+
+        deflections = gnfw.deflections_from_grid(
+            grid=aa.grid_irregular.manual_1d([[0.1875, 0.1625]])
+        )
+        assert deflections[0, 0] == pytest.approx(-9.31254, 1e-3)
+        assert deflections[0, 1] == pytest.approx(-3.10418, 1e-3)
+
+    def test__cse_decomposition__shared_by_profiles_with_same_inner_slope(self):
+        gnfw_0 = aast.mp.EllipticalGeneralizedNFW(
+            kappa_s=1.0, inner_slope=1.5, scale_radius=1.0
+        )
+        gnfw_1 = aast.mp.EllipticalGeneralizedNFW(
+            kappa_s=2.0, inner_slope=1.5, scale_radius=3.0
+        )
+
+        cores_0, amplitudes_0 = gnfw_0.cse_cores_and_amplitudes
+        cores_1, amplitudes_1 = gnfw_1.cse_cores_and_amplitudes
+
+        assert cores_1 == pytest.approx(3.0 * cores_0, 1e-8)
+        assert amplitudes_1 == pytest.approx(18.0 * amplitudes_0, 1e-8)
+
     def test__convergence__change_geometry(self):
         gnfw_0 = aast.mp.SphericalGeneralizedNFW(centre=(0.0, 0.0))
         gnfw_1 = aast.mp.SphericalGeneralizedNFW(centre=(1.0, 1.0))
@@ -990,6 +1202,34 @@ class TestGeneralizedNFW:
         assert (interp_deflections_manual_y == interp_deflections[:, 0]).all()
         assert (interp_deflections_manual_x == interp_deflections[:, 1]).all()
 
+    def test__spherical_profile_with_radial_table__same_as_direct_values(self):
+
+        grid = aa.grid_irregular.manual_1d(
+            [[0.1625, 0.1625], [1.0, -2.0], [-0.3, 0.05], [2.5, 1.5]]
+        )
+
+        gnfw = aast.mp.SphericalGeneralizedNFW(
+            centre=(0.1, 0.2), kappa_s=0.5, inner_slope=1.5, scale_radius=2.0
+        )
+
+        convergence = gnfw.convergence_from_grid(grid=grid)
+        potential = gnfw.potential_from_grid(grid=grid)
+        deflections = gnfw.deflections_from_grid(grid=grid)
+
+        gnfw = aast.mp.SphericalGeneralizedNFW(
+            centre=(0.1, 0.2), kappa_s=0.5, inner_slope=1.5, scale_radius=2.0
+        )
+        gnfw.radial_table = True
+
+        assert gnfw.convergence_from_grid(grid=grid) == pytest.approx(
+            convergence, 1.0e-5
+        )
+        assert gnfw.potential_from_grid(grid=grid) == pytest.approx(potential, 1.0e-5)
+        assert gnfw.deflections_from_grid(grid=grid) == pytest.approx(
+            deflections, 1.0e-5
+        )
+        assert len(gnfw.radial_tables) == 3
+
     # def test__compare_to_nfw(self):
     #     nfw = aast.mp.EllipticalNFW(centre=(0.0, 0.0), axis_ratio=0.8, phi=0.0, kappa_s=1.0, scale_radius=5.0)
     #     gnfw = aast.EllipticalGeneralizedNFW(centre=(0.0, 0.0), axis_ratio=0.8, phi=0.0, kappa_s=1.0,
@@ -1694,6 +1934,36 @@ class TestNFW:
             0
         ] == pytest.approx(1.388511, 1e-3)
 
+    def test__hessian__spherical_analytic_matches_stencil(self):
+        nfw = aast.mp.SphericalNFW(centre=(0.1, -0.2), kappa_s=0.3, scale_radius=2.0)
+
+        grid = aa.grid_irregular.manual_1d([[1.0, 0.5], [-0.3, 2.5], [0.7, -1.1]])
+
+        for component, component_via_stencil in zip(
+            nfw.hessian_from_grid(grid=grid),
+            nfw.hessian_via_stencil_from_grid(grid=grid),
+        ):
+            assert component == pytest.approx(
+                component_via_stencil, rel=1.0e-5, abs=1.0e-8
+            )
+
+    def test__coord_func_and_convergence_func__vectorized(self):
+        assert aast.mp.EllipticalNFW.coord_func(
+            np.array([2.0, 0.5, 1.0])
+        ) == pytest.approx(np.array([0.60459978, 1.5206919, 1.0]), 1.0e-6)
+        assert aast.mp.EllipticalNFW.coord_func(2.0) == pytest.approx(
+            0.60459978, 1.0e-6
+        )
+
+        nfw = aast.mp.SphericalNFW(centre=(0.0, 0.0), kappa_s=1.0, scale_radius=1.0)
+
+        assert nfw.convergence_func(
+            grid_radius=np.array([2.0, 0.5, 1.0])
+        ) == pytest.approx(np.array([0.263600141, 1.388511, 2.0 / 3.0]), 1.0e-5)
+        assert nfw.convergence_func(grid_radius=2.0) == pytest.approx(
+            0.263600141, 1.0e-6
+        )
+
     def test__potential_correct_values(self):
         nfw = aast.mp.SphericalNFW(centre=(0.3, 0.2), kappa_s=2.5, scale_radius=4.0)
         assert nfw.potential_from_grid(
@@ -1780,6 +2050,30 @@ class TestNFW:
         assert deflections[0][0][0] == pytest.approx(-2.59480, 1e-3)
         assert deflections[0][0][1] == pytest.approx(-0.44204, 1e-3)
 
+    def test__deflections__cse_engine__same_as_quad_grid(self):
+        nfw = aast.mp.EllipticalNFW(
+            centre=(0.3, 0.2), axis_ratio=0.7, phi=6.0, kappa_s=2.5, scale_radius=4.0
+        )
+        nfw.deflections_engine = "cse"
+
+        deflections = nfw.deflections_from_grid(
+            grid=aa.grid_irregular.manual_1d([[0.1625, 0.1625]])
+        )
+        assert deflections[0, 0] == pytest.approx(-2.59480, 1e-3)
+        assert deflections[0, 1] == pytest.approx(-0.44204, 1e-3)
+
+    def test__deflections__gauss_legendre_engine__same_as_quad_grid(self):
+        nfw = aast.mp.EllipticalNFW(
+            centre=(0.3, 0.2), axis_ratio=0.7, phi=6.0, kappa_s=2.5, scale_radius=4.0
+        )
+        nfw.deflections_engine = "gauss_legendre"
+
+        deflections = nfw.deflections_from_grid(
+            grid=aa.grid_irregular.manual_1d([[0.1625, 0.1625]])
+        )
+        assert deflections[0, 0] == pytest.approx(-2.59480, 1e-3)
+        assert deflections[0, 1] == pytest.approx(-0.44204, 1e-3)
+
     def test__deflections_of_elliptical_profile__use_interpolate_and_cache_decorators(
         self
     ):
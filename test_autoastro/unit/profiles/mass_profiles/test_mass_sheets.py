@@ -446,3 +446,18 @@ class TestExternalShear:
         deflections = shear.deflections_from_grid(grid=grid)
 
         assert deflections.shape_2d == (2, 2)
+
+    def test__hessian__analytic_matches_stencil(self):
+
+        grid = aa.grid_irregular.manual_1d([[1.0, 0.5], [-0.3, 2.5]])
+
+        for mass_profile in [
+            aast.mp.MassSheet(centre=(0.1, -0.2), kappa=0.3),
+            aast.mp.ExternalShear(magnitude=0.1, phi=35.0),
+        ]:
+
+            for component, component_via_stencil in zip(
+                mass_profile.hessian_from_grid(grid=grid),
+                mass_profile.hessian_via_stencil_from_grid(grid=grid),
+            ):
+                assert component == pytest.approx(component_via_stencil, 1.0e-6)
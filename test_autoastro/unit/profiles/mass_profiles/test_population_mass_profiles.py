@@ -0,0 +1,268 @@
+import numpy as np
+import pytest
+
+import autofit as af
+import autoarray as aa
+import autoastro as aast
+from autoastro import exc
+
+
+@pytest.fixture(autouse=True)
+def reset_config():
+    """
+    Use configuration from the default path. You may want to change this to set a specific path.
+    """
+    af.conf.instance = af.conf.default
+
+
+grid = aa.grid_irregular.manual_1d(
+    [[1.0, 1.0], [2.0, 2.0], [3.0, 3.0], [2.0, 4.0], [0.1, -0.2], [-1.5, 0.5]]
+)
+
+truncated_nfws = [
+    aast.mp.SphericalTruncatedNFW(
+        centre=(0.0, 0.0), kappa_s=0.05, scale_radius=0.3, truncation_radius=1.0
+    ),
+    aast.mp.SphericalTruncatedNFW(
+        centre=(1.0, -0.5), kappa_s=0.1, scale_radius=0.2, truncation_radius=0.8
+    ),
+    aast.mp.SphericalTruncatedNFW(
+        centre=(-1.2, 0.4), kappa_s=0.02, scale_radius=0.5, truncation_radius=2.0
+    ),
+]
+
+
+class TestSphericalTruncatedNFWPopulation:
+    def test__convergence_and_deflections__same_as_sum_of_member_profiles(self):
+
+        population = aast.mp.SphericalTruncatedNFWPopulation.from_profiles(
+            profiles=truncated_nfws
+        )
+
+        assert population.total_members == 3
+        assert population.kappa_s == pytest.approx([0.05, 0.1, 0.02], 1.0e-8)
+
+        convergence = sum(
+            profile.convergence_from_grid(grid=grid) for profile in truncated_nfws
+        )
+
+        assert population.convergence_from_grid(grid=grid) == pytest.approx(
+            convergence, 1.0e-4
+        )
+
+        deflections = sum(
+            profile.deflections_from_grid(grid=grid) for profile in truncated_nfws
+        )
+
+        assert population.deflections_from_grid(grid=grid) == pytest.approx(
+            deflections, 1.0e-4
+        )
+
+    def test__cutoff_radius__members_only_contribute_within_it(self):
+
+        population = aast.mp.SphericalTruncatedNFWPopulation.from_profiles(
+            profiles=truncated_nfws[0:1], cutoff_radius=1.0
+        )
+
+        convergence = population.convergence_from_grid(grid=grid)
+        deflections = population.deflections_from_grid(grid=grid)
+
+        assert convergence[0:4] == pytest.approx(np.zeros(4), 1.0e-8)
+        assert deflections[0:4] == pytest.approx(np.zeros((4, 2)), 1.0e-8)
+
+        assert convergence[4] == pytest.approx(
+            truncated_nfws[0].convergence_from_grid(grid=grid)[4], 1.0e-4
+        )
+        assert deflections[4] == pytest.approx(
+            truncated_nfws[0].deflections_from_grid(grid=grid)[4], 1.0e-4
+        )
+
+    def test__member_arrays_of_different_lengths__raises_exception(self):
+
+        with pytest.raises(exc.ProfileException):
+            aast.mp.SphericalTruncatedNFWPopulation(
+                centres=[(0.0, 0.0), (1.0, 1.0)],
+                kappa_s=[0.05],
+                scale_radii=[0.3, 0.3],
+                truncation_radii=[1.0, 1.0],
+            )
+
+    def test__mass_within_circle__sum_of_member_profiles(self):
+
+        population = aast.mp.SphericalTruncatedNFWPopulation.from_profiles(
+            profiles=truncated_nfws
+        )
+
+        assert population.mass_within_circularized_radius(radius=1.5) == pytest.approx(
+            sum(
+                profile.mass_within_circularized_radius(radius=1.5)
+                for profile in truncated_nfws
+            ),
+            1.0e-4,
+        )
+        assert population.mass_within_circle_in_units(radius=1.5) == pytest.approx(
+            sum(
+                profile.mass_within_circle_in_units(radius=1.5)
+                for profile in truncated_nfws
+            ),
+            1.0e-4,
+        )
+
+        galaxy = aast.Galaxy(redshift=0.5, subhalos=population)
+
+        einstein_radius = galaxy.einstein_radius_in_units()
+
+        assert galaxy.mass_within_circle_in_units(
+            radius=einstein_radius
+        ) == pytest.approx(np.pi * einstein_radius ** 2.0, 1.0e-4)
+
+    def test__in_galaxy__deflections_summed_with_other_mass_profiles(self):
+
+        isothermal = aast.mp.SphericalIsothermal(einstein_radius=1.0)
+
+        population = aast.mp.SphericalTruncatedNFWPopulation.from_profiles(
+            profiles=truncated_nfws
+        )
+
+        galaxy = aast.Galaxy(redshift=0.5, mass=isothermal, subhalos=population)
+
+        grid = aa.grid.uniform(shape_2d=(3, 3), pixel_scales=0.5, sub_size=1)
+
+        assert galaxy.deflections_from_grid(grid=grid) == pytest.approx(
+            isothermal.deflections_from_grid(grid=grid)
+            + sum(
+                profile.deflections_from_grid(grid=grid) for profile in truncated_nfws
+            ),
+            1.0e-4,
+        )
+        assert galaxy.mass_profile_centres == [(0.0, 0.0)]
+
+
+class TestPointMassPopulation:
+    def test__deflections__same_as_sum_of_member_profiles(self):
+
+        point_masses = [
+            aast.mp.PointMass(centre=(0.0, 0.0), einstein_radius=1.0),
+            aast.mp.PointMass(centre=(0.5, -1.0), einstein_radius=0.2),
+        ]
+
+        population = aast.mp.PointMassPopulation.from_profiles(profiles=point_masses)
+
+        assert population.is_point_mass
+
+        deflections = sum(
+            profile.deflections_from_grid(grid=grid) for profile in point_masses
+        )
+
+        assert population.deflections_from_grid(grid=grid) == pytest.approx(
+            deflections, 1.0e-8
+        )
+        assert population.convergence_from_grid(grid=grid) == pytest.approx(
+            np.zeros(6), 1.0e-8
+        )
+
+    def test__mass_within_circle_and_einstein_radius__sum_of_member_masses(self):
+
+        population = aast.mp.PointMassPopulation(
+            centres=[(0.0, 0.0), (0.5, -1.0)], einstein_radii=[0.3, 0.4]
+        )
+
+        assert population.mass_within_circularized_radius(radius=1.0) == pytest.approx(
+            np.pi * 0.25, 1.0e-8
+        )
+        assert population.einstein_radius == pytest.approx(0.5, 1.0e-8)
+
+        galaxy = aast.Galaxy(redshift=0.5, point_masses=population)
+
+        assert galaxy.einstein_radius_in_units() == pytest.approx(0.5, 1.0e-4)
+        assert galaxy.convergence_bounding_box() == pytest.approx(
+            [-1.5, 1.5, -1.5, 1.5], 1.0e-4
+        )
+        assert len(galaxy.critical_curves) > 0
+
+
+class TestDeflectionsEngine:
+    def test__tree_engine__same_as_direct_engine_for_many_members(self):
+
+        centres = np.random.RandomState(seed=1).uniform(-3.0, 3.0, size=(300, 2))
+
+        grid = aa.grid.uniform(shape_2d=(10, 10), pixel_scales=0.7, sub_size=1)
+
+        point_masses = aast.mp.PointMassPopulation(
+            centres=centres, einstein_radii=np.full(300, 0.05)
+        )
+
+        deflections = point_masses.deflections_from_grid(grid=grid)
+
+        point_masses.deflections_engine = "tree"
+
+        assert point_masses.deflections_from_grid(grid=grid) == pytest.approx(
+            deflections, abs=1.0e-4
+        )
+
+    def test__tree_engine__truncated_nfws__relative_error_below_member_tolerance(self):
+
+        random = np.random.RandomState(seed=1)
+
+        centres = random.uniform(-3.0, 3.0, size=(300, 2))
+        scale_radii = random.uniform(0.02, 0.1, size=300)
+
+        grid = aa.grid.uniform(shape_2d=(10, 10), pixel_scales=0.7, sub_size=1)
+
+        truncated_nfws = aast.mp.SphericalTruncatedNFWPopulation(
+            centres=centres,
+            kappa_s=random.uniform(0.05, 0.3, size=300),
+            scale_radii=scale_radii,
+            truncation_radii=scale_radii * random.uniform(3.0, 15.0, size=300),
+        )
+
+        deflections = np.asarray(truncated_nfws.deflections_from_grid(grid=grid))
+
+        truncated_nfws.deflections_engine = "tree"
+
+        deflections_tree = np.asarray(truncated_nfws.deflections_from_grid(grid=grid))
+
+        relative_errors = np.hypot(*(deflections_tree - deflections).T) / np.hypot(
+            *deflections.T
+        )
+
+        assert np.max(relative_errors) < truncated_nfws.tree_member_tolerance
+
+    def test__tree_engine_with_cutoff_radius__same_as_direct_engine(self):
+
+        centres = np.random.RandomState(seed=2).uniform(-3.0, 3.0, size=(100, 2))
+
+        grid = aa.grid.uniform(shape_2d=(10, 10), pixel_scales=0.7, sub_size=1)
+
+        population = aast.mp.PointMassPopulation(
+            centres=centres, einstein_radii=np.full(100, 0.05), cutoff_radius=1.0
+        )
+
+        deflections = population.deflections_from_grid(grid=grid)
+
+        population.deflections_engine = "tree"
+
+        assert population.deflections_from_grid(grid=grid) == pytest.approx(
+            deflections, abs=1.0e-4
+        )
+
+    def test__unsupported_engine__raises_exception(self):
+
+        population = aast.mp.PointMassPopulation(
+            centres=[(0.0, 0.0)], einstein_radii=[1.0]
+        )
+        population.deflections_engine = "fmm"
+
+        with pytest.raises(exc.ProfileException):
+            population.deflections_from_grid(grid=grid)
+
+    def test__tree_opening_angle_not_below_one__raises_exception(self):
+
+        population = aast.mp.PointMassPopulation(
+            centres=[(0.0, 0.0)], einstein_radii=[1.0]
+        )
+        population.deflections_engine = "tree"
+        population.tree_opening_angle = 1.0
+
+        with pytest.raises(exc.ProfileException):
+            population.deflections_from_grid(grid=grid)
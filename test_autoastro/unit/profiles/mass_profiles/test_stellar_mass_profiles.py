@@ -206,8 +206,8 @@ class TestEllipticalGaussian:
             deflections_via_integrator, 1.0e-2
         )
 
-    def test__deflections_via_grid__uses_integrator_if_analytic_fails_else_analytic(
-        self
+    def test__deflections_via_grid__same_as_analytic_and_finite_where_unscaled_form_overflows(
+        self,
     ):
 
         gaussian = aast.mp.EllipticalGaussian(
@@ -224,14 +224,8 @@ class TestEllipticalGaussian:
         deflections_via_analytic = gaussian.deflections_from_grid_via_analytic(
             grid=aa.grid_irregular.manual_1d([[-1.0, 0.0]])
         )
-        deflections_via_integrator = gaussian.deflections_from_grid_via_integrator(
-            grid=aa.grid_irregular.manual_1d([[-1.0, 0.0]])
-        )
 
-        assert deflections[0, 0] == deflections_via_analytic[0, 0]
-        assert deflections[0, 1] == deflections_via_analytic[0, 1]
-        assert deflections[0, 0] != deflections_via_integrator[0, 0]
-        assert deflections[0, 1] != deflections_via_integrator[0, 1]
+        assert deflections == pytest.approx(deflections_via_analytic, 1.0e-8)
 
         gaussian = aast.mp.EllipticalGaussian(
             centre=(-0.0, -0.0),
@@ -241,23 +235,34 @@ class TestEllipticalGaussian:
             mass_to_light_ratio=7.0,
         )
 
-        pytest.warns(RuntimeWarning)
         deflections = gaussian.deflections_from_grid(
-            grid=aa.grid_irregular.manual_1d([[-5.0, 0.0]])
+            grid=aa.grid_irregular.manual_1d([[-5.0, 0.0], [-500.0, 0.0]])
         )
-        deflections_via_analytic = gaussian.deflections_from_grid_via_analytic(
-            grid=aa.grid_irregular.manual_1d([[-5.0, 0.0]])
+
+        assert np.all(np.isfinite(deflections))
+
+        # Far from the profile its deflection angles are those of a point mass with the same total mass.
+
+        amplitude = 7.0 * 3.0 * np.sqrt(2.0 * np.pi) / 0.1
+
+        assert deflections[1, 0] == pytest.approx(
+            -2.0 * amplitude * 0.1 ** 2 / 0.2 / 500.0, 1.0e-4
         )
-        deflections_via_integrator = gaussian.deflections_from_grid_via_integrator(
-            grid=aa.grid_irregular.manual_1d([[-5.0, 0.0]])
+        assert deflections[1, 1] == pytest.approx(0.0, abs=1.0e-8)
+
+        gaussian = aast.mp.EllipticalGaussian(
+            centre=(0.0, 0.0),
+            axis_ratio=0.9999,
+            intensity=3.0,
+            sigma=0.1,
+            mass_to_light_ratio=7.0,
         )
 
-        assert deflections[0, 0] != deflections_via_analytic[0, 0]
-        assert deflections[0, 1] != deflections_via_analytic[0, 1]
-        # pytest wont raise the warning so these fail >_>.
+        deflections = gaussian.deflections_from_grid(
+            grid=aa.grid_irregular.manual_1d([[0.0, 100.0]])
+        )
 
-    #   assert deflections[0, 0] == deflections_via_integrator[0, 0]
-    #   assert deflections[0, 1] == deflections_via_integrator[0, 1]
+        assert np.all(np.isfinite(deflections))
 
     def test__intensity_as_radius__correct_value(self):
         gaussian = aast.mp.EllipticalGaussian(
@@ -499,6 +504,54 @@ class TestSersic:
         assert deflections[0][1][0] == pytest.approx(1.1446, 1e-3)
         assert deflections[0][1][1] == pytest.approx(0.79374, 1e-3)
 
+    def test__deflections__gauss_legendre_engine__same_as_quad_grid(self):
+        sersic = aast.mp.EllipticalSersic(
+            centre=(-0.4, -0.2),
+            axis_ratio=0.8,
+            phi=110.0,
+            intensity=5.0,
+            effective_radius=0.2,
+            sersic_index=2.0,
+            mass_to_light_ratio=1.0,
+        )
+        sersic.deflections_engine = "gauss_legendre"
+
+        deflections = sersic.deflections_from_grid(
+            grid=aa.grid_irregular.manual_1d([[0.1625, 0.1625]])
+        )
+        assert deflections[0, 0] == pytest.approx(1.1446, 1e-3)
+        assert deflections[0, 1] == pytest.approx(0.79374, 1e-3)
+
+    def test__deflections__mge_engine__same_as_quad_grid(self):
+        sersic = aast.mp.EllipticalSersic(
+            centre=(-0.4, -0.2),
+            axis_ratio=0.8,
+            phi=110.0,
+            intensity=5.0,
+            effective_radius=0.2,
+            sersic_index=2.0,
+            mass_to_light_ratio=1.0,
+        )
+        sersic.deflections_engine = "mge"
+
+        deflections = sersic.deflections_from_grid(
+            grid=aa.grid_irregular.manual_1d([[0.1625, 0.1625]])
+        )
+        assert deflections[0, 0] == pytest.approx(1.1446, 1e-3)
+        assert deflections[0, 1] == pytest.approx(0.79374, 1e-3)
+
+        sersic = aast.mp.SphericalSersic(
+            centre=(-0.4, -0.2), intensity=5.0, effective_radius=0.2, sersic_index=2.0
+        )
+        sersic_mge = aast.mp.SphericalSersic(
+            centre=(-0.4, -0.2), intensity=5.0, effective_radius=0.2, sersic_index=2.0
+        )
+        sersic_mge.deflections_engine = "mge"
+
+        assert np.asarray(sersic.deflections_from_grid(grid=grid)) == pytest.approx(
+            np.asarray(sersic_mge.deflections_from_grid(grid=grid)), 1e-4
+        )
+
     def test__surfce_density__change_geometry(self):
         sersic_0 = aast.mp.EllipticalSersic(centre=(0.0, 0.0))
         sersic_1 = aast.mp.EllipticalSersic(centre=(1.0, 1.0))
@@ -1540,6 +1593,82 @@ class TestSersicMassRadialGradient:
         assert deflections[0][0][0] == pytest.approx(0.97806399756448, 1e-3)
         assert deflections[0][0][1] == pytest.approx(0.725459334118341, 1e-3)
 
+    def test__deflections__mge_engine__same_as_quad_grid(self):
+        sersic = aast.mp.EllipticalSersicRadialGradient(
+            centre=(-0.4, -0.2),
+            axis_ratio=0.8,
+            phi=110.0,
+            intensity=5.0,
+            effective_radius=0.2,
+            sersic_index=2.0,
+            mass_to_light_ratio=1.0,
+            mass_to_light_gradient=1.0,
+        )
+        sersic.deflections_engine = "mge"
+
+        deflections = sersic.deflections_from_grid(
+            grid=aa.grid_irregular.manual_1d([[0.1625, 0.1625]])
+        )
+        assert deflections[0, 0] == pytest.approx(3.60324873535244, 1e-3)
+        assert deflections[0, 1] == pytest.approx(2.3638898009652, 1e-3)
+
+    def test__deflections__mge_engine__inaccurate_expansion_warns_and_integrates(self):
+        sersic = aast.mp.EllipticalSersicRadialGradient(
+            centre=(-0.4, -0.2),
+            axis_ratio=0.8,
+            phi=110.0,
+            intensity=5.0,
+            effective_radius=0.2,
+            sersic_index=2.0,
+            mass_to_light_ratio=1.0,
+            mass_to_light_gradient=1.5,
+        )
+        sersic_mge = aast.mp.EllipticalSersicRadialGradient(
+            centre=(-0.4, -0.2),
+            axis_ratio=0.8,
+            phi=110.0,
+            intensity=5.0,
+            effective_radius=0.2,
+            sersic_index=2.0,
+            mass_to_light_ratio=1.0,
+            mass_to_light_gradient=1.5,
+        )
+        sersic_mge.deflections_engine = "mge"
+
+        grid = aa.grid_irregular.manual_1d([[0.1625, 0.1625]])
+
+        with pytest.warns(UserWarning):
+            deflections = sersic_mge.deflections_from_grid(grid=grid)
+
+        assert np.asarray(deflections) == pytest.approx(
+            np.asarray(sersic.deflections_from_grid(grid=grid)), 1e-8
+        )
+
+    def test__deflections__gauss_legendre_engine__not_converged_warns_and_integrates(
+        self,
+    ):
+        sersic = aast.mp.EllipticalSersicRadialGradient(
+            axis_ratio=0.6,
+            sersic_index=3.0,
+            mass_to_light_gradient=1.5,
+        )
+        sersic_gauss_legendre = aast.mp.EllipticalSersicRadialGradient(
+            axis_ratio=0.6,
+            sersic_index=3.0,
+            mass_to_light_gradient=1.5,
+        )
+        sersic_gauss_legendre.deflections_engine = "gauss_legendre"
+
+        radii = np.logspace(-3.0, 1.0, 10)
+        grid = aa.grid_irregular.manual_1d(np.stack([radii, 0.5 * radii], axis=1))
+
+        with pytest.warns(UserWarning):
+            deflections = sersic_gauss_legendre.deflections_from_grid(grid=grid)
+
+        assert np.asarray(deflections) == pytest.approx(
+            np.asarray(sersic.deflections_from_grid(grid=grid)), 1e-8
+        )
+
     def test__compare_to_sersic(self):
         sersic = aast.mp.EllipticalSersicRadialGradient(
             centre=(-0.4, -0.2),
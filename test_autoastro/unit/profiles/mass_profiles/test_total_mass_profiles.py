@@ -2,6 +2,7 @@ import autofit as af
 import autoarray as aa
 from autoarray.structures import grids
 import autoastro as aast
+from autoastro import exc, lensing
 import numpy as np
 import pytest
 import os
@@ -223,6 +224,15 @@ class TestPointMass:
 
         assert deflections.shape_2d == (2, 2)
 
+    def test__einstein_radius_via_mean_convergence(self):
+
+        point_mass = aast.mp.PointMass(centre=(0.0, 0.0), einstein_radius=2.0)
+
+        assert point_mass.einstein_radius_via_mean_convergence == 2.0
+        assert point_mass.mass_within_circularized_radius(radius=10.0) == pytest.approx(
+            4.0 * np.pi, 1e-8
+        )
+
 
 class TestBrokenPowerLaw:
     def test__convergence_correct_values(self):
@@ -507,6 +517,30 @@ class TestBrokenPowerLaw:
 
         assert broken_yx_ratio == pytest.approx(power_law_yx_ratio, 1.0e-4)
 
+    def test__deflections__low_axis_ratio__series_engine_same_as_scipy(self):
+
+        grid = aa.grid.uniform(shape_2d=(10, 10), pixel_scales=0.3, sub_size=1)
+
+        for axis_ratio in [0.2, 0.3]:
+
+            broken_power_law = aast.mp.EllipticalBrokenPowerLaw(
+                centre=(0, 0),
+                axis_ratio=axis_ratio,
+                phi=30.0,
+                einstein_radius=1.0,
+                inner_slope=1.5,
+                outer_slope=2.5,
+                break_radius=0.1,
+            )
+
+            deflections = broken_power_law.deflections_from_grid(grid=grid)
+
+            broken_power_law.hyp2f1_engine = "scipy"
+
+            assert deflections == pytest.approx(
+                broken_power_law.deflections_from_grid(grid=grid), 1.0e-6
+            )
+
     def test__deflections_of_both_profiles__dont_use_interpolate_and_cache_decorators(
         self
     ):
@@ -634,6 +668,22 @@ class TestBrokenPowerLaw:
 
         assert deflections.shape_2d == (2, 2)
 
+    def test__einstein_radius_via_mean_convergence(self):
+
+        broken_power_law = aast.mp.EllipticalBrokenPowerLaw(
+            centre=(0.0, 0.0),
+            axis_ratio=0.6,
+            phi=0.0,
+            einstein_radius=1.5,
+            inner_slope=1.5,
+            outer_slope=2.5,
+            break_radius=0.1,
+        )
+
+        assert broken_power_law.einstein_radius_via_mean_convergence == pytest.approx(
+            1.5, 1e-4
+        )
+
 
 class TestCoredPowerLaw:
     def test__constructor_and_units(self):
@@ -821,6 +871,46 @@ class TestCoredPowerLaw:
         assert deflections[0][0][0] == pytest.approx(0.01111, 1e-3)
         assert deflections[0][0][1] == pytest.approx(0.11403, 1e-3)
 
+    def test__deflections__gauss_legendre_engine__same_as_quad_grid(self):
+        cored_power_law = aast.mp.EllipticalCoredPowerLaw(
+            centre=(-0.7, 0.5),
+            axis_ratio=0.7,
+            phi=60.0,
+            einstein_radius=1.3,
+            slope=1.8,
+            core_radius=0.2,
+        )
+        cored_power_law.deflections_engine = "gauss_legendre"
+
+        deflections = cored_power_law.deflections_from_grid(
+            grid=aa.grid_irregular.manual_1d([[0.1625, 0.1625]])
+        )
+        assert deflections[0, 0] == pytest.approx(0.9869, 1e-3)
+        assert deflections[0, 1] == pytest.approx(-0.54882, 1e-3)
+
+        cored_power_law = aast.mp.EllipticalCoredPowerLaw(
+            centre=(0.2, -0.2),
+            axis_ratio=0.6,
+            phi=120.0,
+            einstein_radius=0.5,
+            slope=2.4,
+            core_radius=0.5,
+        )
+        cored_power_law.deflections_engine = "gauss_legendre"
+
+        deflections = cored_power_law.deflections_from_grid(
+            grid=aa.coordinates([[(0.1625, 0.1625)]])
+        )
+        assert deflections[0][0][0] == pytest.approx(0.01111, 1e-3)
+        assert deflections[0][0][1] == pytest.approx(0.11403, 1e-3)
+
+        cored_power_law.deflections_engine = "not_an_engine"
+
+        with pytest.raises(exc.ProfileException):
+            cored_power_law.deflections_from_grid(
+                grid=aa.grid_irregular.manual_1d([[1.0, 1.0]])
+            )
+
     def test__convergence__change_geometry(self):
         cored_power_law_0 = aast.mp.SphericalCoredPowerLaw(centre=(0.0, 0.0))
         cored_power_law_1 = aast.mp.SphericalCoredPowerLaw(centre=(1.0, 1.0))
@@ -1120,7 +1210,7 @@ class TestCoredPowerLaw:
         i += 1
         assert (
             summary_text[i]
-            == "pl_einstein_mass                                  3.1308e+00 angular"
+            == "pl_einstein_mass                                  3.1416e+00 angular"
         )
         i += 1
         assert (
@@ -1263,6 +1353,66 @@ class TestPowerLaw:
             0
         ] == pytest.approx(1.4079, 1e-3)
 
+    def test__hessian__analytic_matches_stencil(self):
+        grid = aa.grid_irregular.manual_1d(
+            [[1.0, 0.5], [-0.3, 2.5], [0.7, -1.1], [-1.9, -0.2]]
+        )
+
+        for mass_profile in [
+            aast.mp.EllipticalPowerLaw(
+                centre=(0.1, -0.2),
+                axis_ratio=0.7,
+                phi=30.0,
+                einstein_radius=1.2,
+                slope=2.3,
+            ),
+            aast.mp.SphericalPowerLaw(
+                centre=(0.1, -0.2), einstein_radius=1.2, slope=1.7
+            ),
+            aast.mp.EllipticalIsothermal(
+                centre=(0.1, -0.2), axis_ratio=0.6, phi=-70.0, einstein_radius=1.2
+            ),
+            aast.mp.PointMass(centre=(0.1, -0.2), einstein_radius=0.5),
+        ]:
+
+            hessian = mass_profile.hessian_from_grid(grid=grid)
+            hessian_via_stencil = mass_profile.hessian_via_stencil_from_grid(grid=grid)
+
+            for component, component_via_stencil in zip(hessian, hessian_via_stencil):
+                assert component == pytest.approx(
+                    component_via_stencil, rel=1.0e-5, abs=1.0e-8
+                )
+
+    def test__convergence_func__vectorized(self):
+        power_law = aast.mp.SphericalPowerLaw(
+            centre=(0.0, 0.0), einstein_radius=2.0, slope=2.2
+        )
+
+        convergence = power_law.convergence_func(grid_radius=np.array([2.0, 0.0]))
+
+        assert convergence[0] == pytest.approx(0.4, 1e-3)
+        assert convergence[1] == np.inf
+        assert power_law.convergence_func(grid_radius=2.0) == pytest.approx(0.4, 1e-3)
+
+    def test__einstein_radius_via_mean_convergence__closed_form_matches_root_find(self):
+        power_law = aast.mp.EllipticalPowerLaw(
+            centre=(0.0, 0.0), axis_ratio=0.6, phi=30.0, einstein_radius=1.5, slope=2.3
+        )
+
+        einstein_radius_via_root_find = (
+            lensing.LensingObject.einstein_radius_via_mean_convergence.fget(power_law)
+        )
+
+        assert power_law.einstein_radius_via_mean_convergence == pytest.approx(
+            einstein_radius_via_root_find, 1e-4
+        )
+
+        isothermal = aast.mp.SphericalIsothermal(centre=(0.0, 0.0), einstein_radius=2.0)
+
+        assert isothermal.einstein_radius_via_mean_convergence == pytest.approx(
+            2.0, 1e-8
+        )
+
     def test__potential_correct_values(self):
         power_law = aast.mp.SphericalPowerLaw(
             centre=(-0.7, 0.5), einstein_radius=1.3, slope=2.3
@@ -1403,6 +1553,31 @@ class TestPowerLaw:
             cored_power_law.deflections_from_grid(grid=grid), 1e-3
         )
 
+    def test__potential__closed_form_same_as_integral_of_potential_func(self):
+
+        grid = aa.grid.uniform(shape_2d=(4, 4), pixel_scales=0.5, origin=(0.1, -0.2))
+
+        for power_law in [
+            aast.mp.EllipticalPowerLaw(
+                centre=(0.2, -0.1),
+                axis_ratio=0.6,
+                phi=37.0,
+                einstein_radius=1.3,
+                slope=2.3,
+            ),
+            aast.mp.EllipticalIsothermal(
+                centre=(0.1, 0.1), axis_ratio=0.7, phi=110.0, einstein_radius=1.1
+            ),
+        ]:
+
+            potential_via_integral = aast.mp.EllipticalCoredPowerLaw.potential_from_grid(
+                power_law, grid=grid
+            )
+
+            assert power_law.potential_from_grid(grid=grid) == pytest.approx(
+                potential_via_integral, 1e-8
+            )
+
     def test__spherical_and_elliptical_match(self):
         elliptical = aast.mp.EllipticalPowerLaw(
             centre=(1.1, 1.1),
@@ -2273,3 +2448,89 @@ class TestIsothermal:
         deflections = isothermal.deflections_from_grid(grid=grid)
 
         assert deflections.shape_2d == (2, 2)
+
+
+class TestDeflectionsBatch:
+    def test__batch_parameter_names__constructor_arguments_with_centre_split(self):
+
+        assert aast.mp.EllipticalIsothermal.batch_parameter_names() == [
+            "centre_0",
+            "centre_1",
+            "axis_ratio",
+            "phi",
+            "einstein_radius",
+        ]
+        assert aast.mp.SphericalPowerLaw.batch_parameter_names() == [
+            "centre_0",
+            "centre_1",
+            "einstein_radius",
+            "slope",
+        ]
+
+    def test__batch_deflections_same_as_deflections_of_every_profile(self):
+
+        grid = aa.grid.uniform(shape_2d=(5, 5), pixel_scales=0.3, sub_size=2)
+
+        for profile_class, params_array in [
+            (
+                aast.mp.EllipticalIsothermal,
+                [[0.1, -0.1, 0.7, 30.0, 1.2], [0.0, 0.2, 1.0, 120.0, 0.8]],
+            ),
+            (aast.mp.SphericalIsothermal, [[0.1, -0.1, 1.2], [0.0, 0.2, 0.8]]),
+            (
+                aast.mp.EllipticalPowerLaw,
+                [[0.1, -0.1, 0.7, 30.0, 1.2, 2.2], [0.0, 0.2, 0.9, 120.0, 0.8, 1.8]],
+            ),
+            (aast.mp.SphericalPowerLaw, [[0.1, -0.1, 1.2, 2.2], [0.0, 0.2, 0.8, 1.8]]),
+            (aast.mp.PointMass, [[0.1, -0.1, 1.2], [0.0, 0.2, 0.8]]),
+        ]:
+
+            deflections = profile_class.deflections_from_grid_batch(
+                grid=grid, params_array=np.array(params_array)
+            )
+
+            assert deflections.shape == (2, 100, 2)
+
+            for index, parameters in enumerate(params_array):
+
+                profile = profile_class((parameters[0], parameters[1]), *parameters[2:])
+
+                assert deflections[index] == pytest.approx(
+                    np.asarray(profile.deflections_from_grid(grid=grid)), 1.0e-8
+                )
+
+    def test__batch_computed_in_chunks__same_deflections(self):
+
+        grid = aa.grid.uniform(shape_2d=(5, 5), pixel_scales=0.3, sub_size=1)
+
+        params_array = np.array(
+            [
+                [0.1, -0.1, 0.7, 30.0, 1.2],
+                [0.0, 0.2, 0.9, 120.0, 0.8],
+                [0.0, 0.0, 0.5, 0.0, 1.0],
+            ]
+        )
+
+        deflections = aast.mp.EllipticalIsothermal.deflections_from_grid_batch(
+            grid=grid, params_array=params_array
+        )
+
+        aast.mp.EllipticalIsothermal.batch_max_elements = 25
+
+        try:
+            deflections_chunked = (
+                aast.mp.EllipticalIsothermal.deflections_from_grid_batch(
+                    grid=grid, params_array=params_array
+                )
+            )
+        finally:
+            del aast.mp.EllipticalIsothermal.batch_max_elements
+
+        assert deflections_chunked == pytest.approx(deflections, 1.0e-12)
+
+    def test__params_array_of_wrong_shape__raises_exception(self):
+
+        with pytest.raises(exc.ProfileException):
+            aast.mp.EllipticalIsothermal.deflections_from_grid_batch(
+                grid=grid, params_array=np.zeros((3, 4))
+            )
@@ -78,6 +78,161 @@ class TestMemoize:
         assert profile.method_one(array) is array
         assert profile.method_two(np.array([0])) is not array
 
+    def test_arguments_of_call_are_part_of_key(self):
+        class CountingProfile:
+            def __init__(self):
+                self.count = 0
+
+            @geometry_profiles.cache
+            def my_method(self, grid, grid_radial_minimum=None, factor=1):
+                self.count += 1
+                return factor * self.count
+
+        profile = CountingProfile()
+
+        assert profile.my_method(np.array([0]), None, factor=1) == 1
+        assert profile.my_method(np.array([0]), None, factor=2) == 4
+        assert profile.my_method(np.array([0]), None, factor=1) == 1
+
+        assert profile.cache.hits == 1
+        assert profile.cache.misses == 2
+
+    def test_least_recently_used_evicted_beyond_byte_budget(self):
+        class MyProfile:
+            @geometry_profiles.cache
+            def my_method(self, grid, grid_radial_minimum=None):
+                return np.full(shape=10, fill_value=grid[0])
+
+        profile = MyProfile()
+        profile.cache = geometry_profiles.GridCache(max_bytes=200)
+
+        profile.my_method(np.array([0.0]))
+        profile.my_method(np.array([1.0]))
+        profile.my_method(np.array([0.0]))
+        profile.my_method(np.array([2.0]))
+
+        assert len(profile.cache) == 2
+        assert profile.cache.total_bytes == 160
+        assert profile.cache.evictions == 1
+
+        profile.my_method(np.array([0.0]))
+
+        assert profile.cache.hits == 2
+
+        profile.my_method(np.array([1.0]))
+
+        assert profile.cache.misses == 4
+        assert profile.cache.evictions == 2
+
+    def test_global_switch_disables_caching(self):
+        class MyProfile:
+            @geometry_profiles.cache
+            def my_method(self, grid, grid_radial_minimum=None):
+                return grid
+
+        profile = MyProfile()
+
+        geometry_profiles.GridCache.enabled = False
+
+        try:
+            profile.my_method(np.array([0]))
+        finally:
+            geometry_profiles.GridCache.enabled = True
+
+        assert not hasattr(profile, "cache")
+
+    def test_parameters_and_settings_of_instance_are_part_of_key(self):
+        sersic = aast.mp.EllipticalSersic(
+            axis_ratio=0.8, phi=30.0, intensity=1.0, effective_radius=0.5
+        )
+
+        grid = aa.grid_irregular.manual_1d([[0.3, 0.2], [-0.4, 0.5]])
+
+        deflections = sersic.deflections_from_grid(grid=grid)
+
+        sersic.deflections_engine = "mge"
+
+        deflections_mge = sersic.deflections_from_grid(grid=grid)
+
+        assert len(sersic.cache) == 2
+        assert (np.asarray(deflections_mge) != np.asarray(deflections)).any()
+
+        sersic.intensity = 2.0
+
+        assert sersic.deflections_from_grid(grid=grid) == pytest.approx(
+            2.0 * np.asarray(deflections_mge), 1.0e-8
+        )
+        assert len(sersic.cache) == 3
+
+
+class TestShareGeometry:
+    def test__profiles_with_same_geometry_transform_grid_once(self, monkeypatch):
+
+        transform_grid_to_reference_frame = (
+            geometry_profiles.EllipticalProfile.transform_grid_to_reference_frame
+        )
+
+        transformed_grids = []
+
+        def counting_transform_grid_to_reference_frame(profile, grid):
+            transformed_grid = transform_grid_to_reference_frame(profile, grid)
+            transformed_grids.append(transformed_grid)
+            return transformed_grid
+
+        monkeypatch.setattr(
+            geometry_profiles.EllipticalProfile,
+            "transform_grid_to_reference_frame",
+            counting_transform_grid_to_reference_frame,
+        )
+
+        profiles = [
+            geometry_profiles.EllipticalProfile(
+                centre=(0.1, 0.2), axis_ratio=0.5, phi=30.0
+            ),
+            geometry_profiles.EllipticalProfile(
+                centre=(0.1, 0.2), axis_ratio=0.5, phi=30.0
+            ),
+            geometry_profiles.EllipticalProfile(
+                centre=(0.1, 0.2), axis_ratio=0.5, phi=60.0
+            ),
+        ]
+
+        class MockGalaxy:
+            @geometry_profiles.share_geometry
+            def elliptical_radii_from_grid(self, grid):
+                return [profile.grid_to_elliptical_radii(grid) for profile in profiles]
+
+        grid = aa.grid.uniform(shape_2d=(4, 4), pixel_scales=2.0, sub_size=1)
+
+        radii_shared = MockGalaxy().elliptical_radii_from_grid(grid=grid)
+
+        assert len(transformed_grids) == 2
+        assert geometry_profiles.GeometryCache.active is None
+
+        radii = [profile.grid_to_elliptical_radii(grid) for profile in profiles]
+
+        assert len(transformed_grids) == 5
+
+        for radii_shared_profile, radii_profile in zip(radii_shared, radii):
+            assert (radii_shared_profile == radii_profile).all()
+
+    def test__reference_frame_key__spherical_when_circular_and_not_rotated(self):
+
+        spherical = aast.lp.SphericalSersic(centre=(0.1, 0.2))
+        circular = aast.lp.EllipticalSersic(centre=(0.1, 0.2), axis_ratio=1.0, phi=0.0)
+        rotated = aast.lp.EllipticalSersic(centre=(0.1, 0.2), axis_ratio=1.0, phi=30.0)
+
+        assert spherical.reference_frame_key == ("spherical", (0.1, 0.2))
+        assert circular.reference_frame_key == spherical.reference_frame_key
+        assert rotated.reference_frame_key == ("elliptical", (0.1, 0.2), 1.0, 30.0)
+
+        class SphericalMock(geometry_profiles.EllipticalProfile):
+            pass
+
+        profile = SphericalMock(centre=(0.1, 0.2), axis_ratio=0.5, phi=30.0)
+
+        assert profile.reference_frame_key == ("elliptical", (0.1, 0.2), 0.5, 30.0)
+
 
 class TestGeometryProfile:
     def test__constructor_and_units(self):
@@ -556,29 +711,162 @@ class MockGridRadialMinimum:
         return grid
 
 
-# class TestGridRadialMinimum:
-#
-#     def test__mock_profile__grid_radial_minimum_is_0_or_below_radial_coordinates__no_changes(self):
-#         grid = np.arrays([[2.5, 0.0], [4.0, 0.0], [6.0, 0.0]])
-#         mock_profile = MockGridRadialMinimum()
-#
-#         deflections = mock_profile.deflections_from_grid(grid=grid)
-#         assert (deflections == grid).all()
-#
-#     def test__mock_profile__grid_radial_minimum_is_above_some_radial_coordinates__moves_them_grid_radial_minimum(self):
-#         grid = np.arrays([[2.0, 0.0], [1.0, 0.0], [6.0, 0.0]])
-#         mock_profile = MockGridRadialMinimum()
-#
-#         deflections = mock_profile.deflections_from_grid(grid=grid)
-#
-#         assert (deflections == np.arrays([[2.5, 0.0], [2.5, 0.0], [6.0, 0.0]])).all()
-#
-#     def test__mock_profile__same_as_above_but_diagonal_coordinates(self):
-#         grid = np.arrays([[np.sqrt(2.0), np.sqrt(2.0)], [1.0, np.sqrt(8.0)], [np.sqrt(8.0), np.sqrt(8.0)]])
-#
-#         mock_profile = MockGridRadialMinimum()
-#
-#         deflections = mock_profile.deflections_from_grid(grid=grid)
-#
-#         assert deflections == pytest.approx(np.arrays([[1.7677, 1.7677], [1.0, np.sqrt(8.0)],
-#                                                       [np.sqrt(8), np.sqrt(8.0)]]), 1.0e-4)
+class TestGridRadialMinimum:
+    def test__mock_profile__grid_radial_minimum_is_0_or_below_radial_coordinates__no_changes(
+        self
+    ):
+        grid = np.array([[2.5, 0.0], [4.0, 0.0], [6.0, 0.0]])
+        mock_profile = MockGridRadialMinimum()
+
+        deflections = mock_profile.deflections_from_grid(grid=grid)
+
+        assert deflections is grid
+
+    def test__mock_profile__grid_radial_minimum_is_above_some_radial_coordinates__moves_them_grid_radial_minimum(
+        self
+    ):
+        grid = np.array([[2.0, 0.0], [1.0, 0.0], [6.0, 0.0], [0.0, 0.0]])
+        mock_profile = MockGridRadialMinimum()
+
+        deflections = mock_profile.deflections_from_grid(grid=grid)
+
+        assert (
+            deflections == np.array([[2.5, 0.0], [2.5, 0.0], [6.0, 0.0], [2.5, 2.5]])
+        ).all()
+        assert (grid == np.array([[2.0, 0.0], [1.0, 0.0], [6.0, 0.0], [0.0, 0.0]])).all()
+
+    def test__mock_profile__same_as_above_but_diagonal_coordinates(self):
+        grid = np.array(
+            [
+                [np.sqrt(2.0), np.sqrt(2.0)],
+                [1.0, np.sqrt(8.0)],
+                [np.sqrt(8.0), np.sqrt(8.0)],
+            ]
+        )
+
+        mock_profile = MockGridRadialMinimum()
+
+        deflections = mock_profile.deflections_from_grid(grid=grid)
+
+        assert deflections == pytest.approx(
+            np.array(
+                [[1.7677, 1.7677], [1.0, np.sqrt(8.0)], [np.sqrt(8), np.sqrt(8.0)]]
+            ),
+            1.0e-4,
+        )
+
+    def test__radial_minimum_read_once_per_class__until_reloaded(self):
+
+        geometry_profiles.reload_radial_minimum_config()
+
+        assert geometry_profiles.radial_minimum_registry == {}
+
+        assert (
+            geometry_profiles.radial_minimum_from_class(cls=MockGridRadialMinimum)
+            == 2.5
+        )
+        assert len(geometry_profiles.radial_minimum_registry) == 1
+
+        geometry_profiles.radial_minimum_from_class(cls=MockGridRadialMinimum)
+
+        assert len(geometry_profiles.radial_minimum_registry) == 1
+
+        geometry_profiles.reload_radial_minimum_config()
+
+        assert geometry_profiles.radial_minimum_registry == {}
+
+
+class MockRadialProfile(geometry_profiles.EllipticalProfile):
+    def __init__(self, centre=(0.0, 0.0), axis_ratio=1.0, phi=0.0):
+        super(MockRadialProfile, self).__init__(
+            centre=centre, axis_ratio=axis_ratio, phi=phi
+        )
+        self.calls = 0
+
+    def radii_from_grid(self, grid):
+        return np.sqrt(np.square(grid[:, 1]) + np.square(grid[:, 0] / self.axis_ratio))
+
+    @geometry_profiles.transform_grid
+    @geometry_profiles.tabulate_radially
+    def convergence_from_grid(self, grid):
+        self.calls += 1
+        return self.radii_from_grid(grid=grid) ** -0.5
+
+    @geometry_profiles.transform_grid
+    @geometry_profiles.tabulate_radially
+    def deflections_from_grid(self, grid):
+        self.calls += 1
+        return self.rotate_grid_from_profile(
+            grid * self.radii_from_grid(grid=grid)[:, None] ** 0.5
+        )
+
+
+class TestTabulateRadially:
+    def test__radial_table_off_or_profile_not_radially_symmetric__evaluates_every_coordinate(
+        self,
+    ):
+        grid = aa.grid_irregular.manual_1d([[1.0, 2.0], [-0.5, 0.3]])
+
+        profile = MockRadialProfile(axis_ratio=0.8)
+        profile.radial_table = True
+
+        profile.convergence_from_grid(grid=grid)
+
+        assert not hasattr(profile, "radial_tables")
+
+        profile = MockRadialProfile()
+
+        profile.convergence_from_grid(grid=grid)
+
+        assert not hasattr(profile, "radial_tables")
+
+    def test__values_interpolated_from_table__same_as_direct_values(self):
+
+        grid = aa.grid_irregular.manual_1d(
+            [[1.0, 2.0], [-0.5, 0.3], [0.0, -0.01], [-3.0, -4.0]]
+        )
+
+        profile = MockRadialProfile(centre=(0.1, -0.2), phi=30.0)
+
+        convergence = profile.convergence_from_grid(grid=grid)
+        deflections = profile.deflections_from_grid(grid=grid)
+
+        profile.radial_table = True
+
+        assert profile.convergence_from_grid(grid=grid) == pytest.approx(
+            convergence, 1.0e-6
+        )
+        assert profile.deflections_from_grid(grid=grid) == pytest.approx(
+            deflections, 1.0e-6
+        )
+
+    def test__table_stored_on_instance__recomputed_when_grid_extends_beyond_it(self):
+
+        profile = MockRadialProfile()
+        profile.radial_table = True
+        profile.radial_table_radii_per_decade = 10
+
+        profile.convergence_from_grid(
+            grid=aa.grid_irregular.manual_1d([[0.0, 0.5], [0.0, 2.0]])
+        )
+        profile.convergence_from_grid(
+            grid=aa.grid_irregular.manual_1d([[1.0, 0.0], [0.0, 1.5]])
+        )
+
+        assert profile.calls == 1
+
+        table = profile.radial_tables[("convergence_from_grid", (), ())]
+
+        assert table.minimum_radius == pytest.approx(10.0 ** -0.4, 1.0e-8)
+        assert table.maximum_radius == pytest.approx(10.0 ** 0.4, 1.0e-8)
+
+        profile.convergence_from_grid(
+            grid=aa.grid_irregular.manual_1d([[0.0, 0.5], [0.0, 20.0]])
+        )
+
+        assert profile.calls == 2
+
+        table = profile.radial_tables[("convergence_from_grid", (), ())]
+
+        assert table.minimum_radius == pytest.approx(10.0 ** -0.4, 1.0e-8)
+        assert table.maximum_radius == pytest.approx(10.0 ** 1.4, 1.0e-8)
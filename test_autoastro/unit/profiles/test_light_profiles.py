@@ -8,6 +8,7 @@ import scipy.special
 import autofit as af
 import autoarray as aa
 import autoastro as aast
+from autoastro import exc
 from test_autoastro.mock import mock_cosmology
 
 
@@ -874,6 +875,41 @@ class TestCoreSersic:
         assert image.shape_2d == (2, 2)
 
 
+class TestProfileImageEngine:
+    def test__jit_and_numpy_engines_give_same_image(self):
+        grid = aa.grid.uniform(shape_2d=(11, 11), pixel_scales=0.1, sub_size=2)
+
+        for light_profile in [
+            aast.lp.EllipticalSersic(
+                centre=(0.1, -0.2),
+                axis_ratio=0.6,
+                phi=37.0,
+                intensity=2.0,
+                effective_radius=0.8,
+                sersic_index=2.5,
+            ),
+            aast.lp.EllipticalGaussian(
+                centre=(0.1, -0.2), axis_ratio=0.6, phi=37.0, intensity=2.0, sigma=0.5
+            ),
+            aast.lp.SphericalExponential(centre=(0.0, 0.0), intensity=1.0),
+        ]:
+
+            image_jit = light_profile.profile_image_from_grid(grid=grid)
+            image_numpy = light_profile.profile_image_from_grid_via_transform(
+                grid=grid
+            )
+
+            assert image_jit.shape_2d == (11, 11)
+            assert image_jit.in_1d == pytest.approx(image_numpy.in_1d, 1.0e-10)
+
+    def test__unsupported_engine__raises_exception(self):
+        sersic = aast.lp.EllipticalSersic()
+        sersic.profile_image_engine = "gpu"
+
+        with pytest.raises(exc.ProfileException):
+            sersic.profile_image_from_grid(grid=grid)
+
+
 class TestBlurredProfileImages:
     def test__blurred_image_from_grid_and_psf(
         self, sub_grid_7x7, blurring_grid_7x7, psf_3x3, convolver_7x7
@@ -160,6 +160,10 @@ class MockEllipticalIsothermal(
             np.multiply(factor, np.vstack((deflection_y, deflection_x)).T)
         )
 
+    @property
+    def circularized_radius_rescale(self):
+        return np.sqrt(self.axis_ratio)
+
     @property
     def is_point_mass(self):
         return False
@@ -229,6 +233,14 @@ class MockSphericalIsothermal(MockEllipticalIsothermal):
         )
 
 
+class MockSphericalIsothermalWithoutConvergenceFunc(MockSphericalIsothermal):
+    def convergence_func(self, grid_radius):
+        return lensing.LensingObject.convergence_func(self, grid_radius=grid_radius)
+
+    def convergence_from_grid(self, grid):
+        return self.convergence_via_jacobian_from_grid(grid=grid)
+
+
 class MockGalaxy(lensing.LensingObject):
     def __init__(self, mass_profiles):
         self._mass_profiles = mass_profiles
@@ -241,6 +253,18 @@ class MockGalaxy(lensing.LensingObject):
     def mass_profile_centres(self):
         return [mass_profile.centre for mass_profile in self.mass_profiles]
 
+    def convergence_from_grid(self, grid):
+        return sum(
+            mass_profile.convergence_from_grid(grid=grid)
+            for mass_profile in self.mass_profiles
+        )
+
+    def deflections_from_grid(self, grid):
+        return sum(
+            mass_profile.deflections_from_grid(grid=grid)
+            for mass_profile in self.mass_profiles
+        )
+
 
 class TestDeflectionsMagnitudes:
     def test__compare_sis_deflection_magnitudes_to_known_values(self):
@@ -323,6 +347,48 @@ class TestDeflectionsViaPotential:
         assert mean_error < 1e-4
 
 
+class TestHessian:
+    def test__hessian_via_stencil__matches_analytic_sis_on_irregular_grid(self):
+        sis = MockSphericalIsothermal(centre=(0.0, 0.0), einstein_radius=2.0)
+
+        grid = aa.grid_irregular.manual_1d([[1.0, 0.5], [-0.3, 2.5], [0.7, -1.1]])
+
+        y = np.asarray(grid)[:, 0]
+        x = np.asarray(grid)[:, 1]
+        radii = np.sqrt(y ** 2 + x ** 2)
+
+        hessian_yy, hessian_xy, hessian_xx = sis.hessian_from_grid(grid=grid)
+
+        assert hessian_yy == pytest.approx(2.0 * x ** 2 / radii ** 3, 1.0e-6)
+        assert hessian_xy == pytest.approx(-2.0 * x * y / radii ** 3, 1.0e-6)
+        assert hessian_xx == pytest.approx(2.0 * y ** 2 / radii ** 3, 1.0e-6)
+
+        magnification = sis.magnification_from_grid(grid=grid)
+
+        assert magnification == pytest.approx(1.0 / (1.0 - 2.0 / radii), 1.0e-5)
+
+    def test__galaxy_hessian_is_sum_of_mass_profile_hessians(self):
+        sis = aast.mp.SphericalIsothermal(centre=(0.1, 0.0), einstein_radius=1.0)
+        shear = aast.mp.ExternalShear(magnitude=0.1, phi=30.0)
+
+        galaxy = aast.Galaxy(redshift=0.5, mass_0=sis, mass_1=shear)
+
+        grid = aa.grid.uniform(shape_2d=(4, 4), pixel_scales=0.5, sub_size=1)
+
+        for galaxy_component, sis_component, shear_component in zip(
+            galaxy.hessian_from_grid(grid=grid),
+            sis.hessian_from_grid(grid=grid),
+            shear.hessian_from_grid(grid=grid),
+        ):
+            assert galaxy_component.in_1d == pytest.approx(
+                sis_component.in_1d + shear_component.in_1d, 1.0e-8
+            )
+
+        galaxy = aast.Galaxy(redshift=0.5)
+
+        assert (galaxy.hessian_from_grid(grid=grid)[0].in_1d == 0.0).all()
+
+
 class TestJacobian:
     def test__jacobian_components(self):
         sie = MockEllipticalIsothermal(
@@ -619,6 +685,30 @@ class TestConvergenceViajacobian:
 
 
 class TestCriticalCurvesAndCaustics:
+
+    def test__critical_curves__memoized_only_for_objects_with_parameters_key(self):
+
+        sis = aast.mp.SphericalIsothermal(einstein_radius=2.0)
+
+        assert sis.tangential_critical_curves is sis.tangential_critical_curves
+
+        sis = MockSphericalIsothermal(einstein_radius=2.0)
+        galaxy = MockGalaxy(mass_profiles=[sis])
+
+        tangential_critical_curve = galaxy.tangential_critical_curve
+
+        assert np.max(
+            np.sqrt(np.sum(np.square(tangential_critical_curve), axis=1))
+        ) == pytest.approx(2.0, 1e-2)
+
+        sis.einstein_radius = 1.0
+
+        tangential_critical_curve = galaxy.tangential_critical_curve
+
+        assert np.max(
+            np.sqrt(np.sum(np.square(tangential_critical_curve), axis=1))
+        ) == pytest.approx(1.0, 1e-2)
+
     def test_compare_magnification_from_determinant_and_from_convergence_and_shear(
         self
     ):
@@ -738,15 +828,17 @@ class TestCriticalCurvesAndCaustics:
     def test__radial_caustic_centres__spherical_isothermal(self):
         sis = MockSphericalIsothermal(centre=(0.0, 0.0), einstein_radius=2.0)
 
-        radial_caustic = sis.caustics[1]
+        # The radial caustic is a closed contour, so its last point repeats its first and is not included in the mean.
+
+        radial_caustic = sis.caustics[1][:-1]
 
         y_centre = np.mean(radial_caustic[:, 0])
         x_centre = np.mean(radial_caustic[:, 1])
 
         assert -0.2 < y_centre < 0.2
-        assert -0.35 < x_centre < 0.35
+        assert -0.4 < x_centre < 0.4
 
-        radial_caustic = sis.caustics[1]
+        radial_caustic = sis.caustics[1][:-1]
 
         y_centre = np.mean(radial_caustic[:, 0])
         x_centre = np.mean(radial_caustic[:, 1])
@@ -756,7 +848,7 @@ class TestCriticalCurvesAndCaustics:
 
         sis = MockSphericalIsothermal(centre=(0.5, 1.0), einstein_radius=2.0)
 
-        radial_caustic = sis.caustics[1]
+        radial_caustic = sis.caustics[1][:-1]
 
         y_centre = np.mean(radial_caustic[:, 0])
         x_centre = np.mean(radial_caustic[:, 1])
@@ -764,6 +856,26 @@ class TestCriticalCurvesAndCaustics:
         assert 0.3 < y_centre < 0.7
         assert 0.8 < x_centre < 1.2
 
+    def test__every_critical_curve_is_returned(self):
+        galaxy = aast.Galaxy(
+            redshift=0.5,
+            mass_0=aast.mp.SphericalIsothermal(centre=(0.0, -4.0), einstein_radius=1.0),
+            mass_1=aast.mp.SphericalIsothermal(centre=(0.0, 4.0), einstein_radius=1.0),
+        )
+
+        tangential_critical_curves = galaxy.tangential_critical_curves
+
+        assert len(tangential_critical_curves) == 2
+
+        centres = sorted(
+            np.mean(critical_curve, axis=0)[1]
+            for critical_curve in tangential_critical_curves
+        )
+
+        assert centres == pytest.approx([-4.0, 4.0], abs=0.1)
+
+        assert len(galaxy.tangential_caustics) == 2
+
     def test__compare_tangential_critical_curves_from_magnification_and_eigen_values(
         self
     ):
@@ -777,8 +889,20 @@ class TestCriticalCurvesAndCaustics:
             0
         ]
 
-        assert sie.tangential_critical_curve == pytest.approx(
-            tangential_critical_curve_from_magnification, 5e-1
+        # The critical curves are traced at different resolutions, so their mean radii are compared.
+
+        assert np.mean(
+            np.hypot(
+                sie.tangential_critical_curve[:, 0], sie.tangential_critical_curve[:, 1]
+            )
+        ) == pytest.approx(
+            np.mean(
+                np.hypot(
+                    tangential_critical_curve_from_magnification[:, 0],
+                    tangential_critical_curve_from_magnification[:, 1],
+                )
+            ),
+            1e-2,
         )
 
         tangential_critical_curve_from_magnification = critical_curve_via_magnification_from_mass_profile_and_grid(
@@ -787,8 +911,20 @@ class TestCriticalCurvesAndCaustics:
             0
         ]
 
-        assert sie.tangential_critical_curve == pytest.approx(
-            tangential_critical_curve_from_magnification, 5e-1
+        # The critical curves are traced at different resolutions, so their mean radii are compared.
+
+        assert np.mean(
+            np.hypot(
+                sie.tangential_critical_curve[:, 0], sie.tangential_critical_curve[:, 1]
+            )
+        ) == pytest.approx(
+            np.mean(
+                np.hypot(
+                    tangential_critical_curve_from_magnification[:, 0],
+                    tangential_critical_curve_from_magnification[:, 1],
+                )
+            ),
+            1e-2,
         )
 
     def test__compare_radial_critical_curves_from_magnification_and_eigen_values(self):
@@ -832,10 +968,58 @@ class TestCriticalCurvesAndCaustics:
             1
         ]
 
-        assert sum(sie.radial_caustic) == pytest.approx(
-            sum(caustic_radial_from_magnification), 7e-1
+        # The radial caustic is a closed contour, which both methods may start from a different point. The refined
+        # tracer resolves the radial critical curve closer to the singular centre of the isothermal, so its caustic
+        # lies closer to the cut at the Einstein radius.
+
+        assert np.mean(
+            np.hypot(sie.radial_caustic[:, 0], sie.radial_caustic[:, 1])
+        ) == pytest.approx(
+            np.mean(
+                np.hypot(
+                    caustic_radial_from_magnification[:, 0],
+                    caustic_radial_from_magnification[:, 1],
+                )
+            ),
+            2e-1,
         )
 
+    def test__critical_curves_traced_once_per_object_and_parameters(self, monkeypatch):
+        from autoastro.util import critical_curve_util
+
+        calls = []
+
+        contours_from_values_func = critical_curve_util.contours_from_values_func
+
+        def contours_from_values_func_counted(**kwargs):
+            calls.append(1)
+            return contours_from_values_func(**kwargs)
+
+        monkeypatch.setattr(
+            critical_curve_util,
+            "contours_from_values_func",
+            contours_from_values_func_counted,
+        )
+
+        sis = aast.mp.SphericalIsothermal(centre=(0.0, 0.0), einstein_radius=2.0)
+
+        sis.tangential_critical_curves
+        sis.radial_critical_curve
+        sis.critical_curves
+        sis.tangential_caustic
+        sis.caustics
+
+        assert len(calls) == 1
+
+        sis.einstein_radius = 1.0
+
+        assert np.mean(
+            np.hypot(
+                sis.tangential_critical_curve[:, 0], sis.tangential_critical_curve[:, 1]
+            )
+        ) == pytest.approx(1.0, 1e-2)
+        assert len(calls) == 2
+
 
 class TestEinsteinRadiusMassfrom:
     def test__tangential_critical_curve_area_from_critical_curve_and_calculation__spherical_isothermal(
@@ -945,6 +1129,78 @@ class TestEinsteinRadiusMassfrom:
             einstein_mass_from_critical_curve, 1e-1
         )
 
+    def test__einstein_radius_via_mean_convergence_and_critical_curve_agree__sie(self):
+        sie = MockEllipticalIsothermal(
+            centre=(0.0, 0.0), einstein_radius=2.0, axis_ratio=0.6
+        )
+
+        einstein_radius_via_mean_convergence = sie.einstein_radius_in_units(
+            unit_length="arcsec"
+        )
+
+        assert einstein_radius_via_mean_convergence == pytest.approx(
+            np.sqrt(0.6) * 2.0 * 2.0 / 1.6, 1e-4
+        )
+
+        sie.einstein_radius_via_critical_curve = True
+
+        einstein_radius_via_critical_curve = sie.einstein_radius_in_units(
+            unit_length="arcsec"
+        )
+
+        assert einstein_radius_via_mean_convergence == pytest.approx(
+            einstein_radius_via_critical_curve, 1e-2
+        )
+
+    def test__einstein_radius_via_mean_convergence__mean_convergence_always_above_one__inf(
+        self,
+    ):
+        mass_sheet = aast.mp.MassSheet(kappa=1.5)
+
+        assert mass_sheet.einstein_radius_via_mean_convergence == np.inf
+
+        mass_sheet = aast.mp.MassSheet(kappa=0.5)
+
+        assert mass_sheet.einstein_radius_via_mean_convergence == 0.0
+
+    def test__einstein_radius_via_mean_convergence__sums_mass_profiles(self):
+
+        galaxy = MockGalaxy(
+            mass_profiles=[
+                MockSphericalIsothermal(centre=(0.0, 0.0), einstein_radius=1.0),
+                MockSphericalIsothermal(centre=(0.0, 0.0), einstein_radius=2.0),
+            ]
+        )
+
+        assert galaxy.einstein_radius_via_mean_convergence == pytest.approx(3.0, 1e-4)
+
+        galaxy = MockGalaxy(mass_profiles=[])
+
+        assert galaxy.einstein_radius_via_mean_convergence == 0.0
+
+    def test__einstein_radius_via_mean_convergence__no_convergence_func__uses_critical_curve(
+        self,
+    ):
+        sis = MockSphericalIsothermalWithoutConvergenceFunc(
+            centre=(0.0, 0.0), einstein_radius=2.0
+        )
+
+        assert sis.einstein_radius_via_mean_convergence == pytest.approx(
+            sis.einstein_radius_via_tangential_critical_curve, 1.0e-8
+        )
+        assert sis.einstein_radius_via_mean_convergence == pytest.approx(2.0, 1e-2)
+
+        galaxy = MockGalaxy(
+            mass_profiles=[
+                MockSphericalIsothermalWithoutConvergenceFunc(
+                    centre=(0.0, 0.0), einstein_radius=1.0
+                ),
+                MockSphericalIsothermal(centre=(0.0, 0.0), einstein_radius=2.0),
+            ]
+        )
+
+        assert galaxy.einstein_radius_via_mean_convergence == pytest.approx(3.0, 1e-2)
+
 
 class TestGridBinning:
     def test__binning_works_on_all_from_grid_methods(self):
@@ -0,0 +1,111 @@
+import numpy as np
+import pytest
+
+from autoastro.util import adaptive_grid_util
+
+y, x = np.meshgrid(
+    np.linspace(-0.99, 0.99, 100), np.linspace(-0.99, 0.99, 100), indexing="ij"
+)
+
+grid = np.stack((y.ravel(), x.ravel()), axis=1)
+
+
+def interpolated_values_from_grid_and_nodes(values, nodes):
+
+    vertices, weights = adaptive_grid_util.interpolation_weights_from_grid_and_nodes(
+        grid=grid, nodes=nodes
+    )
+
+    return adaptive_grid_util.interpolated_values_from_values(
+        values=values, vertices=vertices, weights=weights
+    )
+
+
+class TestAdaptiveGrid:
+    def test__linear_function__coarse_grid_not_refined_and_interpolation_exact(self):
+        def values_func(nodes):
+            return np.stack(
+                (2.0 * nodes[:, 0] - 3.0 * nodes[:, 1] + 1.0, nodes[:, 0]), axis=1
+            )
+
+        nodes, values = adaptive_grid_util.nodes_and_values_from_grid_and_values_func(
+            grid=grid,
+            values_func=values_func,
+            pixel_scale=0.5,
+            centres=[],
+            error_target=1.0e-8,
+            refinement_levels=3,
+        )
+
+        # The corners, centres and edge midpoints of the 4x4 cells of the coarse grid.
+
+        assert nodes.shape == (81, 2)
+        assert values == pytest.approx(values_func(nodes), 1.0e-10)
+
+        assert interpolated_values_from_grid_and_nodes(
+            values=values, nodes=nodes
+        ) == pytest.approx(values_func(grid), 1.0e-8)
+
+    def test__cusp_at_centre__cells_refined_and_coordinates_at_cusp_computed(self):
+
+        centre = np.array([0.1, -0.2])
+
+        def values_func(nodes):
+            return np.sqrt(np.sqrt(np.sum(np.square(nodes - centre), axis=1)))
+
+        nodes, values = adaptive_grid_util.nodes_and_values_from_grid_and_values_func(
+            grid=grid,
+            values_func=values_func,
+            pixel_scale=0.5,
+            centres=[centre],
+            error_target=1.0e-3,
+            refinement_levels=3,
+        )
+
+        interpolated_values = interpolated_values_from_grid_and_nodes(
+            values=values, nodes=nodes
+        )
+
+        close = np.all(np.abs(grid - centre) < 0.06, axis=1)
+
+        assert interpolated_values[close] == pytest.approx(
+            values_func(grid[close]), 1.0e-10
+        )
+        assert np.max(np.abs(interpolated_values - values_func(grid))) < 1.0e-3
+        assert nodes.shape[0] < grid.shape[0]
+
+    def test__maximum_evaluations__refinement_stops_within_it(self):
+
+        centre = np.array([0.1, -0.2])
+
+        def values_func(nodes):
+            return np.sqrt(np.sqrt(np.sum(np.square(nodes - centre), axis=1)))
+
+        with pytest.warns(UserWarning):
+            nodes, values = (
+                adaptive_grid_util.nodes_and_values_from_grid_and_values_func(
+                    grid=grid,
+                    values_func=values_func,
+                    pixel_scale=0.5,
+                    centres=[centre],
+                    error_target=1.0e-3,
+                    refinement_levels=3,
+                    maximum_evaluations=500,
+                )
+            )
+
+        assert 81 <= nodes.shape[0] <= 500
+        assert values == pytest.approx(values_func(nodes), 1.0e-10)
+
+        nodes, values = adaptive_grid_util.nodes_and_values_from_grid_and_values_func(
+            grid=grid,
+            values_func=values_func,
+            pixel_scale=0.5,
+            centres=[centre],
+            error_target=1.0e-3,
+            refinement_levels=3,
+            maximum_evaluations=80,
+        )
+
+        assert nodes is None
+        assert values is None
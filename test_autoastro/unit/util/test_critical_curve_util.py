@@ -0,0 +1,67 @@
+import numpy as np
+import pytest
+
+from autoastro.util import critical_curve_util
+
+
+class TestContoursFromValuesFunc:
+    def test__circle__traced_at_refined_resolution_with_few_evaluations(self):
+
+        evaluations = []
+
+        def values_func(grid):
+            evaluations.append(grid.shape[0])
+            return [np.hypot(grid[:, 0], grid[:, 1]) - 1.0]
+
+        contours = critical_curve_util.contours_from_values_func(
+            values_func=values_func,
+            bounding_box=[-2.0, 2.0, -2.0, 2.0],
+            shape_2d=(21, 21),
+            refinement_levels=3,
+        )
+
+        assert len(contours) == 1
+        assert len(contours[0]) == 1
+
+        radii = np.hypot(contours[0][0][:, 0], contours[0][0][:, 1])
+
+        assert radii == pytest.approx(np.ones(radii.shape), 1.0e-3)
+
+        assert evaluations[0] == 21 * 21
+        assert sum(evaluations) < 161 * 161 / 4
+
+    def test__every_contour_of_every_field_returned(self):
+        def values_func(grid):
+            radii_0 = np.hypot(grid[:, 0] - 1.0, grid[:, 1] - 1.0)
+            radii_1 = np.hypot(grid[:, 0] + 1.0, grid[:, 1] + 1.0)
+            return [
+                np.minimum(radii_0, radii_1) - 0.5,
+                np.hypot(grid[:, 0], grid[:, 1]) - 2.0,
+            ]
+
+        contours = critical_curve_util.contours_from_values_func(
+            values_func=values_func,
+            bounding_box=[-3.0, 3.0, -3.0, 3.0],
+            shape_2d=(31, 31),
+            refinement_levels=2,
+        )
+
+        assert len(contours[0]) == 2
+        assert len(contours[1]) == 1
+
+        centres = sorted(np.mean(contour, axis=0)[0] for contour in contours[0])
+
+        assert centres == pytest.approx([-1.0, 1.0], abs=1.0e-2)
+
+    def test__no_sign_change__no_contours(self):
+        def values_func(grid):
+            return [np.ones(grid.shape[0])]
+
+        contours = critical_curve_util.contours_from_values_func(
+            values_func=values_func,
+            bounding_box=[-1.0, 1.0, -1.0, 1.0],
+            shape_2d=(5, 5),
+            refinement_levels=2,
+        )
+
+        assert contours == [[]]
@@ -0,0 +1,57 @@
+import numpy as np
+import pytest
+
+from autoastro.util import cse_util
+
+
+class TestDecomposition:
+    def test__sum_of_cses_matches_convergence(self):
+
+        radii = cse_util.radii_for_decomposition()
+
+        cores, amplitudes = cse_util.decomposition_from_convergence(
+            convergence=1.0 / (1.0 + radii) ** 2
+        )
+
+        radii = np.array([0.01, 0.1, 1.0, 10.0])
+
+        convergence = np.sum(
+            amplitudes
+            * cores
+            / (2.0 * (np.square(cores) + np.square(radii[:, None])) ** 1.5),
+            axis=1,
+        )
+
+        assert convergence == pytest.approx(1.0 / (1.0 + radii) ** 2, 1.0e-3)
+
+
+class TestDeflections:
+    def test__single_cse__spherical__matches_enclosed_mass(self):
+
+        deflections = cse_util.deflections_from_grid_and_cses(
+            grid=np.array([[0.0, 2.0], [1.2, 1.6]]),
+            axis_ratio=1.0,
+            cores=np.array([0.5]),
+            amplitudes=np.array([3.0]),
+        )
+
+        # The deflection angle of a spherical CSE at radius r is amplitude * (1 - s / sqrt(s^2 + r^2)) / r.
+
+        deflection = 3.0 * (1.0 - 0.5 / np.sqrt(4.25)) / 2.0
+
+        assert deflections[0] == pytest.approx(np.array([0.0, deflection]), 1.0e-8)
+        assert deflections[1] == pytest.approx(
+            np.array([0.6 * deflection, 0.8 * deflection]), 1.0e-8
+        )
+
+    def test__reflection_symmetry(self):
+
+        deflections = cse_util.deflections_from_grid_and_cses(
+            grid=np.array([[0.5, 0.3], [-0.5, 0.3], [0.5, -0.3]]),
+            axis_ratio=0.6,
+            cores=np.array([0.2, 1.0]),
+            amplitudes=np.array([1.0, 0.5]),
+        )
+
+        assert deflections[1] == pytest.approx(deflections[0] * np.array([-1.0, 1.0]))
+        assert deflections[2] == pytest.approx(deflections[0] * np.array([1.0, -1.0]))
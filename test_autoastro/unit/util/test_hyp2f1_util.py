@@ -0,0 +1,58 @@
+import numpy as np
+import pytest
+from scipy import special
+
+from autoastro import exc
+from autoastro.util import hyp2f1_util
+
+w = np.array([0.0, 0.3, -0.5 + 0.2j, 0.1 - 0.7j, 0.85j])
+
+
+class TestHyp2F1:
+    def test__series__same_as_scipy_to_tolerance(self):
+
+        hyp2f1 = hyp2f1_util.hyp2f1_from_values(b=0.6, c=1.4, w=w, tolerance=1.0e-12)
+
+        assert hyp2f1.dtype == "complex128"
+        assert hyp2f1 == pytest.approx(special.hyp2f1(1.0, 0.6, 1.4, w), 1.0e-10)
+
+    def test__float32_precision__same_as_scipy_to_float32_accuracy(self):
+
+        hyp2f1 = hyp2f1_util.hyp2f1_from_values(
+            b=0.25, c=1.75, w=w, tolerance=1.0e-6, precision="float32"
+        )
+
+        assert hyp2f1.dtype == "complex64"
+        assert hyp2f1 == pytest.approx(special.hyp2f1(1.0, 0.25, 1.75, w), 1.0e-5)
+
+    def test__parameters_broadcast_against_values(self):
+
+        b = np.array([[0.5], [0.75]])
+
+        hyp2f1 = hyp2f1_util.hyp2f1_from_values(b=b, c=1.5, w=w[None, :])
+
+        assert hyp2f1.shape == (2, 5)
+        assert hyp2f1 == pytest.approx(special.hyp2f1(1.0, b, 1.5, w[None, :]), 1.0e-8)
+
+    def test__b_above_c__series_same_as_scipy_to_tolerance(self):
+
+        hyp2f1 = hyp2f1_util.hyp2f1_from_values(b=1.4, c=0.6, w=w, tolerance=1.0e-10)
+
+        assert hyp2f1 == pytest.approx(special.hyp2f1(1.0, 1.4, 0.6, w), 1.0e-8)
+
+    def test__values_outside_unit_circle__computed_with_scipy(self):
+
+        w_outside = np.array([0.3, 1.5j, -2.0 + 0.5j, 0.999999])
+
+        hyp2f1 = hyp2f1_util.hyp2f1_from_values(b=0.4, c=1.6, w=w_outside)
+
+        assert np.all(np.isfinite(hyp2f1))
+        assert hyp2f1 == pytest.approx(special.hyp2f1(1.0, 0.4, 1.6, w_outside), 1.0e-8)
+
+    def test__unsupported_engine_or_precision__raises_exception(self):
+
+        with pytest.raises(exc.ProfileException):
+            hyp2f1_util.hyp2f1_from_values(b=0.5, c=1.5, w=w, engine="mpmath")
+
+        with pytest.raises(exc.ProfileException):
+            hyp2f1_util.hyp2f1_from_values(b=0.5, c=1.5, w=w, precision="float16")
@@ -0,0 +1,87 @@
+import numpy as np
+import pytest
+
+from autoastro.util import mge_util
+
+
+class TestDecomposition:
+    def test__sum_of_gaussians_matches_sersic_convergence(self):
+
+        sigmas, amplitudes, error = mge_util.decomposition_from_sersic_index(
+            sersic_index=4.0, sersic_constant=7.66925
+        )
+
+        assert error < mge_util.enclosed_mass_tolerance
+
+        radii = np.array([0.01, 0.1, 1.0, 3.0])
+
+        convergence = np.sum(
+            amplitudes * np.exp(-0.5 * np.square(radii[:, None] / sigmas)), axis=1
+        )
+
+        assert convergence == pytest.approx(
+            np.exp(-7.66925 * (radii ** 0.25 - 1.0)), 1.0e-4
+        )
+
+    def test__decomposition_is_cached_and_read_only(self):
+
+        decomposition_0 = mge_util.decomposition_from_sersic_index(
+            sersic_index=2.0, sersic_constant=3.67206
+        )
+        decomposition_1 = mge_util.decomposition_from_sersic_index(
+            sersic_index=2.0, sersic_constant=3.67206
+        )
+
+        assert decomposition_0 is decomposition_1
+
+        with pytest.raises(ValueError):
+            decomposition_0[1][0] = 1.0
+
+    def test__steep_profiles_add_gaussians_until_the_enclosed_mass_is_accurate(self):
+
+        sigmas, amplitudes, error = mge_util.decomposition_from_sersic_index(
+            sersic_index=0.6, sersic_constant=0.8
+        )
+
+        assert len(sigmas) > mge_util.total_gaussians[0]
+        assert error < mge_util.enclosed_mass_tolerance
+
+        sigmas, amplitudes, error = mge_util.decomposition_from_sersic_index(
+            sersic_index=2.0, sersic_constant=3.67206, mass_to_light_gradient=1.5
+        )
+
+        assert error > mge_util.enclosed_mass_tolerance
+
+
+class TestDeflections:
+    def test__single_gaussian__elliptical_solution_tends_to_spherical(self):
+
+        grid = np.array([[0.3, 0.2], [-0.5, 1.0], [1.5, -0.2], [0.0, 0.0]])
+
+        deflections_spherical = mge_util.deflections_from_grid_and_gaussians(
+            grid=grid, axis_ratio=1.0, sigmas=np.array([0.5]), amplitudes=np.array([2.0])
+        )
+        deflections_elliptical = mge_util.deflections_from_grid_and_gaussians(
+            grid=grid,
+            axis_ratio=0.9999,
+            sigmas=np.array([0.5]),
+            amplitudes=np.array([2.0]),
+        )
+
+        assert deflections_spherical[3] == pytest.approx(np.array([0.0, 0.0]), 1.0e-8)
+        assert deflections_spherical[0, 0] == pytest.approx(
+            2.0 * 2.0 * 0.25 * (1.0 - np.exp(-0.13 / 0.5)) * 0.3 / 0.13, 1.0e-8
+        )
+        assert deflections_elliptical == pytest.approx(deflections_spherical, 1.0e-3)
+
+    def test__reflection_symmetry_in_y(self):
+
+        deflections = mge_util.deflections_from_grid_and_gaussians(
+            grid=np.array([[0.5, 0.3], [-0.5, 0.3]]),
+            axis_ratio=0.6,
+            sigmas=np.array([0.2, 1.0]),
+            amplitudes=np.array([1.0, 0.5]),
+        )
+
+        assert deflections[0, 0] == pytest.approx(-deflections[1, 0], 1.0e-8)
+        assert deflections[0, 1] == pytest.approx(deflections[1, 1], 1.0e-8)
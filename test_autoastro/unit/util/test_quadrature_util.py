@@ -0,0 +1,119 @@
+import numpy as np
+import pytest
+
+from autoastro.util import quadrature_util
+
+
+def integrand(u, y, x, power):
+    return (u ** power) * (y + x)
+
+
+def integrand_cusp(u, y, x):
+    return (u * (y ** 2 + x ** 2)) ** -0.5
+
+
+class TestNodesAndWeights:
+    def test__weights_sum_to_unit_interval_and_nodes_inside_interval(self):
+
+        u, weights = quadrature_util.nodes_and_weights_from_order(order=16)
+
+        assert u.shape == (16,)
+        assert np.sum(weights) == pytest.approx(1.0, 1.0e-8)
+        assert (u > 0.0).all() and (u < 1.0).all()
+
+    def test__nodes_are_cached(self):
+
+        nodes_0 = quadrature_util.nodes_and_weights_from_order(order=32)
+        nodes_1 = quadrature_util.nodes_and_weights_from_order(order=32)
+
+        assert nodes_0 is nodes_1
+
+
+class TestIntegralFromGrid:
+    def test__polynomial_integrand__exact(self):
+
+        grid = np.array([[1.0, 1.0], [2.0, 1.0], [0.5, -1.0]])
+
+        integral = quadrature_util.integral_from_grid(
+            func=integrand, grid=grid, args=(2.0,), order=8
+        )
+
+        assert integral == pytest.approx(np.array([2.0, 3.0, -0.5]) / 3.0, 1.0e-8)
+
+    def test__cusp_at_u_0__removed_by_substitution(self):
+
+        grid = np.array([[3.0, 4.0], [0.0, 1.0]])
+
+        integral = quadrature_util.integral_from_grid(
+            func=integrand_cusp, grid=grid, order=8
+        )
+
+        assert integral == pytest.approx(np.array([0.4, 2.0]), 1.0e-8)
+
+    def test__chunking_gives_same_result(self):
+
+        grid = np.random.uniform(size=(100, 2))
+
+        integral = quadrature_util.integral_from_grid(
+            func=integrand, grid=grid, args=(1.5,), order=16
+        )
+
+        max_elements_per_chunk = quadrature_util.max_elements_per_chunk
+        quadrature_util.max_elements_per_chunk = 64
+
+        integral_chunked = quadrature_util.integral_from_grid(
+            func=integrand, grid=grid, args=(1.5,), order=16
+        )
+
+        quadrature_util.max_elements_per_chunk = max_elements_per_chunk
+
+        assert integral == pytest.approx(integral_chunked, 1.0e-10)
+
+
+class TestOrderFromTolerance:
+    def test__smooth_integrand__minimum_order(self):
+
+        grid = np.array([[1.0, 1.0], [2.0, 1.0]])
+
+        order, converged = quadrature_util.order_from_tolerance(
+            func=integrand, grid=grid, args=(2.0,), tolerance=1.0e-6
+        )
+
+        assert order == quadrature_util.minimum_order
+        assert converged is True
+
+    def test__sharply_peaked_integrand__higher_order_for_lower_tolerance(self):
+        def integrand_peaked(u, y, x):
+            return np.exp(-u * (y ** 2 + x ** 2))
+
+        grid = np.array([[10.0, 10.0], [0.1, 0.1]])
+
+        order_low, _ = quadrature_util.order_from_tolerance(
+            func=integrand_peaked, grid=grid, tolerance=1.0e-2
+        )
+        order_high, _ = quadrature_util.order_from_tolerance(
+            func=integrand_peaked, grid=grid, tolerance=1.0e-8
+        )
+
+        assert order_high > order_low
+
+        integral = quadrature_util.integral_from_grid(
+            func=integrand_peaked, grid=grid, order=order_high
+        )
+
+        assert integral == pytest.approx(
+            (1.0 - np.exp(-np.array([200.0, 0.02]))) / np.array([200.0, 0.02]), 1.0e-6
+        )
+
+    def test__integrand_not_integrable_to_tolerance__maximum_order_not_converged(self):
+        def integrand_peaked(u, y, x):
+            return np.exp(-u * (y ** 2 + x ** 2))
+
+        grid = np.array([[1.0e3, 1.0e3]])
+
+        order, converged = quadrature_util.order_from_tolerance(
+            func=integrand_peaked, grid=grid, tolerance=1.0e-8
+        )
+
+        assert order == quadrature_util.maximum_order
+        assert converged is False